@@ -6,6 +6,9 @@ import com.adbtoolkit.agent.api.*
 import com.adbtoolkit.agent.security.PairingManager
 import fi.iki.elonen.NanoHTTPD
 import fi.iki.elonen.NanoHTTPD.Response
+import org.json.JSONArray
+import org.json.JSONObject
+import org.json.JSONTokener
 
 /**
  * Routes incoming HTTP requests to the appropriate API handler.
@@ -48,6 +51,15 @@ class ApiRouter(context: Context) {
         // If request carries X-Peer-Id header, validate HMAC before
         // allowing access to data APIs (but NOT pairing endpoints).
         val peerId = session.headers["x-peer-id"]
+        if (peerId != null && domain == "batch") {
+            // The signature covers only method|uri|timestamp, not the
+            // sub-calls in the body — a batch would widen its scope.
+            Log.w(TAG, "Peer batch rejected: $peerId")
+            return AgentServer.jsonError(
+                "Batch não disponível para requisições P2P",
+                Response.Status.FORBIDDEN
+            )
+        }
         if (peerId != null && domain !in listOf("ping", "peer")) {
             val validation = pairingManager.validatePeerRequest(
                 method = method.name,
@@ -82,9 +94,58 @@ class ApiRouter(context: Context) {
             "python"       -> pythonApi.handle(method, parts.drop(1), session)
             "peer"         -> peerApi.handle(method, parts.drop(1), session)
             "orchestrator" -> orchestratorApi.handle(method, parts.drop(1), session)
+            "batch"        -> batch(session)
 
             else -> AgentServer.jsonError("Unknown endpoint: $path",
                 Response.Status.NOT_FOUND)
         }
     }
+
+    // ═══════════════════════════════════════════════════════════════════
+    //  BATCH — several API calls in one HTTP round-trip
+    // ═══════════════════════════════════════════════════════════════════
+
+    /**
+     * POST /api/batch
+     * Body: { "calls": [ { "method": "GET", "endpoint": "/api/device/info",
+     *                      "params": { ... }, "body": { ... } }, ... ] }
+     *
+     * Each call is routed here in order, with the caller's credentials.
+     * Peer-authenticated callers are refused in [route]: their signature
+     * does not cover the body, so it cannot authorize the sub-calls.
+     * Returns { "results": [ { "status": 200, "data": ... }, ... ] }.
+     */
+    private fun batch(session: NanoHTTPD.IHTTPSession): Response {
+        val body = try {
+            val files = mutableMapOf<String, String>()
+            session.parseBody(files)
+            JSONObject(files["postData"] ?: "{}")
+        } catch (_: Exception) { JSONObject() }
+        val calls = body.optJSONArray("calls")
+            ?: return AgentServer.jsonError("Missing calls")
+
+        val results = JSONArray()
+        for (i in 0 until calls.length()) {
+            val sub = BatchCallSession(session, calls.optJSONObject(i) ?: JSONObject())
+            val resp = if (!sub.uri.startsWith("/api/") || sub.uri.startsWith("/api/batch")) {
+                AgentServer.jsonError("Invalid endpoint: ${sub.uri}")
+            } else {
+                try {
+                    route(sub.method, sub.uri, sub)
+                } catch (e: Exception) {
+                    Log.e(TAG, "Batch call ${sub.uri} failed", e)
+                    AgentServer.jsonResponse(Response.Status.INTERNAL_ERROR, mapOf(
+                        "error" to "internal_error",
+                        "message" to e.message
+                    ))
+                }
+            }
+            val text = resp.data?.bufferedReader()?.use { it.readText() } ?: ""
+            results.put(JSONObject().apply {
+                put("status", resp.status.requestStatus)
+                put("data", try { JSONTokener(text).nextValue() } catch (_: Exception) { text })
+            })
+        }
+        return AgentServer.jsonOk(JSONObject().put("results", results))
+    }
 }
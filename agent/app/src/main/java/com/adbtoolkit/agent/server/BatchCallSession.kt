@@ -0,0 +1,62 @@
+package com.adbtoolkit.agent.server
+
+import fi.iki.elonen.NanoHTTPD
+import org.json.JSONObject
+import java.io.ByteArrayInputStream
+import java.io.InputStream
+
+/**
+ * One entry of a `/api/batch` request presented as an HTTP session, so
+ * the regular API handlers can serve it unchanged.
+ *
+ * Method, URI, query params and JSON body come from the [call] entry;
+ * headers and remote address from the enclosing request. Peer-signed
+ * requests never reach a batch (see ApiRouter.route); any stray
+ * `x-peer-*` headers are still dropped so sub-calls cannot reuse them.
+ */
+internal class BatchCallSession(
+    private val outer: NanoHTTPD.IHTTPSession,
+    call: JSONObject,
+) : NanoHTTPD.IHTTPSession {
+
+    private val callMethod: NanoHTTPD.Method =
+        NanoHTTPD.Method.lookup(call.optString("method", "GET").uppercase())
+            ?: NanoHTTPD.Method.GET
+    private val callUri: String = call.optString("endpoint", "").substringBefore('?')
+    private val callParams: Map<String, String> =
+        call.optJSONObject("params")?.let { p ->
+            p.keys().asSequence().associateWith { p.optString(it) }
+        } ?: emptyMap()
+    private val callBody: String = call.optJSONObject("body")?.toString() ?: "{}"
+    private val callHeaders: Map<String, String> =
+        outer.headers.filterKeys { !it.startsWith("x-peer-") }
+
+    override fun execute() {}
+
+    override fun getCookies(): NanoHTTPD.CookieHandler = outer.cookies
+
+    override fun getHeaders(): Map<String, String> = callHeaders
+
+    override fun getInputStream(): InputStream =
+        ByteArrayInputStream(callBody.toByteArray(Charsets.UTF_8))
+
+    override fun getMethod(): NanoHTTPD.Method = callMethod
+
+    @Deprecated("Use getParameters()")
+    override fun getParms(): Map<String, String> = callParams
+
+    override fun getParameters(): Map<String, List<String>> =
+        callParams.mapValues { listOf(it.value) }
+
+    override fun getQueryParameterString(): String = ""
+
+    override fun getUri(): String = callUri
+
+    override fun parseBody(files: MutableMap<String, String>) {
+        files["postData"] = callBody
+    }
+
+    override fun getRemoteIpAddress(): String = outer.remoteIpAddress
+
+    override fun getRemoteHostName(): String = outer.remoteHostName
+}
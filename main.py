@@ -14,7 +14,7 @@ ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT))
 
 from src.adb_core import ADBCore
-from src.config import Config
+from src.config import get_config
 from src.log_setup import setup_logging
 
 
@@ -61,7 +61,7 @@ def main():
     setup_logging(level=level)
     log = logging.getLogger("adb_toolkit")
 
-    config = Config()
+    config = get_config()
     adb = ADBCore(ROOT)
 
     # Ensure ADB is available
@@ -120,10 +120,14 @@ def main():
         from src.utils import format_bytes
         mgr = BackupManager(adb)
 
+        errors = []
+
         def _progress(p):
             if p.items_total:
                 print(f"\r  [{p.percent:5.1f}%] {p.phase}: {p.current_item} "
                       f"({p.items_done}/{p.items_total})", end="", flush=True)
+            if p.phase == "complete":
+                errors[:] = p.errors
 
         mgr.set_progress_callback(_progress)
         print(f"Iniciando backup de {args.backup}...")
@@ -131,6 +135,8 @@ def main():
         print()
         for m in manifests:
             print(f"  ✅ {m.backup_type}: {m.backup_id} ({format_bytes(m.size_bytes)})")
+        for err in errors:
+            print(f"  ❌ {err}")
         return
 
     if args.restore:
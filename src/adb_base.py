@@ -16,6 +16,9 @@ from __future__ import annotations
 import logging
 import os
 import re
+import stat
+import subprocess
+import sys
 import threading
 import time
 from concurrent.futures import (
@@ -34,8 +37,10 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
+    Union,
 )
 
 from .adb_core import ADBCore
@@ -104,17 +109,18 @@ def _sanitize_local_rel(remote_path: str, strip_prefix: str = "/") -> str:
     return "/".join(safe_parts)
 
 
-def _long_path_str(path: Path) -> str:
+def _long_path_str(path: Union[str, Path]) -> str:
     """Return a string representation that supports long paths on Windows.
 
     On Windows, paths longer than 259 characters get the ``\\\\?\\``
     prefix so that the OS API accepts them.  On other platforms, returns
-    ``str(path)`` unchanged.
+    ``os.fspath(path)`` unchanged.  Accepts plain strings so hot loops can
+    skip building ``Path`` objects.
     """
-    s = str(path)
+    s = os.fspath(path)
     if os.name == 'nt' and len(s) > 259 and not s.startswith('\\\\?\\'):
-        # resolve() gives an absolute path which is required for \\?\ prefix
-        return '\\\\?\\' + str(path.resolve())
+        # An absolute path is required for the \\?\ prefix
+        return '\\\\?\\' + os.path.abspath(s)
     return s
 
 
@@ -128,6 +134,42 @@ def _shell_quote(s: str) -> str:
     return "'" + s.replace("'", "'\\''") + "'"
 
 
+def _local_tree_stats(root: Path) -> Tuple[int, int]:
+    """Return ``(file_count, total_bytes)`` for the local tree under *root*.
+
+    Iterative ``os.scandir`` walk: directory entries come from a single
+    ``getdents`` per directory and each file is ``stat``-ed exactly once.
+    """
+    count = 0
+    total = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                        count += 1
+                except OSError:
+                    pass
+    return count, total
+
+
+def _same_size_exists(path: Union[str, Path], size: int) -> bool:
+    """True if *path* is a local file of exactly *size* bytes (one stat)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_size == size and stat.S_ISREG(st.st_mode)
+
+
 def _save_path_mapping(dest_root: Path, mapping: Dict[str, str]) -> None:
     """Persist the *sanitized-local-rel → original-remote* mapping to JSON.
 
@@ -282,6 +324,46 @@ THUMBNAIL_DUMP_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+# Directory names pruned on the device by ``find`` so filtered subtrees are
+# never walked or stat'ed.  The regexes above remain the authoritative
+# filter; these only cover the directory-component cases.
+_CACHE_PRUNE_NAMES = ("*cache*", "*preload*", "tmp", "temp")
+_THUMBNAIL_PRUNE_NAMES = (
+    ".thumbnails", ".thumbs", "thumbs", "thumbnails", "thumbnail",
+    ".thumb", "dump", ".dump", ".trashbin", ".trash", "LOST.DIR",
+)
+
+
+def _find_prune_expr(names: Iterable[str]) -> str:
+    """``find`` clause that prunes directories matching any of *names*."""
+    tests = " -o ".join(f"-iname {_shell_quote(n)}" for n in names)
+    return f"\\( -type d \\( {tests} \\) \\) -prune -o"
+
+
+# Device serial → whether its ``find`` supports -printf (probed once)
+_find_printf_support: Dict[str, bool] = {}
+
+
+def _supports_find_printf(adb: ADBCore, serial: str) -> bool:
+    """Whether the device's ``find`` understands ``-printf`` with ``%s``
+    and ``%T@`` (cached per serial)."""
+    ok = _find_printf_support.get(serial)
+    if ok is None:
+        try:
+            out = adb.run_shell(
+                "find / -maxdepth 0 -printf '%s|%T@\\n' 2>/dev/null",
+                serial, timeout=15,
+            )
+            ok = re.fullmatch(r"\d+\|\d+(\.\d+)?", out.strip()) is not None
+        except Exception:
+            ok = False
+        _find_printf_support[serial] = ok
+    return ok
+
+
+# ``slots=True`` needs Python 3.10; on 3.9 the classes keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # ---------------------------------------------------------------------------
 # Unified progress dataclass
@@ -337,7 +419,15 @@ class ADBManagerBase:
         self._confirmation_dismiss_cb: Optional[Callable[[], None]] = None
         self._start_time: Optional[float] = None
         self._errors: List[str] = []
+        # Last percent emitted per phase (polled progress keeps it)
+        self._last_percent: Dict[str, float] = {}
         self._accelerator: Optional[TransferAccelerator] = None
+        # Coalesced progress delivery (see _emit)
+        self._pending: Dict[str, OperationProgress] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._deliver_lock = threading.RLock()
+        self._drain_thread: Optional[threading.Thread] = None
 
     # -- accelerator (lazy) ---------------------------------------------------
     @property
@@ -405,6 +495,7 @@ class ADBManagerBase:
         self._cancel_flag.clear()
         self._start_time = time.time()
         self._errors.clear()
+        self._last_percent.clear()
 
     # -- device confirmation helpers ------------------------------------------
     def _request_device_confirmation(self, title: str, message: str) -> None:
@@ -435,20 +526,73 @@ class ADBManagerBase:
         title: str,
         message: str,
         timeout: int = 7200,
+        watch_file: Optional[Path] = None,
+        phase: str = "",
     ):
         """Run an ADB command that requires device-side user confirmation.
 
         Shows the confirmation overlay before executing, waits for the
         command to finish (up to *timeout* seconds), then dismisses the
         overlay.  Returns the ``CompletedProcess`` result.
+
+        When *watch_file* is given (the ``-f`` target of ``adb backup``),
+        the command is polled instead of awaited: the growing file size
+        is emitted as *phase* progress every couple of seconds and the
+        process is killed if the operation is cancelled.
         """
         self._request_device_confirmation(title, message)
         try:
-            result = self.adb.run(args, serial=serial, timeout=timeout)
+            if watch_file is None:
+                result = self.adb.run(args, serial=serial, timeout=timeout)
+            else:
+                result = self._run_polling(args, serial, watch_file, phase, timeout)
         finally:
             self._dismiss_device_confirmation()
         return result
 
+    _POLL_INTERVAL = 2.0  # seconds between progress polls of a running command
+
+    def _run_polling(
+        self,
+        args: List[str],
+        serial: str,
+        watch_file: Path,
+        phase: str,
+        timeout: int,
+    ) -> subprocess.CompletedProcess:
+        """Run *args* while emitting the size of *watch_file* as progress.
+
+        The updates keep the last percent the caller emitted for *phase*
+        so the bar does not drop back to 0 while the file grows.
+        """
+        percent = self._last_percent.get(phase, 0.0)
+        proc = self.adb.popen(args, serial=serial)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                out, err = proc.communicate(timeout=self._POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                if self._is_cancelled() or time.monotonic() > deadline:
+                    proc.kill()
+                    out, err = proc.communicate()
+                    if not self._is_cancelled():
+                        raise subprocess.TimeoutExpired(proc.args, timeout)
+                    break
+                try:
+                    size = watch_file.stat().st_size
+                except OSError:
+                    size = 0
+                self._emit(OperationProgress(
+                    phase=phase,
+                    current_item=watch_file.name,
+                    bytes_done=size,
+                    percent=percent,
+                ))
+        if proc.returncode != 0:
+            log.warning("ADB returned %d: %s", proc.returncode, (err or "").strip())
+        return subprocess.CompletedProcess(proc.args, proc.returncode, out or "", err or "")
+
     def _emit(self, progress: OperationProgress):
         """Send *progress* to the registered callback.
 
@@ -462,15 +606,66 @@ class ADBManagerBase:
                 elapsed = progress.elapsed_seconds
                 remaining_pct = 100.0 - progress.percent
                 progress.eta_seconds = elapsed / progress.percent * remaining_pct
+        self._last_percent[progress.phase] = progress.percent
         # Attach accumulated errors
         if self._errors and not progress.errors:
             progress.errors = list(self._errors)
-        if self._progress_cb:
+        if not self._progress_cb:
+            return
+        if progress.phase in self._TERMINAL_PHASES:
+            # Final state: flush what is queued, then deliver in order
+            with self._deliver_lock:
+                self._drain_pending()
+                self._deliver(progress)
+            return
+        # Intermediate updates are coalesced (latest per phase) and handed
+        # to the callback by a drain thread, off the worker's hot path.
+        with self._pending_lock:
+            self._pending.pop(progress.phase, None)
+            self._pending[progress.phase] = progress
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(
+                    target=self._drain_loop, name="progress-drain", daemon=True,
+                )
+                self._drain_thread.start()
+        self._pending_event.set()
+
+    _TERMINAL_PHASES = frozenset({"complete", "error", "cancelled"})
+    _PROGRESS_INTERVAL = 0.1  # seconds between coalesced deliveries
+    _DRAIN_IDLE_EXIT = 5.0    # drain thread exits after this long idle
+
+    def _deliver(self, progress: OperationProgress) -> None:
+        cb = self._progress_cb
+        if cb is None:
+            return
+        with self._deliver_lock:
             try:
-                self._progress_cb(progress)
+                cb(progress)
             except Exception:
                 pass
 
+    def _drain_pending(self) -> None:
+        # Snapshot + delivery under the delivery lock so a terminal event
+        # can never be overtaken by an older, already-dequeued update.
+        with self._deliver_lock:
+            with self._pending_lock:
+                batch = list(self._pending.values())
+                self._pending.clear()
+            for progress in batch:
+                self._deliver(progress)
+
+    def _drain_loop(self) -> None:
+        while True:
+            if not self._pending_event.wait(self._DRAIN_IDLE_EXIT):
+                with self._pending_lock:
+                    if not self._pending:
+                        self._drain_thread = None
+                        return
+                continue
+            self._pending_event.clear()
+            self._drain_pending()
+            time.sleep(self._PROGRESS_INTERVAL)
+
     # -- shared ADB helpers ---------------------------------------------------
     def list_remote_files(
         self,
@@ -483,8 +678,10 @@ class ADBManagerBase:
     ) -> List[Tuple[str, int]]:
         """List files on the device under *paths*.
 
-        Runs ``find … | xargs stat -c '%n|%s'`` and parses the output.
-        Optionally applies cache / thumbnail filters.
+        Runs one ``find`` per root, printing ``size<TAB>path`` via
+        ``-printf`` (or ``-exec stat`` where unsupported) and parses the
+        output.  Filtered directories are pruned on the device; the cache /
+        thumbnail regexes are still applied to every path.
 
         Returns a list of ``(remote_path, size_bytes)`` tuples.
         """
@@ -493,36 +690,237 @@ class ADBManagerBase:
             if self._is_cancelled():
                 break
             try:
-                # Use -exec instead of | xargs to handle filenames with
-                # spaces, quotes and other special characters safely.
-                cmd = (
-                    f'find {_shell_quote(rpath)} -type f'
-                    f" -exec stat -c '%n|%s' {{}} + 2>/dev/null"
+                out = self.adb.run_shell(
+                    self._find_files_cmd(
+                        serial, _shell_quote(rpath), ignore_cache, ignore_thumbnails,
+                    ),
+                    serial, timeout=timeout,
                 )
-                out = self.adb.run_shell(cmd, serial, timeout=timeout)
-                for line in out.splitlines():
-                    line = line.strip()
-                    if "|" not in line:
-                        continue
-                    parts = line.rsplit("|", 1)
-                    if len(parts) != 2:
-                        continue
-                    path_str = parts[0]
-                    try:
-                        size = int(parts[1])
-                    except ValueError:
-                        size = 0
+                files.extend(
+                    self._parse_find_output(out, ignore_cache, ignore_thumbnails)
+                )
+            except Exception as exc:
+                log.warning("Error listing files in %s: %s", rpath, exc)
+        return files
 
-                    if ignore_cache and CACHE_PATTERNS.search(path_str):
-                        continue
-                    if ignore_thumbnails and THUMBNAIL_DUMP_PATTERNS.search(path_str):
-                        continue
+    _LIST_END = "__END__"  # printed after find so a cut listing is detected
+
+    def list_remote_files_by_root(
+        self,
+        serial: str,
+        roots: List[str],
+        *,
+        ignore_cache: bool = False,
+        ignore_thumbnails: bool = False,
+        timeout: int = 180,
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """Like :meth:`list_remote_files`, but one ``find`` for many roots.
+
+        All roots are passed as start points of a single ``find`` (split
+        only when the argument limit requires it) and each file is
+        assigned to the deepest root containing it.
 
-                    files.append((path_str, size))
+        Returns ``{root: [(remote_path, size_bytes), …]}`` keyed by the
+        ``rstrip("/")``-normalized roots; roots whose ``find`` failed,
+        timed out (no end marker in the output) or was skipped by a
+        cancel are absent.
+        """
+        roots = list(dict.fromkeys(r.rstrip("/") or "/" for r in roots))
+        result: Dict[str, List[Tuple[str, int]]] = {r: [] for r in roots}
+        by_depth = sorted(roots, key=len, reverse=True)
+        seen: Set[str] = set()  # nested roots make find print a file twice
+
+        batch: List[str] = []
+        size = 0
+        for i, root in enumerate(roots):
+            batch.append(root)
+            size += len(root) + 3
+            if size < self._PROBE_CMD_CHARS and i < len(roots) - 1:
+                continue
+            if self._is_cancelled():
+                for r in roots[i - len(batch) + 1:]:
+                    result.pop(r, None)
+                break
+            try:
+                out = self.adb.run_shell(
+                    self._find_files_cmd(
+                        serial, " ".join(_shell_quote(r) for r in batch),
+                        ignore_cache, ignore_thumbnails,
+                    ) + f"; echo {self._LIST_END}",
+                    serial, timeout=timeout,
+                )
+                # run_shell returns "" (or a cut stream) on error/timeout
+                if not out.rstrip().endswith(self._LIST_END):
+                    log.warning(
+                        "Listing of %d root(s) incomplete; falling back per root",
+                        len(batch),
+                    )
+                    for r in batch:
+                        result.pop(r, None)
+                    batch = []
+                    size = 0
+                    continue
+                for path_str, fsize in self._parse_find_output(
+                    out, ignore_cache, ignore_thumbnails,
+                ):
+                    if path_str in seen:
+                        continue
+                    seen.add(path_str)
+                    for root in by_depth:
+                        if path_str.startswith(root) and (
+                            len(path_str) == len(root)
+                            or path_str[len(root)] == "/"
+                            or root == "/"
+                        ):
+                            result[root].append((path_str, fsize))
+                            break
             except Exception as exc:
-                log.warning("Error listing files in %s: %s", rpath, exc)
+                log.warning("Error listing files in %d root(s): %s", len(batch), exc)
+                for r in batch:
+                    result.pop(r, None)
+            batch = []
+            size = 0
+        return result
+
+    def _find_files_cmd(
+        self,
+        serial: str,
+        quoted_roots: str,
+        ignore_cache: bool,
+        ignore_thumbnails: bool,
+    ) -> str:
+        """``find`` command printing ``size<TAB>path`` for regular files."""
+        prune = ""
+        if ignore_cache:
+            prune += _find_prune_expr(_CACHE_PRUNE_NAMES) + " "
+        if ignore_thumbnails:
+            prune += _find_prune_expr(_THUMBNAIL_PRUNE_NAMES) + " "
+        if _supports_find_printf(self.adb, serial):
+            action = "-type f -printf '%s\\t%p\\n'"
+        else:
+            # -exec instead of | xargs: safe with spaces, quotes, etc.
+            action = "-type f -exec stat -c '%s\t%n' {} +"
+        return f"find {quoted_roots} {prune}{action} 2>/dev/null"
+
+    @staticmethod
+    def _parse_find_output(
+        out: str,
+        ignore_cache: bool,
+        ignore_thumbnails: bool,
+    ) -> List[Tuple[str, int]]:
+        """Parse ``size<TAB>path`` lines, applying the path filters."""
+        files: List[Tuple[str, int]] = []
+        for line in out.splitlines():
+            size_str, sep, path_str = line.rstrip("\r").partition("\t")
+            if not sep or not path_str:
+                continue
+            try:
+                size = int(size_str)
+            except ValueError:
+                size = 0
+
+            if ignore_cache and CACHE_PATTERNS.search(path_str):
+                continue
+            if ignore_thumbnails and THUMBNAIL_DUMP_PATTERNS.search(path_str):
+                continue
+
+            files.append((path_str, size))
         return files
 
+    # -- batched shell probes --
+    _PROBE_CMD_CHARS = 3000  # stay well under adb's shell argument limit
+
+    # Loop bodies for _shell_for_each (``$p`` is the current path); built
+    # once here instead of per call.
+    _PROBE_DIR_BODY = '[ -d "$p" ] && printf "%s\\n" "$p"'
+    _PM_PATH_BODY = 'printf "@%s\\n" "$p"; pm path "$p" 2>/dev/null'
+    # stat prints the file line itself — no ``$(…)`` subshell per path
+    _STAT_PATH_BODY = (
+        'if [ -d "$p" ]; then printf "D|%s\\n" "$p"; '
+        "else stat -c 'F|%s|%n' \"$p\" 2>/dev/null || printf \"F|0|%s\\n\" \"$p\"; fi"
+    )
+
+    def _shell_for_each(
+        self,
+        serial: str,
+        paths: List[str],
+        body: str,
+        timeout: int = 30,
+    ) -> List[str]:
+        """Run ``for p in <paths>; do <body>; done`` on the device.
+
+        *paths* are shell-quoted and split across as few ``adb shell``
+        calls as the argument limit allows (one for typical inputs).
+        Returns the non-empty output lines.
+        """
+        lines: List[str] = []
+        batch: List[str] = []
+        size = 0
+        quoted = [_shell_quote(p) for p in paths]
+        for i, q in enumerate(quoted):
+            batch.append(q)
+            size += len(q) + 1
+            if size < self._PROBE_CMD_CHARS and i < len(quoted) - 1:
+                continue
+            out = self.adb.run_shell(
+                f"for p in {' '.join(batch)}; do {body}; done",
+                serial, timeout=timeout,
+            )
+            lines.extend(l.rstrip("\r") for l in out.splitlines() if l.strip())
+            batch = []
+            size = 0
+        return lines
+
+    def probe_dirs(self, serial: str, paths: List[str]) -> Set[str]:
+        """Return the subset of *paths* that are directories on the device."""
+        if not paths:
+            return set()
+        return set(self._shell_for_each(
+            serial, paths, self._PROBE_DIR_BODY,
+        ))
+
+    def apk_paths(self, serial: str, packages: List[str]) -> Dict[str, List[str]]:
+        """``pm path`` for many packages in one round-trip.
+
+        Returns ``{package: [apk paths]}`` (base + splits); packages that
+        are not installed are absent.
+        """
+        result: Dict[str, List[str]] = {}
+        if not packages:
+            return result
+        current: Optional[List[str]] = None
+        for line in self._shell_for_each(
+            serial, packages, self._PM_PATH_BODY,
+            timeout=120,
+        ):
+            line = line.strip()
+            if line.startswith("@"):
+                current = result.setdefault(line[1:], [])
+            elif line.startswith("package:") and current is not None:
+                current.append(line[8:])
+        return {pkg: paths for pkg, paths in result.items() if paths}
+
+    def stat_paths(self, serial: str, paths: List[str]) -> Dict[str, Optional[int]]:
+        """Classify *paths* in one round-trip.
+
+        Returns ``{path: None}`` for directories and ``{path: size}`` for
+        anything else (0 when the size cannot be read).
+        """
+        result: Dict[str, Optional[int]] = {}
+        if not paths:
+            return result
+        for line in self._shell_for_each(serial, paths, self._STAT_PATH_BODY):
+            kind, _, rest = line.partition("|")
+            if kind == "D":
+                result[rest] = None
+            elif kind == "F":
+                sz, _, path = rest.partition("|")
+                try:
+                    result[path] = int(sz)
+                except ValueError:
+                    result[path] = 0
+        return result
+
     def pull_with_progress(
         self,
         serial: str,
@@ -563,6 +961,9 @@ class ADBManagerBase:
         total_bytes = sum(s for _, s in file_list)
         pct_lo, pct_hi = pct_range
         pct_span = pct_hi - pct_lo
+        # Re-run into an existing folder: files already present with the
+        # same size are kept instead of pulled again.
+        skip_existing = dest_root.is_dir()
 
         # --- determine parallelism ---
         avg_size = total_bytes // max(total_files, 1)
@@ -576,6 +977,7 @@ class ADBManagerBase:
                 serial, file_list, dest_root,
                 phase=phase, sub_phase=sub_phase,
                 strip_prefix=strip_prefix, pct_range=pct_range,
+                skip_existing=skip_existing,
             )
 
         log.info(
@@ -584,19 +986,27 @@ class ADBManagerBase:
         )
 
         # Pre-create local directories (with sanitized names)
+        # Plain strings: no Path object / __fspath__ round-trip per file
+        dest_str = os.fspath(dest_root)
         _path_mapping: Dict[str, str] = {}  # sanitized_rel → original_remote
-        _local_map: Dict[str, Path] = {}     # remote_path → sanitized local Path
+        _local_map: Dict[str, str] = {}      # remote_path → sanitized local path
+        made_dirs: Set[str] = set()
         for remote_path, _ in file_list:
             safe_rel = _sanitize_local_rel(remote_path, strip_prefix)
             orig_rel = remote_path.lstrip(strip_prefix).lstrip("/")
             if safe_rel != orig_rel:
                 _path_mapping[safe_rel] = remote_path
-            local_path = dest_root / safe_rel.replace("/", os.sep)
+            local_path = _long_path_str(
+                os.path.join(dest_str, safe_rel.replace("/", os.sep))
+            )
             _local_map[remote_path] = local_path
-            local_path.parent.mkdir(parents=True, exist_ok=True)
+            parent = os.path.dirname(local_path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
 
         _lock = threading.Lock()
-        counters = {"ok": 0, "bytes": 0, "items": 0}
+        counters = {"ok": 0, "ok_bytes": 0, "bytes": 0, "items": 0}
 
         def _pull_one(remote_path: str, fsize: int) -> None:
             if self._is_cancelled():
@@ -604,8 +1014,14 @@ class ADBManagerBase:
             local_path = _local_map[remote_path]
             ok = False
             try:
-                self.adb.pull(remote_path, _long_path_str(local_path), serial)
-                ok = True
+                ok = (
+                    skip_existing and _same_size_exists(local_path, fsize)
+                ) or self.adb.pull(remote_path, local_path, serial)
+                if not ok:
+                    with _lock:
+                        self._errors.append(
+                            f"Pull falhou: {os.path.basename(remote_path)}"
+                        )
             except Exception as exc:
                 log.warning("Pull failed: %s — %s", remote_path, exc)
                 with _lock:
@@ -615,6 +1031,7 @@ class ADBManagerBase:
             with _lock:
                 if ok:
                     counters["ok"] += 1
+                    counters["ok_bytes"] += fsize
                 counters["bytes"] += fsize
                 counters["items"] += 1
                 pct = pct_lo + (
@@ -638,7 +1055,7 @@ class ADBManagerBase:
         # Persist mapping so restore can recover original remote paths
         _save_path_mapping(dest_root, _path_mapping)
 
-        return counters["ok"], counters["bytes"]
+        return counters["ok"], counters["ok_bytes"]
 
     # -- sequential fallback for pull --
     def _pull_sequential(
@@ -651,6 +1068,7 @@ class ADBManagerBase:
         sub_phase: str = "",
         strip_prefix: str = "/",
         pct_range: Tuple[float, float] = (0.0, 100.0),
+        skip_existing: bool = False,
     ) -> Tuple[int, int]:
         """Sequential pull — used when parallelism is unnecessary."""
         total_files = len(file_list)
@@ -660,7 +1078,10 @@ class ADBManagerBase:
 
         success_count = 0
         bytes_done = 0
+        bytes_ok = 0
         _path_mapping: Dict[str, str] = {}  # sanitized_rel → original_remote
+        dest_str = os.fspath(dest_root)
+        made_dirs: Set[str] = set()
 
         for idx, (remote_path, fsize) in enumerate(file_list):
             if self._is_cancelled():
@@ -670,12 +1091,22 @@ class ADBManagerBase:
             orig_rel = remote_path.lstrip(strip_prefix).lstrip("/")
             if safe_rel != orig_rel:
                 _path_mapping[safe_rel] = remote_path
-            local_path = dest_root / safe_rel.replace("/", os.sep)
-            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path = _long_path_str(
+                os.path.join(dest_str, safe_rel.replace("/", os.sep))
+            )
+            parent = os.path.dirname(local_path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
 
             try:
-                self.adb.pull(remote_path, _long_path_str(local_path), serial)
-                success_count += 1
+                if (
+                    skip_existing and _same_size_exists(local_path, fsize)
+                ) or self.adb.pull(remote_path, local_path, serial):
+                    success_count += 1
+                    bytes_ok += fsize
+                else:
+                    self._errors.append(f"Pull falhou: {os.path.basename(remote_path)}")
             except Exception as exc:
                 log.warning("Pull failed: %s — %s", remote_path, exc)
                 self._errors.append(f"Pull falhou: {os.path.basename(remote_path)}")
@@ -695,7 +1126,177 @@ class ADBManagerBase:
             ))
 
         _save_path_mapping(dest_root, _path_mapping)
-        return success_count, bytes_done
+        return success_count, bytes_ok
+
+    # -- bulk directory pull --
+    _BULK_PULL_BATCH = 100  # max sources per multi-source ``adb pull``
+
+    def pull_directories(
+        self,
+        serial: str,
+        roots: List[str],
+        dest_root: Path,
+        *,
+        ignore_cache: bool = False,
+        ignore_thumbnails: bool = False,
+        phase: str = "copying",
+        sub_phase: str = "",
+        pct_range: Tuple[float, float] = (0.0, 100.0),
+        list_timeout: int = 180,
+        listings: Optional[Dict[str, List[Tuple[str, int]]]] = None,
+    ) -> Tuple[int, int]:
+        """Pull whole remote directory trees with one ``adb pull`` per root.
+
+        Each root is listed first, then:
+
+        * if the cache / thumbnail filters exclude nothing and no name
+          needs sanitizing, the root is streamed with
+          :meth:`ADBCore.pull_tar` (``adb pull <root>`` when the device
+          has no ``tar``); files missing afterwards (short stream,
+          unreadable on the device) are re-fetched with ``pull_many``;
+        * otherwise the kept files go through :meth:`ADBCore.pull_many`:
+          per-directory batches (``adb pull f1 f2 … <dir>``), with only
+          the renamed files pulled one by one.
+
+        *listings* may carry unfiltered listings already fetched with
+        :meth:`list_remote_files_by_root`; roots found there are not
+        listed again.
+
+        The local layout (and ``_path_mapping.json``) matches
+        :meth:`pull_with_progress` with ``strip_prefix="/"``.  Counts are
+        taken from the local tree after the pull.
+
+        Returns
+        -------
+        ``(success_count, total_bytes_pulled)``
+        """
+        pct_lo, pct_hi = pct_range
+        step = (pct_hi - pct_lo) / max(len(roots), 1)
+        ok_total = 0
+        bytes_total = 0
+        path_mapping: Dict[str, str] = {}
+        dest_str = os.fspath(dest_root)
+
+        for idx, root in enumerate(roots):
+            if self._is_cancelled():
+                break
+            root = root.rstrip("/") or "/"
+            lo = pct_lo + idx * step
+            hi = lo + step
+
+            if listings is not None and root in listings:
+                listing = listings[root]
+            else:
+                listing = self.list_remote_files(serial, [root], timeout=list_timeout)
+            kept = [
+                (p, s) for p, s in listing
+                if not (ignore_cache and CACHE_PATTERNS.search(p))
+                and not (ignore_thumbnails and THUMBNAIL_DUMP_PATTERNS.search(p))
+            ]
+            if not kept:
+                continue
+
+            renamed = False
+            pairs: List[Tuple[str, str]] = []
+            for p, _ in kept:
+                safe_rel = _sanitize_local_rel(p)
+                if safe_rel != p.lstrip("/"):
+                    path_mapping[safe_rel] = p
+                    renamed = True
+                pairs.append((p, _long_path_str(
+                    os.path.join(dest_str, safe_rel.replace("/", os.sep))
+                )))
+
+            root_bytes = sum(s for _, s in kept)
+            # Worst case ~1 MB/s over USB 2.0, never below the adb default
+            timeout = max(600, root_bytes >> 20)
+            local_root = dest_root / _sanitize_local_rel(root).replace("/", os.sep)
+            self._emit(OperationProgress(
+                phase=phase,
+                sub_phase=sub_phase,
+                current_item=root,
+                items_total=len(kept),
+                bytes_total=root_bytes,
+                percent=lo,
+            ))
+
+            try:
+                if (
+                    not renamed
+                    and len(kept) == len(listing)
+                    and not local_root.exists()
+                ):
+                    local_root.parent.mkdir(parents=True, exist_ok=True)
+                    # Small files: one tar stream beats per-file sync I/O
+                    streamed = self.adb.pull_tar(
+                        root, _long_path_str(local_root.parent), serial,
+                        timeout=timeout,
+                    )
+                    if streamed is None:
+                        complete = self.adb.pull(
+                            root, _long_path_str(local_root.parent), serial,
+                            timeout=timeout,
+                        )
+                    else:
+                        # exec-out has no exit status and device tar skips
+                        # unreadable files: trust only a full count
+                        complete = streamed == (len(kept), root_bytes)
+                    if not complete:
+                        missing = [
+                            (p, local) for (p, local), (_, fsize) in zip(pairs, kept)
+                            if not _same_size_exists(local, fsize)
+                        ]
+                        if missing:
+                            log.debug(
+                                "Bulk pull of %s incomplete: %d file(s) missing",
+                                root, len(missing),
+                            )
+                        failed = self.adb.pull_many(
+                            missing, serial, timeout=timeout,
+                            batch=self._BULK_PULL_BATCH,
+                            should_stop=self._is_cancelled,
+                        )
+                        for remote, _ in failed:
+                            self._errors.append(
+                                f"Pull falhou: {os.path.basename(remote)}"
+                            )
+                else:
+                    if local_root.exists():
+                        # Resumed / repeated run: keep same-size copies
+                        pairs = [
+                            (p, local) for (p, local), (_, fsize) in zip(pairs, kept)
+                            if not _same_size_exists(local, fsize)
+                        ]
+                    failed = self.adb.pull_many(
+                        pairs, serial, timeout=timeout,
+                        batch=self._BULK_PULL_BATCH,
+                        should_stop=self._is_cancelled,
+                    )
+                    for remote, _ in failed:
+                        self._errors.append(
+                            f"Pull falhou: {os.path.basename(remote)}"
+                        )
+            except Exception as exc:
+                log.warning("Bulk pull failed: %s — %s", root, exc)
+                self._errors.append(f"Pull falhou: {root}")
+
+            count, nbytes = _local_tree_stats(local_root)
+            ok_total += count
+            bytes_total += nbytes
+            self._emit(OperationProgress(
+                phase=phase,
+                sub_phase=sub_phase,
+                current_item=root,
+                items_done=count,
+                items_total=len(kept),
+                bytes_done=nbytes,
+                bytes_total=root_bytes,
+                percent=hi,
+            ))
+
+        # Persist mapping so restore can recover original remote paths
+        _save_path_mapping(dest_root, path_mapping)
+        return ok_total, bytes_total
 
     def push_with_progress(
         self,
@@ -9,13 +9,16 @@ Handles all direct communication with ADB binary:
 import subprocess
 import shutil
 import os
+import queue
 import re
 import time
 import logging
+import tarfile
 import zipfile
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Callable, Tuple
+from typing import Optional, List, Dict, Callable, Iterator, Tuple
 
 log = logging.getLogger("adb_toolkit.core")
 
@@ -47,6 +50,19 @@ def _find_adb_in_local(base_dir: Path) -> Optional[str]:
     return None
 
 
+def _sh_quote(s: str) -> str:
+    """Single-quote *s* for the device shell."""
+    return "'" + s.replace("'", "'\\''") + "'"
+
+
+def _pick_base_apk(paths: List[str]) -> Optional[str]:
+    """Return the base APK among ``pm path`` results (first path otherwise)."""
+    for path in paths:
+        if "base.apk" in path or "split" not in path:
+            return path
+    return paths[0] if paths else None
+
+
 # ---------------------------------------------------------------------------
 # ADB Device Info
 # ---------------------------------------------------------------------------
@@ -102,6 +118,93 @@ def _fmt_bytes(size: int) -> str:
     return f"{size:.1f} PB"
 
 
+# ---------------------------------------------------------------------------
+# Persistent shell session
+# ---------------------------------------------------------------------------
+class PersistentShell:
+    """A long-lived ``adb shell`` process fed commands through stdin.
+
+    Each command is followed by a unique sentinel line; output is read
+    until the sentinel appears.  This skips the process spawn + adbd
+    handshake that every one-shot ``adb shell <cmd>`` pays.  Commands are
+    serialized by an internal lock.  Once the session dies (EOF, broken
+    pipe or timeout) it stays closed and :meth:`cmd` raises.
+    """
+
+    def __init__(self, adb_path: str, serial: str):
+        self.serial = serial
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._proc = subprocess.Popen(
+            [adb_path, "-s", serial, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+        self.alive = True
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _read_loop(self):
+        for line in self._proc.stdout:  # type: ignore[union-attr]
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def cmd(self, shell_cmd: str, timeout: int = 60) -> str:
+        """Run *shell_cmd* in the session and return its stripped stdout.
+
+        Raises ``subprocess.TimeoutExpired`` on timeout and
+        ``RuntimeError`` if the session is (or becomes) unusable.
+        """
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("adb shell session is closed")
+            self._seq += 1
+            sentinel = f"__ADBTK_END_{self._seq}__"
+            try:
+                # stdin from /dev/null: a command that reads stdin must not
+                # swallow the sentinel line that follows it
+                self._proc.stdin.write(  # type: ignore[union-attr]
+                    f"{{ {shell_cmd}\n}} </dev/null\nprintf '\\n%s\\n' {sentinel}\n"
+                )
+                self._proc.stdin.flush()  # type: ignore[union-attr]
+            except OSError as exc:
+                self.close()
+                raise RuntimeError(f"adb shell session broken: {exc}") from exc
+
+            out: List[str] = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0.001))
+                except queue.Empty:
+                    self.close()
+                    raise subprocess.TimeoutExpired(shell_cmd, timeout)
+                if line is None:
+                    self.close()
+                    raise RuntimeError("adb shell session ended")
+                if line.rstrip("\r\n") == sentinel:
+                    break
+                out.append(line)
+            return "".join(out).replace("\r\n", "\n").strip()
+
+    def close(self):
+        self.alive = False
+        try:
+            self._proc.stdin.close()  # type: ignore[union-attr]
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
 # ---------------------------------------------------------------------------
 # ADB Core
 # ---------------------------------------------------------------------------
@@ -116,6 +219,8 @@ class ADBCore:
         self._monitor_running = False
         self._device_callbacks: List[Callable] = []
         self._known_devices: Dict[str, DeviceInfo] = {}
+        # Per-thread {serial: [session, refs]} opened by persistent_shell()
+        self._shells_local = threading.local()
 
     # ------------------------------------------------------------------
     # ADB binary management
@@ -204,6 +309,45 @@ class ADBCore:
             log.warning("ADB returned %d: %s", result.returncode, result.stderr.strip())
         return result
 
+    def popen(
+        self,
+        args: List[str],
+        serial: Optional[str] = None,
+        binary: bool = False,
+    ) -> subprocess.Popen:
+        """Start an ADB command without waiting for it to finish.
+
+        The caller owns the returned process (``communicate`` / ``kill``).
+        Unlike :meth:`run`, this does not hold the command lock, so
+        long-running commands (``adb backup``) can be polled.  With
+        *binary*, stdout is a raw byte stream and stderr is discarded.
+        """
+        if not self.adb_path:
+            raise RuntimeError("ADB binary not configured. Call ensure_adb() first.")
+
+        cmd = [self.adb_path]
+        if serial:
+            cmd += ["-s", serial]
+        cmd += args
+
+        log.debug("Starting: %s", " ".join(cmd))
+        if binary:
+            return subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+        return subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+
     def run_cmd(self, args: List[str], timeout: int = 120) -> str:
         """Run a raw ADB command and return stdout as a string.
 
@@ -215,7 +359,22 @@ class ADBCore:
         return (r.stdout or "").strip()
 
     def run_shell(self, shell_cmd: str, serial: Optional[str] = None, timeout: int = 60) -> str:
-        """Run `adb shell <cmd>` and return stdout."""
+        """Run `adb shell <cmd>` and return stdout.
+
+        Inside a :meth:`persistent_shell` block for *serial* opened by the
+        calling thread, the command goes through that session; other
+        threads (and a session that has died) use a one-shot ``adb shell``.
+        """
+        entry = self._thread_shells().get(serial) if serial else None
+        session = entry[0] if entry else None
+        if session is not None and session.alive:
+            try:
+                return session.cmd(shell_cmd, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                log.warning("Shell command timed out after %ds: %s", timeout, shell_cmd[:120])
+                return ""
+            except RuntimeError as exc:
+                log.debug("Persistent shell unavailable, using one-shot: %s", exc)
         try:
             r = self.run(["shell", shell_cmd], serial=serial, timeout=timeout)
             return (r.stdout or "").strip()
@@ -226,6 +385,117 @@ class ADBCore:
             log.warning("Shell command error: %s", exc)
             return ""
 
+    def run_shell_stdin(
+        self,
+        shell_cmd: str,
+        data: bytes,
+        serial: Optional[str] = None,
+        timeout: int = 60,
+    ) -> str:
+        """Run ``adb shell <cmd>`` with *data* fed to its stdin; return stdout.
+
+        Lets bulk input (file lists) bypass the command-line length limit.
+        Needs the shell protocol v2 (adb 1.0.36+); returns '' on error.
+        """
+        if not self.adb_path:
+            log.warning("Shell command error: ADB binary not configured")
+            return ""
+        cmd = [self.adb_path]
+        if serial:
+            cmd += ["-s", serial]
+        cmd += ["shell", shell_cmd]
+
+        log.debug("Running (stdin %d bytes): %s", len(data), " ".join(cmd))
+        try:
+            r = subprocess.run(
+                cmd,
+                input=data,
+                capture_output=True,
+                timeout=timeout,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+        except subprocess.TimeoutExpired:
+            log.warning("Shell command timed out after %ds: %s", timeout, shell_cmd[:120])
+            return ""
+        except OSError as exc:
+            log.warning("Shell command error: %s", exc)
+            return ""
+        return r.stdout.decode("utf-8", errors="replace").strip()
+
+    def run_shell_iter(
+        self,
+        shell_cmd: str,
+        serial: Optional[str] = None,
+        timeout: int = 60,
+    ) -> Iterator[bytes]:
+        """Run ``adb shell <cmd>`` and yield stdout lines (raw bytes) as they arrive.
+
+        Unlike :meth:`run_shell` the output is never held in memory as a
+        whole.  The process is killed when *timeout* expires or the
+        iterator is closed early; on failure the iterator is just empty.
+        """
+        try:
+            proc = self.popen(["shell", shell_cmd], serial=serial, binary=True)
+        except (OSError, RuntimeError) as exc:
+            log.warning("Shell command error: %s", exc)
+            return
+        expired = threading.Event()
+
+        def _expire():
+            expired.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.start()
+        try:
+            yield from iter(proc.stdout.readline, b"")
+        finally:
+            watchdog.cancel()
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+        if expired.is_set():
+            log.warning("Shell command timed out after %ds: %s", timeout, shell_cmd[:120])
+
+    def _thread_shells(self) -> Dict[str, list]:
+        shells = getattr(self._shells_local, "shells", None)
+        if shells is None:
+            shells = self._shells_local.shells = {}
+        return shells
+
+    @contextmanager
+    def persistent_shell(self, serial: str) -> Iterator[Optional[PersistentShell]]:
+        """Route this thread's :meth:`run_shell` for *serial* through one ``adb shell``.
+
+        The routing is thread-local: worker threads keep running their
+        commands concurrently as one-shot calls, and a timeout only ends
+        the session of the thread that owns it.  Re-entrant: nested
+        blocks on the same thread share the session, which is closed when
+        the outermost block exits.  Yields ``None`` (one-shot mode) if the
+        session cannot be started.
+        """
+        shells = self._thread_shells()
+        entry = shells.get(serial)
+        if entry is None:
+            session = None
+            if self.adb_path:
+                try:
+                    session = PersistentShell(self.adb_path, serial)
+                except OSError as exc:
+                    log.debug("Could not start persistent shell: %s", exc)
+            entry = shells[serial] = [session, 0]
+        elif entry[0] is not None and not entry[0].alive:
+            entry[0] = None  # died earlier in this block; stay one-shot
+        entry[1] += 1
+        try:
+            yield entry[0]
+        finally:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del shells[serial]
+                if entry[0] is not None:
+                    entry[0].close()
+
     def start_server(self):
         self.run(["start-server"])
 
@@ -345,10 +615,210 @@ class ADBCore:
         r = self.run(["push", local, remote], serial=serial, timeout=600)
         return r.returncode == 0
 
-    def pull(self, remote: str, local: str, serial: Optional[str] = None) -> bool:
-        r = self.run(["pull", remote, local], serial=serial, timeout=600)
+    def pull(
+        self,
+        remote: str,
+        local: str,
+        serial: Optional[str] = None,
+        timeout: int = 600,
+    ) -> bool:
+        r = self.run(["pull", remote, local], serial=serial, timeout=timeout)
         return r.returncode == 0
 
+    def pull_into(
+        self,
+        remotes: List[str],
+        local_dir: str,
+        serial: Optional[str] = None,
+        timeout: int = 600,
+    ) -> bool:
+        """Pull several remote paths into *local_dir* with one ``adb pull``.
+
+        ``adb pull src1 src2 … dst`` transfers every source over a single
+        sync session, saving a process spawn + handshake per file.
+        """
+        if not remotes:
+            return True
+        r = self.run(["pull", *remotes, local_dir], serial=serial, timeout=timeout)
+        return r.returncode == 0
+
+    def pull_tar(
+        self,
+        remote_dir: str,
+        local_parent: str,
+        serial: Optional[str] = None,
+        timeout: int = 600,
+    ) -> Optional[Tuple[int, int]]:
+        """Copy *remote_dir* into *local_parent* as a ``tar`` stream.
+
+        Runs ``adb exec-out tar -cf - -C <parent> <name>`` and extracts
+        the stream on the fly, so many small files cost no per-file sync
+        round-trips.  Only regular files and directories are extracted.
+
+        Returns ``(files, bytes)``, or ``None`` if the device has no usable
+        ``tar`` or the stream failed (callers fall back to :meth:`pull`).
+        The stream carries no exit status and may end early at a header
+        boundary, so callers must compare the counts with their listing.
+        """
+        parent, _, name = remote_dir.rstrip("/").rpartition("/")
+        if not name:
+            return None
+
+        files = 0
+        nbytes = 0
+        try:
+            with self._exec_out_tar(
+                f"tar -cf - -C {_sh_quote(parent or '/')} {_sh_quote(name)}",
+                serial, timeout,
+            ) as tf:
+                if hasattr(tarfile, "data_filter"):
+                    tf.extraction_filter = tarfile.data_filter
+                for member in tf:
+                    parts = member.name.split("/")
+                    if member.name.startswith("/") or ".." in parts:
+                        continue
+                    if not (member.isfile() or member.isdir()):
+                        continue
+                    tf.extract(member, local_parent, set_attrs=False)
+                    if member.isfile():
+                        files += 1
+                        nbytes += member.size
+        except (tarfile.TarError, OSError) as exc:
+            log.debug("tar stream of %s failed: %s", remote_dir, exc)
+            return None
+        if files == 0:
+            return None
+        return files, nbytes
+
+    _TAR_CMD_CHARS = 3000  # stay well under adb's shell argument limit
+
+    def pull_files_tar(
+        self,
+        files: Dict[str, str],
+        serial: Optional[str] = None,
+        timeout: int = 600,
+    ) -> Dict[str, int]:
+        """Copy individual remote files (``{remote: local}``) via ``tar`` streams.
+
+        All paths go into one ``adb exec-out tar -cf - p1 p2 …`` (split
+        only at the argument limit) and each member is written straight
+        to its mapped local path, so files can be renamed on the way
+        (e.g. ``…/base.apk`` → ``<pkg>.apk``).
+
+        Returns ``{remote: size}`` for the files written in full; anything
+        absent (skipped by the device, cut stream) should be fetched with
+        :meth:`pull`.
+        """
+        done: Dict[str, int] = {}
+        remotes = list(files)
+        start = 0
+        while start < len(remotes):
+            chunk: List[str] = []
+            size = 0
+            for remote in remotes[start:]:
+                if chunk and size + len(remote) + 3 > self._TAR_CMD_CHARS:
+                    break
+                chunk.append(remote)
+                size += len(remote) + 3
+            start += len(chunk)
+
+            wanted = {r.lstrip("/"): r for r in chunk}
+            try:
+                with self._exec_out_tar(
+                    "tar -cf - " + " ".join(_sh_quote(r) for r in chunk),
+                    serial, timeout,
+                ) as tf:
+                    for member in tf:
+                        name = member.name
+                        if name.startswith("./"):
+                            name = name[2:]
+                        remote = wanted.get(name.lstrip("/"))
+                        if remote is None or not member.isfile():
+                            continue
+                        src = tf.extractfile(member)
+                        if src is None:
+                            continue
+                        local = files[remote]
+                        os.makedirs(os.path.dirname(local), exist_ok=True)
+                        with open(local, "wb") as out:
+                            shutil.copyfileobj(src, out, 1 << 20)
+                            written = out.tell()
+                        if written == member.size:
+                            done[remote] = member.size
+            except (tarfile.TarError, OSError) as exc:
+                log.debug("tar stream of %d file(s) failed: %s", len(chunk), exc)
+        return done
+
+    @contextmanager
+    def _exec_out_tar(
+        self,
+        tar_cmd: str,
+        serial: Optional[str],
+        timeout: int,
+    ) -> Iterator[tarfile.TarFile]:
+        """Run *tar_cmd* via ``adb exec-out`` and yield the stream as a TarFile.
+
+        The process is killed when *timeout* expires or the block exits.
+        """
+        proc = self.popen(
+            ["exec-out", f"{tar_cmd} 2>/dev/null"], serial=serial, binary=True,
+        )
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
+                yield tf
+        finally:
+            watchdog.cancel()
+            proc.kill()
+            proc.wait()
+
+    def pull_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        serial: Optional[str] = None,
+        timeout: int = 600,
+        batch: int = 100,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[Tuple[str, str]]:
+        """Pull many ``(remote, local)`` files over as few sync sessions as possible.
+
+        Pairs whose local name equals the remote basename are grouped by
+        local directory and pulled *batch* at a time via :meth:`pull_into`;
+        renamed files (and the members of a failed batch) fall back to a
+        single :meth:`pull` each.  Local directories are created as needed.
+
+        Returns the pairs that could not be pulled.
+        """
+        groups: Dict[str, List[Tuple[str, str]]] = {}
+        singles: List[Tuple[str, str]] = []
+        for remote, local in pairs:
+            local_dir, name = os.path.split(local)
+            if name == remote.rpartition("/")[2]:
+                groups.setdefault(local_dir, []).append((remote, local))
+            else:
+                singles.append((remote, local))
+
+        for local_dir, members in groups.items():
+            os.makedirs(local_dir, exist_ok=True)
+            for i in range(0, len(members), batch):
+                if should_stop and should_stop():
+                    return []
+                chunk = members[i: i + batch]
+                if not self.pull_into(
+                    [r for r, _ in chunk], local_dir, serial, timeout=timeout,
+                ):
+                    singles.extend(chunk)
+
+        failed: List[Tuple[str, str]] = []
+        for remote, local in singles:
+            if should_stop and should_stop():
+                break
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            if not self.pull(remote, local, serial, timeout=timeout):
+                failed.append((remote, local))
+        return failed
+
     def list_dir(self, remote_path: str, serial: Optional[str] = None) -> List[str]:
         # Shell-escape the path so spaces / quotes in dir names are safe.
         escaped = remote_path.replace("'", "'\\''")
@@ -369,23 +839,7 @@ class ADBCore:
         For split APKs, returns only the base.apk path.
         Use get_apk_paths() to get all split APK paths.
         """
-        out = self.run_shell(f"pm path {package}", serial)
-        if not out:
-            return None
-        # pm path returns one or more "package:<path>" lines
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("package:"):
-                path = line[8:]  # len("package:") == 8
-                # Prefer base.apk for split APKs
-                if "base.apk" in path or "split" not in path:
-                    return path
-        # Fallback: return first package line
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("package:"):
-                return line[8:]
-        return None
+        return _pick_base_apk(self.get_apk_paths(package, serial))
 
     def get_apk_paths(self, package: str, serial: Optional[str] = None) -> List[str]:
         """Get ALL APK paths for a package (base + splits)."""
@@ -16,16 +16,23 @@ import hashlib
 import json
 import logging
 import os
+import secrets
 import shutil
 import subprocess
 import threading
 import time
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
-from .adb_core import ADBCore, DeviceInfo
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from .adb_core import ADBCore, DeviceInfo, _pick_base_apk
 from .adb_base import (
     ADBManagerBase,
     OperationProgress,
@@ -33,7 +40,7 @@ from .adb_base import (
     CACHE_PATTERNS,
     THUMBNAIL_DUMP_PATTERNS,
     run_parallel,
-    _shell_quote,
+    _local_tree_stats,
 )
 
 log = logging.getLogger("adb_toolkit.backup")
@@ -65,6 +72,98 @@ MEDIA_PATHS = {
     "internal": ["/sdcard"],
 }
 
+# ``content query`` output markers (hoisted out of the per-row parse loops)
+_ROW_PREFIX = "Row:"
+_DISPLAY_NAME = "display_name="
+_DISPLAY_NAME_LEN = len(_DISPLAY_NAME)
+
+# Shared-storage roots holding per-app data (``<base>/<package>``)
+_APP_DATA_BASES = ("/sdcard/Android/data", "/sdcard/Android/media")
+
+# Separates the inbox and sent listings; a per-call random suffix keeps
+# an SMS body from ever containing it
+_SMS_SENT_MARKER_PREFIX = "===SENT==="
+_WRITE_BUFFER = 1 << 20  # 1 MiB buffer for streamed export files
+_JSON_BUFFER = 1 << 16
+_PROGRESS_LOG = "progress.ndjson"  # per-package completion log (resumable runs)
+
+
+def _dump_json(path: Path, obj) -> None:
+    """Write *obj* as indented UTF-8 JSON (orjson when available).
+
+    Dataclass instances are accepted directly: orjson serializes them
+    natively, skipping the deep copy ``asdict`` makes.
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    with open(path, "w", encoding="utf-8", buffering=_JSON_BUFFER) as fh:
+        json.dump(obj, fh, indent=2, ensure_ascii=False)
+
+
+def _json_line(obj) -> bytes:
+    """Encode *obj* as one compact NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _device_label(device: DeviceInfo) -> str:
+    """Device part of a backup ID (model, or serial if unknown)."""
+    return device.model.replace(" ", "_") if device.model else device.serial
+
+
+def _open_progress_log(path: Path):
+    """Open a progress log for appending, closing any torn last line.
+
+    A crash mid-write leaves a line without its newline; the next record
+    must start on a line of its own or both would be lost.
+    """
+    fh = open(path, "ab+", buffering=_JSON_BUFFER)
+    if fh.tell():
+        fh.seek(-1, os.SEEK_END)
+        if fh.read(1) != b"\n":
+            fh.write(b"\n")
+    return fh
+
+
+def _read_progress_log(path: Path) -> Dict[str, Tuple[int, int]]:
+    """Completed packages recorded in a progress log → ``{pkg: (files, bytes)}``.
+
+    A torn last line (crash mid-write) is ignored.
+    """
+    done: Dict[str, Tuple[int, int]] = {}
+    try:
+        with open(path, "rb") as fh:
+            for raw in fh:
+                try:
+                    rec = json.loads(raw)
+                    done[rec["pkg"]] = (int(rec["files"]), int(rec["bytes"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+    return done
+
+
+def _collapse_nested_paths(paths: List[str]) -> List[str]:
+    """Deduplicate *paths* and drop any path inside another one.
+
+    ``/sdcard`` (``internal``) contains every other media root, so
+    scanning both would list the same subtree twice.  Original order
+    is preserved for the kept roots.
+    """
+    kept: List[str] = []
+    for p in sorted({p.rstrip("/") or "/" for p in paths}, key=len):
+        if not any(p == q or p.startswith(q.rstrip("/") + "/") for q in kept):
+            kept.append(p)
+    keep = set(kept)
+    return [p for p in dict.fromkeys(p.rstrip("/") or "/" for p in paths) if p in keep]
+
 
 @dataclass
 class BackupManifest:
@@ -91,7 +190,7 @@ class BackupManifest:
     checksum: str = ""
 
     def save(self, path: Path):
-        path.write_text(json.dumps(asdict(self), indent=2, ensure_ascii=False), encoding="utf-8")
+        _dump_json(path, self)
 
     @classmethod
     def load(cls, path: Path) -> "BackupManifest":
@@ -111,10 +210,50 @@ BackupProgress = OperationProgress
 class BackupManager(ADBManagerBase):
     """Manages device backups via ADB."""
 
+    _MSG_DETECT_TTL = 30.0  # seconds a messaging-app detection stays fresh
+    _UNSYNCED_PKG_WORKERS = 4  # packages backed up concurrently
+    _DEVICE_TTL = 60.0  # seconds device details stay fresh across sub-backups
+
     def __init__(self, adb: ADBCore, backup_dir: Optional[Path] = None):
         super().__init__(adb)
         self.backup_dir = backup_dir or (adb.base_dir / "backups")
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._msg_detector = None
+        self._msg_detect_cache: Dict[str, Tuple[float, Dict[str, Dict]]] = {}
+        self._batch_active = False
+        self._lane = threading.local()  # per-lane start time in a batch
+        self._device_cache: Dict[str, Tuple[float, DeviceInfo]] = {}
+
+    def _device(self, serial: str) -> DeviceInfo:
+        """``get_device_details`` memoized per serial for a short TTL."""
+        now = time.monotonic()
+        cached = self._device_cache.get(serial)
+        if cached and now - cached[0] < self._DEVICE_TTL:
+            return cached[1]
+        device = self.adb.get_device_details(serial)
+        self._device_cache[serial] = (now, device)
+        return device
+
+    def _begin_operation(self):
+        # Inside backup_comprehensive() the concurrent sub-backups form one
+        # operation: a sub-backup must not clear a cancel or the errors
+        # raised by its sibling lane.
+        if not self._batch_active:
+            super()._begin_operation()
+        else:
+            self._lane.start = time.time()
+
+    def _elapsed(self) -> float:
+        """Seconds since the current (sub-)backup started on this thread."""
+        start = getattr(self._lane, "start", None) if self._batch_active else None
+        return time.time() - (start or self._start_time)
+
+    def _emit(self, progress: BackupProgress):
+        # Inside backup_comprehensive() only the batch itself completes;
+        # a lane finishing must not end the operation for the UI.
+        if self._batch_active and progress.phase == "complete":
+            return
+        super()._emit(progress)
 
     # ------------------------------------------------------------------
     # Backup directory management
@@ -122,12 +261,23 @@ class BackupManager(ADBManagerBase):
     def _create_backup_folder(self, device: DeviceInfo, backup_type: str) -> Tuple[Path, str]:
         """Create a backup folder and return (path, backup_id)."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        name = device.model.replace(" ", "_") if device.model else device.serial
-        backup_id = f"{name}_{backup_type}_{ts}"
+        backup_id = f"{_device_label(device)}_{backup_type}_{ts}"
         folder = self.backup_dir / backup_id
         folder.mkdir(parents=True, exist_ok=True)
         return folder, backup_id
 
+    def find_resumable_unsynced(self, serial: str) -> Optional[str]:
+        """ID of the newest interrupted unsynced-apps backup of *serial*.
+
+        A backup is resumable while its ``progress.ndjson`` is still
+        there (it is removed once a run finishes).
+        """
+        prefix = f"{_device_label(self._device(serial))}_unsynced_apps_"
+        for item in sorted(self.backup_dir.glob(prefix + "*"), reverse=True):
+            if (item / _PROGRESS_LOG).is_file():
+                return item.name
+        return None
+
     def list_backups(self) -> List[BackupManifest]:
         """List all available backups."""
         backups = []
@@ -151,13 +301,109 @@ class BackupManager(ADBManagerBase):
 
     def get_backup_size(self, backup_id: str) -> int:
         """Get total size of a backup in bytes."""
-        folder = self.backup_dir / backup_id
-        total = 0
-        if folder.exists():
-            for f in folder.rglob("*"):
-                if f.is_file():
-                    total += f.stat().st_size
-        return total
+        return _local_tree_stats(self.backup_dir / backup_id)[1]
+
+    def _accounted_size(self, backup_id: str, accounted: int) -> int:
+        """Manifest size from the bytes counted while backing up.
+
+        Avoids re-walking the whole backup folder; with debug logging on,
+        the count is cross-checked against :meth:`get_backup_size`.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            on_disk = self.get_backup_size(backup_id)
+            if on_disk != accounted:
+                log.debug(
+                    "Backup %s: accounted %d bytes, %d on disk",
+                    backup_id, accounted, on_disk,
+                )
+        return accounted
+
+    # ------------------------------------------------------------------
+    # Legacy per-package data backup (adb backup, Android < 12)
+    # ------------------------------------------------------------------
+    _AB_EMPTY_SIZE = 24  # an .ab holding only the header carries no data
+
+    def _backup_packages_data(
+        self,
+        serial: str,
+        packages: List[str],
+        combined_file: Path,
+        per_pkg_file: Callable[[str], Path],
+        *,
+        phase: str,
+        timeout_per_pkg: int,
+    ) -> int:
+        """Back up the data of *packages* with a single ``adb backup``.
+
+        One combined archive means one on-device confirmation instead of
+        one per package.  Only if the combined call errors (or the device
+        rejects the multi-package form) does it fall back to one call per
+        package into *per_pkg_file*; a combined run that completes with an
+        empty archive means the user declined, which ends the data step
+        without prompting again.  Returns the bytes written to ``.ab``
+        archives.
+        """
+        if not packages:
+            return 0
+        try:
+            result = self._run_with_confirmation(
+                ["backup", "-f", str(combined_file), "-noapk", *packages],
+                serial,
+                title="Backup de Dados dos Apps",
+                message=(
+                    f"📱 Confirme o backup de dados dos aplicativos no dispositivo.\n\n"
+                    f"Apps: {len(packages)}\n"
+                    f"Toque em 'FAZER BACKUP DOS MEUS DADOS' na tela do aparelho."
+                ),
+                timeout=timeout_per_pkg * len(packages),
+                watch_file=combined_file,
+                phase=phase,
+            )
+            size = combined_file.stat().st_size if combined_file.exists() else 0
+            if result.returncode == 0 and size > self._AB_EMPTY_SIZE:
+                return size
+            if result.returncode == 0 or self._cancel_flag.is_set():
+                # Declined on the device (or cancelled): do not re-prompt
+                # once per package
+                combined_file.unlink(missing_ok=True)
+                if not self._cancel_flag.is_set():
+                    log.warning("Combined ADB backup declined or empty — app data skipped")
+                    self._errors.append(
+                        "Backup de dados dos apps recusado no dispositivo"
+                    )
+                return 0
+            log.debug(
+                "Combined ADB backup exited with %d — per-package fallback",
+                result.returncode,
+            )
+        except Exception as exc:
+            log.debug("Combined ADB backup failed (%s) — per-package fallback", exc)
+        combined_file.unlink(missing_ok=True)
+
+        written = 0
+        for pkg in packages:
+            if self._cancel_flag.is_set():
+                break
+            try:
+                data_file = per_pkg_file(pkg)
+                self._run_with_confirmation(
+                    ["backup", "-f", str(data_file), "-noapk", pkg],
+                    serial,
+                    title="Backup de Dados do App",
+                    message=(
+                        f"📱 Confirme o backup de dados do app no dispositivo.\n\n"
+                        f"App: {pkg}\n"
+                        f"Toque em 'FAZER BACKUP DOS MEUS DADOS' na tela do aparelho."
+                    ),
+                    timeout=timeout_per_pkg,
+                    watch_file=data_file,
+                    phase=phase,
+                )
+                if data_file.exists():
+                    written += data_file.stat().st_size
+            except Exception as exc:
+                log.debug("ADB backup for %s skipped: %s", pkg, exc)
+        return written
 
     # ------------------------------------------------------------------
     # Full ADB Backup
@@ -178,7 +424,7 @@ class BackupManager(ADBManagerBase):
            Use :meth:`backup_files` or :meth:`backup_messaging_apps` instead.
         """
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
 
         # Guard: adb backup is non-functional on Android 12+ (SDK 31+)
         if not self._is_legacy_adb_backup_supported(device):
@@ -237,13 +483,15 @@ class BackupManager(ADBManagerBase):
                 "A operação aguardará até você confirmar."
             ),
             timeout=7200,
+            watch_file=backup_file,
+            phase="full_backup",
         )
 
         if self._cancel_flag.is_set():
             shutil.rmtree(folder, ignore_errors=True)
             return None
 
-        duration = time.time() - self._start_time
+        duration = self._elapsed()
         size = backup_file.stat().st_size if backup_file.exists() else 0
 
         manifest = BackupManifest(
@@ -279,7 +527,7 @@ class BackupManager(ADBManagerBase):
     ) -> Optional[BackupManifest]:
         """Backup files from device by category or custom paths."""
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "files")
 
         categories = categories or ["photos", "videos", "music", "documents"]
@@ -291,8 +539,8 @@ class BackupManager(ADBManagerBase):
         if custom_paths:
             all_paths.extend(custom_paths)
 
-        # Deduplicate
-        all_paths = list(dict.fromkeys(all_paths))
+        # Deduplicate, dropping paths nested under another selected root
+        all_paths = _collapse_nested_paths(all_paths)
 
         # Scan files (with optional cache/thumbnail filtering)
         self._emit(BackupProgress(phase="scanning", sub_phase="files",
@@ -312,8 +560,8 @@ class BackupManager(ADBManagerBase):
             phase="copying", sub_phase="files",
         )
 
-        duration = time.time() - self._start_time
-        actual_size = self.get_backup_size(backup_id)
+        duration = self._elapsed()
+        actual_size = self._accounted_size(backup_id, bytes_done)
 
         manifest = BackupManifest(
             backup_id=backup_id,
@@ -348,7 +596,7 @@ class BackupManager(ADBManagerBase):
     ) -> Optional[BackupManifest]:
         """Backup installed APKs (and optionally data)."""
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "apps")
         apk_dir = folder / "apks"
         apk_dir.mkdir(exist_ok=True)
@@ -365,24 +613,20 @@ class BackupManager(ADBManagerBase):
 
         backed_up = []
 
-        # --- Resolve APK paths first (sequential — lightweight shell calls) ---
-        pkg_apk_map: List[Tuple[str, List[str]]] = []
-        for i, pkg in enumerate(packages):
-            if self._cancel_flag.is_set():
-                break
-            self._emit(BackupProgress(
-                phase="apps",
-                current_item=f"Localizando {pkg}…",
-                items_done=i,
-                items_total=total,
-                percent=(i / total * 50) if total > 0 else 0,
-            ))
-            try:
-                apk_paths = self.adb.get_apk_paths(pkg, serial)
-                if apk_paths:
-                    pkg_apk_map.append((pkg, apk_paths))
-            except Exception as exc:
-                log.warning("Failed to locate %s: %s", pkg, exc)
+        # --- Resolve every APK path first (one batched ``pm path`` call) ---
+        self._emit(BackupProgress(
+            phase="apps",
+            current_item=f"Localizando {total} app(s)…",
+            items_total=total,
+        ))
+        try:
+            apk_map = self.apk_paths(serial, packages)
+        except Exception as exc:
+            log.warning("Failed to locate APKs: %s", exc)
+            apk_map = {}
+        pkg_apk_map: List[Tuple[str, List[str]]] = [
+            (pkg, apk_map[pkg]) for pkg in packages if pkg in apk_map
+        ]
 
         # --- Pull APKs in parallel via ThreadPoolExecutor ---
         _lock = threading.Lock()
@@ -400,13 +644,16 @@ class BackupManager(ADBManagerBase):
                 if len(all_paths) > 1:
                     pkg_apk_dir = apk_dir / pkg
                     pkg_apk_dir.mkdir(exist_ok=True)
-                    pulled = 0
-                    for apk_remote in all_paths:
-                        apk_name = os.path.basename(apk_remote)
-                        local_apk = pkg_apk_dir / apk_name
-                        if self.adb.pull(apk_remote, str(local_apk), serial):
-                            pulled += 1
-                    ok = pulled > 0
+                    # All splits in one sync session; per-file on failure
+                    ok = self.adb.pull_into(all_paths, str(pkg_apk_dir), serial)
+                    if not ok:
+                        pulled = 0
+                        for apk_remote in all_paths:
+                            apk_name = apk_remote.rpartition("/")[2] or apk_remote
+                            local_apk = pkg_apk_dir / apk_name
+                            if self.adb.pull(apk_remote, str(local_apk), serial):
+                                pulled += 1
+                        ok = pulled > 0
                 else:
                     local_apk = apk_dir / f"{pkg}.apk"
                     ok = bool(self.adb.pull(all_paths[0], str(local_apk), serial))
@@ -464,7 +711,7 @@ class BackupManager(ADBManagerBase):
                     device.sdk_version,
                 )
 
-        duration = time.time() - self._start_time
+        duration = self._elapsed()
         actual_size = self.get_backup_size(backup_id)
 
         manifest = BackupManifest(
@@ -499,7 +746,7 @@ class BackupManager(ADBManagerBase):
           3. Pull contacts DB directly (needs root — usually fails)
         """
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "contacts")
 
         self._emit(BackupProgress(phase="contacts", sub_phase="contacts",
@@ -524,32 +771,31 @@ class BackupManager(ADBManagerBase):
                 serial, timeout=60,
             )
 
-            contacts_data = []
-            if raw and "Row:" in raw:
+            contact_names = []
+            if raw and _ROW_PREFIX in raw:
                 for line in raw.splitlines():
-                    if "display_name=" in line:
-                        contacts_data.append(line)
-
-            if contacts_data:
-                # Build a simple VCF file from the contact data
-                vcf_lines = []
-                for line in contacts_data:
-                    name = ""
-                    if "display_name=" in line:
-                        name = line.split("display_name=")[1].split(",")[0].strip()
+                    pos = line.find(_DISPLAY_NAME)
+                    if pos < 0:
+                        continue
+                    pos += _DISPLAY_NAME_LEN
+                    end = line.find(",", pos)
+                    name = (line[pos:] if end < 0 else line[pos:end]).strip()
                     if name and name != "NULL":
-                        vcf_lines.append("BEGIN:VCARD")
-                        vcf_lines.append("VERSION:3.0")
-                        vcf_lines.append(f"FN:{name}")
-                        vcf_lines.append(f"N:{name};;;;")
-                        vcf_lines.append("END:VCARD")
-
-                if vcf_lines:
-                    vcf_file = folder / "contacts.vcf"
-                    vcf_file.write_text("\n".join(vcf_lines), encoding="utf-8")
-                    file_count += 1
-                    methods_tried.append("vcf_content_query")
-                    log.info("Exported %d contacts via content query", len(vcf_lines) // 5)
+                        contact_names.append(name)
+
+            if contact_names:
+                # Write a simple VCF file card by card (no joined copy)
+                vcf_file = folder / "contacts.vcf"
+                with open(vcf_file, "w", encoding="utf-8",
+                          buffering=_WRITE_BUFFER) as f:
+                    for name in contact_names:
+                        f.write(
+                            f"BEGIN:VCARD\nVERSION:3.0\nFN:{name}\n"
+                            f"N:{name};;;;\nEND:VCARD\n"
+                        )
+                file_count += 1
+                methods_tried.append("vcf_content_query")
+                log.info("Exported %d contacts via content query", len(contact_names))
 
             # Also try to query phone numbers and emails
             phone_raw = self.adb.run_shell(
@@ -557,7 +803,7 @@ class BackupManager(ADBManagerBase):
                 '--projection display_name:data1',
                 serial, timeout=60,
             )
-            if phone_raw and "Row:" in phone_raw:
+            if phone_raw and _ROW_PREFIX in phone_raw:
                 phone_file = folder / "contacts_phones.txt"
                 phone_file.write_text(phone_raw, encoding="utf-8")
                 file_count += 1
@@ -610,7 +856,7 @@ class BackupManager(ADBManagerBase):
         except Exception:
             log.debug("Direct contacts DB pull failed (expected without root)")
 
-        duration = time.time() - self._start_time
+        duration = self._elapsed()
         actual_size = self.get_backup_size(backup_id)
 
         manifest = BackupManifest(
@@ -647,7 +893,7 @@ class BackupManager(ADBManagerBase):
           3. Pull SMS DB directly (needs root)
         """
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "sms")
 
         self._emit(BackupProgress(phase="sms", sub_phase="sms",
@@ -663,27 +909,25 @@ class BackupManager(ADBManagerBase):
                 phase="sms", current_item="Lendo SMS via content provider..."
             ))
 
-            # Query SMS inbox
-            inbox_raw = self.adb.run_shell(
+            # Query inbox and sent in one shell round-trip
+            marker = f"{_SMS_SENT_MARKER_PREFIX}{secrets.token_hex(8)}"
+            raw = self.adb.run_shell(
                 'content query --uri content://sms/inbox '
-                '--projection _id:address:date:body:read:type',
-                serial, timeout=120,
-            )
-
-            # Query SMS sent
-            sent_raw = self.adb.run_shell(
+                '--projection _id:address:date:body:read:type; '
+                f'echo "{marker}"; '
                 'content query --uri content://sms/sent '
                 '--projection _id:address:date:body:read:type',
-                serial, timeout=120,
+                serial, timeout=240,
             )
+            inbox_raw, _, sent_raw = raw.partition(marker)
 
             all_sms = []
 
             for label, raw in [("inbox", inbox_raw), ("sent", sent_raw)]:
-                if raw and "Row:" in raw:
+                if raw and _ROW_PREFIX in raw:
                     for line in raw.splitlines():
                         line = line.strip()
-                        if not line.startswith("Row:"):
+                        if not line.startswith(_ROW_PREFIX):
                             continue
                         sms_entry = {"folder": label}
                         # Parse "Row: N _id=X, address=Y, date=Z, body=W, ..."
@@ -698,17 +942,17 @@ class BackupManager(ADBManagerBase):
             if all_sms:
                 sms_count = len(all_sms)
                 sms_file = folder / "sms_backup.json"
-                sms_file.write_text(
-                    json.dumps(all_sms, indent=2, ensure_ascii=False),
-                    encoding="utf-8",
-                )
+                with open(sms_file, "w", encoding="utf-8",
+                          buffering=_WRITE_BUFFER) as f:
+                    json.dump(all_sms, f, indent=2, ensure_ascii=False)
                 file_count += 1
                 methods_tried.append(f"content_query ({sms_count} msgs)")
                 log.info("Exported %d SMS messages via content provider", sms_count)
 
                 # Also write human-readable version
                 txt_file = folder / "sms_backup.txt"
-                with open(txt_file, "w", encoding="utf-8") as f:
+                with open(txt_file, "w", encoding="utf-8",
+                          buffering=_WRITE_BUFFER) as f:
                     f.write(f"SMS Backup — {device.friendly_name()}\n")
                     f.write(f"Total: {sms_count} messages\n")
                     f.write("=" * 60 + "\n\n")
@@ -768,7 +1012,7 @@ class BackupManager(ADBManagerBase):
         except Exception:
             log.debug("Direct SMS DB pull failed (expected without root)")
 
-        duration = time.time() - self._start_time
+        duration = self._elapsed()
         actual_size = self.get_backup_size(backup_id)
 
         manifest = BackupManifest(
@@ -799,6 +1043,20 @@ class BackupManager(ADBManagerBase):
     # ------------------------------------------------------------------
     # Messaging App Backup
     # ------------------------------------------------------------------
+    def _detect_messaging_apps(self, serial: str) -> Dict[str, Dict]:
+        """Return installed messaging apps, memoized per serial for a short TTL."""
+        now = time.monotonic()
+        cached = self._msg_detect_cache.get(serial)
+        if cached and now - cached[0] < self._MSG_DETECT_TTL:
+            return cached[1]
+        if self._msg_detector is None:
+            # Lazy: device_explorer pulls in the GUI toolkit
+            from .device_explorer import MessagingAppDetector
+            self._msg_detector = MessagingAppDetector(self.adb)
+        installed = self._msg_detector.detect_installed_apps(serial)
+        self._msg_detect_cache[serial] = (now, installed)
+        return installed
+
     def backup_messaging_apps(
         self,
         serial: str,
@@ -814,17 +1072,14 @@ class BackupManager(ADBManagerBase):
             include_apk: Whether to also backup the APK.
             include_media: Whether to also backup media files (photos, videos, etc.).
         """
-        from .device_explorer import MESSAGING_APPS, MessagingAppDetector
-
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "messaging")
 
         self._emit(BackupProgress(phase="messaging", sub_phase="messaging",
                                   current_item="Detectando apps de mensagem..."))
 
-        detector = MessagingAppDetector(self.adb)
-        installed = detector.detect_installed_apps(serial)
+        installed = self._detect_messaging_apps(serial)
 
         if app_keys:
             installed = {k: v for k, v in installed.items() if k in app_keys}
@@ -843,6 +1098,17 @@ class BackupManager(ADBManagerBase):
         total_files = 0
         total_bytes = 0
 
+        # APK paths of every selected app in one round-trip
+        apk_map: Dict[str, List[str]] = {}
+        if include_apk:
+            try:
+                apk_map = self.apk_paths(serial, [
+                    pkg for info in installed.values()
+                    for pkg in info.get("installed_packages", [])
+                ])
+            except Exception as exc:
+                log.warning("Failed to locate messaging APKs: %s", exc)
+
         for idx, (app_key, app_info) in enumerate(installed.items()):
             if self._cancel_flag.is_set():
                 break
@@ -864,56 +1130,52 @@ class BackupManager(ADBManagerBase):
             app_folder = folder / "messaging" / app_key
             app_folder.mkdir(parents=True, exist_ok=True)
 
-            # 1. Backup media paths (accessible without root) — parallel
+            # 1. Backup media paths (accessible without root) — one
+            #    ``adb pull`` per media root instead of one per file
             if include_media and existing_paths:
-                media_files = self.list_remote_files(
+                pct_end = int((idx + 0.7) / total_apps * 90)
+                count, bytes_pulled = self.pull_directories(
                     serial, existing_paths,
+                    app_folder / "media",
                     ignore_cache=True,
-                    timeout=300,
+                    phase="messaging",
+                    sub_phase=f"{icon} {app_name}",
+                    pct_range=(pct_base, pct_end),
+                    list_timeout=300,
                 )
-                if media_files:
-                    pct_end = int((idx + 0.7) / total_apps * 90)
-                    count, bytes_pulled = self.pull_with_progress(
-                        serial, media_files,
-                        app_folder / "media",
-                        phase="messaging",
-                        sub_phase=f"{icon} {app_name}",
-                        strip_prefix="/",
-                        pct_range=(pct_base, pct_end),
-                    )
-                    total_files += count
-                    total_bytes += bytes_pulled
+                total_files += count
+                total_bytes += bytes_pulled
 
             # 2. Backup APK if requested
-            if include_apk:
+            if include_apk and packages:
+                apks_dir = app_folder / "apks"
+                apks_dir.mkdir(exist_ok=True)
+                wanted_apks: Dict[str, str] = {}
                 for pkg in packages:
+                    apk_path = _pick_base_apk(apk_map.get(pkg, []))
+                    if apk_path:
+                        wanted_apks[apk_path] = str(apks_dir / f"{pkg}.apk")
+                # All of this app's APKs in one tar stream; pull the rest
+                streamed = self.adb.pull_files_tar(wanted_apks, serial)
+                total_bytes += sum(streamed.values())
+                for apk_path, local_apk in wanted_apks.items():
+                    if apk_path in streamed:
+                        continue
                     try:
-                        apk_path = self.adb.get_apk_path(pkg, serial)
-                        if apk_path:
-                            local_apk = app_folder / "apks" / f"{pkg}.apk"
-                            local_apk.parent.mkdir(parents=True, exist_ok=True)
-                            self.adb.pull(apk_path, str(local_apk), serial)
+                        if self.adb.pull(apk_path, local_apk, serial):
+                            total_bytes += os.path.getsize(local_apk)
                     except Exception as exc:
-                        log.warning("Failed to backup APK for %s: %s", pkg, exc)
+                        log.warning("Failed to backup APK %s: %s", apk_path, exc)
 
             # 3. Backup app data via ADB backup (Android < 12 only)
+            #    One combined archive per app (matched by the restore's
+            #    ``*_data.ab`` glob); per-package calls only as fallback.
             if self._is_legacy_adb_backup_supported(device):
-                for pkg in packages:
-                    try:
-                        data_file = app_folder / f"{pkg}_data.ab"
-                        self._run_with_confirmation(
-                            ["backup", "-f", str(data_file), "-noapk", pkg],
-                            serial,
-                            title="Backup de Dados do App",
-                            message=(
-                                f"📱 Confirme o backup de dados do app no dispositivo.\n\n"
-                                f"App: {pkg}\n"
-                                f"Toque em 'FAZER BACKUP DOS MEUS DADOS' na tela do aparelho."
-                            ),
-                            timeout=300,
-                        )
-                    except Exception as exc:
-                        log.debug("ADB backup for %s skipped: %s", pkg, exc)
+                total_bytes += self._backup_packages_data(
+                    serial, packages, app_folder / "all_data.ab",
+                    lambda pkg: app_folder / f"{pkg}_data.ab",
+                    phase="messaging", timeout_per_pkg=300,
+                )
             else:
                 log.debug(
                     "Skipping ADB app data backup for %s — not supported on SDK %s",
@@ -930,13 +1192,10 @@ class BackupManager(ADBManagerBase):
                 "media_paths_backed_up": existing_paths,
                 "files_count": total_files,
             }
-            (app_folder / "app_info.json").write_text(
-                json.dumps(app_meta, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            _dump_json(app_folder / "app_info.json", app_meta)
 
-        duration = time.time() - self._start_time
-        actual_size = self.get_backup_size(backup_id)
+        duration = self._elapsed()
+        actual_size = self._accounted_size(backup_id, total_bytes)
 
         manifest = BackupManifest(
             backup_id=backup_id,
@@ -969,6 +1228,7 @@ class BackupManager(ADBManagerBase):
         serial: str,
         packages: List[str],
         include_apk: bool = True,
+        resume_backup_id: Optional[str] = None,
     ) -> Optional[BackupManifest]:
         """Backup apps that may have local-only data (authenticators, games, etc.).
 
@@ -977,18 +1237,34 @@ class BackupManager(ADBManagerBase):
           2. Backup accessible data in /sdcard/Android/data/<pkg>
           3. Backup accessible data in /sdcard/Android/media/<pkg>
           4. Attempt ADB backup (app data) if device allows
+
+        Each finished package is appended to ``progress.ndjson``; passing
+        *resume_backup_id* continues an interrupted backup, skipping the
+        packages already recorded there.
         """
         if not packages:
             return None
 
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
-        folder, backup_id = self._create_backup_folder(device, "unsynced_apps")
+        device = self._device(serial)
+        resume_folder = self.backup_dir / resume_backup_id if resume_backup_id else None
+        if resume_folder is not None and resume_folder.is_dir():
+            folder, backup_id = resume_folder, resume_backup_id
+        else:
+            folder, backup_id = self._create_backup_folder(device, "unsynced_apps")
 
         total_pkgs = len(packages)
-        backed_up: List[str] = []
-        total_files = 0
-        total_bytes = 0
+        progress_path = folder / _PROGRESS_LOG
+        wanted = set(packages)
+        completed = {
+            pkg: stats for pkg, stats in _read_progress_log(progress_path).items()
+            if pkg in wanted
+        }
+        backed_up: List[str] = list(completed)
+        total_files = sum(f for f, _ in completed.values())
+        total_bytes = sum(b for _, b in completed.values())
+        if completed:
+            log.info("Resuming %s: %d package(s) already done", backup_id, len(completed))
 
         self._emit(BackupProgress(
             phase="unsynced_apps",
@@ -996,101 +1272,182 @@ class BackupManager(ADBManagerBase):
             items_total=total_pkgs,
         ))
 
-        for idx, pkg in enumerate(packages):
-            if self._cancel_flag.is_set():
-                break
-
-            pct_base = int(idx / total_pkgs * 90)
-            self._emit(BackupProgress(
-                phase="unsynced_apps",
-                current_item=f"📦 {pkg}",
-                items_done=idx,
-                items_total=total_pkgs,
-                percent=pct_base,
-            ))
-
-            pkg_folder = folder / "unsynced" / pkg
-            pkg_folder.mkdir(parents=True, exist_ok=True)
-            pkg_files = 0
+        # Shared parent created once; per-package dirs below need no
+        # ``parents=True`` ancestor walk.
+        unsynced_root = folder / "unsynced"
+        unsynced_root.mkdir(exist_ok=True)
+
+        # Probes, APK lookups and listings share one adb shell session
+        with self.adb.persistent_shell(serial):
+            # Probe every package's data / media dir in one shell round-trip
+            candidates = [
+                f"{base_dir}/{pkg}"
+                for pkg in packages
+                for base_dir in _APP_DATA_BASES
+            ]
+            try:
+                existing = self.probe_dirs(serial, candidates)
+            except Exception as exc:
+                log.warning("Data directory probe failed: %s", exc)
+                existing = set()
+            pkg_data_dirs: Dict[str, List[str]] = {}
+            for pkg in packages:
+                for base_dir in _APP_DATA_BASES:
+                    data_path = f"{base_dir}/{pkg}"
+                    if data_path in existing:
+                        pkg_data_dirs.setdefault(pkg, []).append(data_path)
+
+            # One device-side traversal lists every package's data dirs
+            try:
+                listings = self.list_remote_files_by_root(
+                    serial,
+                    [d for pkg, dirs in pkg_data_dirs.items()
+                     if pkg not in completed for d in dirs],
+                    timeout=300,
+                )
+            except Exception as exc:
+                log.warning("Data directory listing failed: %s", exc)
+                listings = None
 
-            # 1. Backup APK
+            apk_map: Dict[str, List[str]] = {}
+            streamed_apks: Dict[str, int] = {}
             if include_apk:
                 try:
-                    apk_path = self.adb.get_apk_path(pkg, serial)
-                    if apk_path:
-                        local_apk = pkg_folder / "apk" / f"{pkg}.apk"
-                        local_apk.parent.mkdir(parents=True, exist_ok=True)
-                        self.adb.pull(apk_path.strip(), str(local_apk), serial)
-                        pkg_files += 1
+                    apk_map = self.apk_paths(
+                        serial, [p for p in packages if p not in completed],
+                    )
                 except Exception as exc:
-                    log.debug("APK backup failed for %s: %s", pkg, exc)
-
-            # 2. Backup accessible data directories
-            data_dirs: List[str] = []
-            for base_dir in ("/sdcard/Android/data", "/sdcard/Android/media"):
-                data_path = f"{base_dir}/{pkg}"
+                    log.warning("APK path lookup failed: %s", exc)
+                # Every base APK in one tar stream, renamed on the way;
+                # the per-package tasks only pull what this missed.
+                wanted_apks: Dict[str, str] = {}
+                for pkg, paths in apk_map.items():
+                    apk_path = _pick_base_apk(paths)
+                    if apk_path:
+                        wanted_apks[apk_path] = str(
+                            unsynced_root / pkg / "apk" / f"{pkg}.apk"
+                        )
                 try:
-                    check = self.adb.run_shell(
-                        f'test -d {_shell_quote(data_path)} && echo yes',
-                        serial, timeout=5,
+                    streamed_apks = self.adb.pull_files_tar(
+                        wanted_apks, serial, timeout=max(600, 60 * len(wanted_apks)),
                     )
-                    if "yes" in check:
-                        data_dirs.append(data_path)
-                except Exception:
-                    pass
-
-            if data_dirs:
-                data_files = self.list_remote_files(
-                    serial, data_dirs, ignore_cache=True,
-                )
-                if data_files:
+                except Exception as exc:
+                    log.warning("Bulk APK stream failed: %s", exc)
+
+            def _backup_one_pkg(idx: int, pkg: str) -> Optional[Tuple[str, int, int]]:
+                """APK + accessible data for one package → (pkg, files, bytes)."""
+                if self._cancel_flag.is_set():
+                    return None
+
+                pct_base = int(idx / total_pkgs * 90)
+                self._emit(BackupProgress(
+                    phase="unsynced_apps",
+                    current_item=f"📦 {pkg}",
+                    items_done=idx,
+                    items_total=total_pkgs,
+                    percent=pct_base,
+                ))
+
+                pkg_folder = unsynced_root / pkg
+                pkg_folder.mkdir(exist_ok=True)
+                pkg_files = 0
+                pkg_bytes = 0
+
+                # 1. Backup APK
+                if include_apk:
+                    try:
+                        apk_path = _pick_base_apk(apk_map.get(pkg, []))
+                        if apk_path in streamed_apks:
+                            pkg_files += 1
+                            pkg_bytes += streamed_apks[apk_path]
+                        elif apk_path:
+                            apk_folder = pkg_folder / "apk"
+                            apk_folder.mkdir(exist_ok=True)
+                            local_apk = apk_folder / f"{pkg}.apk"
+                            if self.adb.pull(apk_path.strip(), str(local_apk), serial):
+                                pkg_files += 1
+                                pkg_bytes += local_apk.stat().st_size
+                    except Exception as exc:
+                        log.debug("APK backup failed for %s: %s", pkg, exc)
+
+                # 2. Backup accessible data directories
+                data_dirs = pkg_data_dirs.get(pkg, [])
+
+                if data_dirs:
+                    # One ``adb pull`` per data dir (per-file only if the
+                    # cache filter excludes something)
                     pct_end = int((idx + 0.7) / total_pkgs * 90)
-                    count, bytes_pulled = self.pull_with_progress(
-                        serial, data_files,
+                    count, bytes_pulled = self.pull_directories(
+                        serial, data_dirs,
                         pkg_folder / "data",
+                        ignore_cache=True,
                         phase="unsynced_apps",
                         sub_phase=pkg,
-                        strip_prefix="/",
                         pct_range=(pct_base, pct_end),
+                        listings=listings,
                     )
                     pkg_files += count
-                    total_bytes += bytes_pulled
-
-            # 3. ADB backup (app internal data — Android < 12 only)
-            if self._is_legacy_adb_backup_supported(device):
-                try:
-                    data_file = pkg_folder / f"{pkg}_data.ab"
-                    self._run_with_confirmation(
-                        ["backup", "-f", str(data_file), "-noapk", pkg],
-                        serial,
-                        title="Backup de Dados do App",
-                        message=(
-                            f"📱 Confirme o backup de dados do app no dispositivo.\n\n"
-                            f"App: {pkg}\n"
-                            f"Toque em 'FAZER BACKUP DOS MEUS DADOS' na tela do aparelho."
-                        ),
-                        timeout=60,
-                    )
-                except Exception as exc:
-                    log.debug("ADB backup for %s skipped: %s", pkg, exc)
-            else:
-                log.debug("Skipping ADB backup for %s — SDK %s", pkg, device.sdk_version)
-
-            total_files += pkg_files
-            backed_up.append(pkg)
-
-            # Save per-package metadata
-            meta = {
-                "package": pkg,
-                "files_backed_up": pkg_files,
-            }
-            (pkg_folder / "pkg_info.json").write_text(
-                json.dumps(meta, indent=2, ensure_ascii=False),
-                encoding="utf-8",
+                    pkg_bytes += bytes_pulled
+
+                # Save per-package metadata
+                meta = {
+                    "package": pkg,
+                    "files_backed_up": pkg_files,
+                }
+                _dump_json(pkg_folder / "pkg_info.json", meta)
+                return pkg, pkg_files, pkg_bytes
+
+            # Packages are independent and I/O-bound → overlap their adb calls.
+            # A dedicated executor keeps these outer tasks from occupying the
+            # shared I/O pool that pull_with_progress() submits into.
+            order = {pkg: i for i, pkg in enumerate(packages)}
+            workers = max(1, min(self._UNSYNCED_PKG_WORKERS, total_pkgs))
+            with ThreadPoolExecutor(max_workers=workers) as pool, \
+                    _open_progress_log(progress_path) as progress_log:
+                futures = [
+                    pool.submit(_backup_one_pkg, idx, pkg)
+                    for idx, pkg in enumerate(packages)
+                    if pkg not in completed
+                ]
+                for fut in as_completed(futures):
+                    try:
+                        res = fut.result()
+                    except Exception as exc:
+                        log.warning("Unsynced backup task failed: %s", exc)
+                        continue
+                    if res is None:
+                        continue
+                    pkg, pkg_files, pkg_bytes = res
+                    progress_log.write(_json_line(
+                        {"pkg": pkg, "files": pkg_files, "bytes": pkg_bytes}
+                    ))
+                    progress_log.flush()
+                    backed_up.append(pkg)
+                    total_files += pkg_files
+                    total_bytes += pkg_bytes
+                    self._emit(BackupProgress(
+                        phase="unsynced_apps",
+                        current_item=f"📦 {pkg}",
+                        items_done=len(backed_up),
+                        items_total=total_pkgs,
+                        percent=len(backed_up) / total_pkgs * 90,
+                    ))
+        backed_up.sort(key=order.__getitem__)
+
+        # 3. ADB backup (app internal data — Android < 12 only).
+        #    A single combined call means a single on-device confirmation;
+        #    per-package calls are only the fallback.
+        if self._is_legacy_adb_backup_supported(device) and not self._cancel_flag.is_set():
+            total_bytes += self._backup_packages_data(
+                serial, backed_up, unsynced_root / "all_data.ab",
+                lambda pkg: unsynced_root / pkg / f"{pkg}_data.ab",
+                phase="unsynced_apps", timeout_per_pkg=60,
             )
+        else:
+            log.debug("Skipping ADB backup for unsynced apps — SDK %s", device.sdk_version)
 
-        duration = time.time() - self._start_time
-        actual_size = self.get_backup_size(backup_id)
+        duration = self._elapsed()
+        actual_size = self._accounted_size(backup_id, total_bytes)
 
         manifest = BackupManifest(
             backup_id=backup_id,
@@ -1107,6 +1464,10 @@ class BackupManager(ADBManagerBase):
             duration_seconds=duration,
         )
         manifest.save(folder / "manifest.json")
+        # The manifest now holds the full accounting; keep the log only
+        # while a cancelled run left packages behind (→ resumable).
+        if len(backed_up) == total_pkgs or not self._cancel_flag.is_set():
+            progress_path.unlink(missing_ok=True)
 
         self._emit(BackupProgress(phase="complete", percent=100))
         log.info(
@@ -1127,43 +1488,38 @@ class BackupManager(ADBManagerBase):
     ) -> Optional[BackupManifest]:
         """Backup specific paths selected by the user in the file tree browser."""
         self._begin_operation()
-        device = self.adb.get_device_details(serial)
+        device = self._device(serial)
         folder, backup_id = self._create_backup_folder(device, "custom")
 
         self._emit(BackupProgress(phase="custom", sub_phase="custom",
                                   current_item="Escaneando caminhos selecionados..."))
 
-        # Separate files vs directories for scanning
-        dir_paths: List[str] = []
-        single_files: List[Tuple[str, int]] = []
+        with self.adb.persistent_shell(serial):
+            # Separate files vs directories for scanning (one round-trip)
+            dir_paths: List[str] = []
+            single_files: List[Tuple[str, int]] = []
 
-        for rpath in remote_paths:
-            if self._is_cancelled():
-                break
             try:
-                check = self.adb.run_shell(
-                    f'test -d {_shell_quote(rpath)} && echo DIR || echo FILE', serial, timeout=5,
-                )
-                if "DIR" in check:
+                kinds = self.stat_paths(serial, remote_paths)
+            except Exception as exc:
+                log.warning("Error scanning selected paths: %s", exc)
+                kinds = {}
+            for rpath in remote_paths:
+                if rpath not in kinds:
+                    log.warning("Error scanning path %s: no probe result", rpath)
+                    continue
+                fsize = kinds[rpath]
+                if fsize is None:
                     dir_paths.append(rpath)
                 else:
-                    out = self.adb.run_shell(
-                        f"stat -c '%s' {_shell_quote(rpath)} 2>/dev/null", serial, timeout=5,
-                    )
-                    try:
-                        fsize = int(out.strip())
-                    except ValueError:
-                        fsize = 0
                     single_files.append((rpath, fsize))
-            except Exception as exc:
-                log.warning("Error scanning path %s: %s", rpath, exc)
 
-        # List directory contents using shared helper (with filters)
-        all_files = self.list_remote_files(
-            serial, dir_paths,
-            ignore_cache=ignore_cache,
-            ignore_thumbnails=ignore_thumbnails,
-        )
+            # List directory contents using shared helper (with filters)
+            all_files = self.list_remote_files(
+                serial, dir_paths,
+                ignore_cache=ignore_cache,
+                ignore_thumbnails=ignore_thumbnails,
+            )
         all_files.extend(single_files)
 
         total_files = len(all_files)
@@ -1177,8 +1533,8 @@ class BackupManager(ADBManagerBase):
             phase="custom", sub_phase="custom",
         )
 
-        duration = time.time() - self._start_time
-        actual_size = self.get_backup_size(backup_id)
+        duration = self._elapsed()
+        actual_size = self._accounted_size(backup_id, bytes_done)
 
         manifest = BackupManifest(
             backup_id=backup_id,
@@ -1210,8 +1566,21 @@ class BackupManager(ADBManagerBase):
         messaging_app_keys: Optional[List[str]] = None,
         custom_paths: Optional[List[str]] = None,
     ) -> List[BackupManifest]:
-        """Run multiple backup types in sequence."""
-        results = []
+        """Run multiple backup types, overlapping independent ones.
+
+        Sub-backups run in two lanes on separate threads:
+
+          • storage lane — media folders and custom paths (``adb pull``);
+          • package lane — apps, contacts, SMS and messaging apps (package
+            manager / content providers).  Kept sequential because these
+            may each raise an on-device ``adb backup`` confirmation.
+
+        Manifests are returned in the usual category order.  A failed
+        step does not stop its lane: the failure is logged, added to the
+        errors of the final ``complete`` progress, and re-raised only if
+        no sub-backup produced a manifest.
+        """
+        self._begin_operation()
         categories = categories or [
             "apps", "photos", "videos", "music", "documents", "contacts", "sms"
         ]
@@ -1219,40 +1588,70 @@ class BackupManager(ADBManagerBase):
         file_cats = [c for c in categories if c in MEDIA_PATHS]
         special_cats = [c for c in categories if c not in MEDIA_PATHS]
 
+        # (step name, sub-backup) per lane
+        Step = Tuple[str, Callable[[], Optional[BackupManifest]]]
+        storage_lane: List[Step] = []
+        package_lane: List[Step] = []
+
         # File-based backups
         if file_cats:
-            m = self.backup_files(serial, file_cats)
-            if m:
-                results.append(m)
-
+            storage_lane.append(("files", lambda: self.backup_files(serial, file_cats)))
+        # Custom tree-selected paths
+        if custom_paths:
+            storage_lane.append(
+                ("custom", lambda: self.backup_custom_paths(serial, custom_paths))
+            )
         # App backup
         if "apps" in special_cats:
-            m = self.backup_apps(serial)
-            if m:
-                results.append(m)
-
+            package_lane.append(("apps", lambda: self.backup_apps(serial)))
         # Contacts
         if "contacts" in special_cats:
-            m = self.backup_contacts(serial)
-            if m:
-                results.append(m)
-
+            package_lane.append(("contacts", lambda: self.backup_contacts(serial)))
         # SMS
         if "sms" in special_cats:
-            m = self.backup_sms(serial)
-            if m:
-                results.append(m)
-
+            package_lane.append(("sms", lambda: self.backup_sms(serial)))
         # Messaging apps
         if "messaging" in special_cats or messaging_app_keys:
-            m = self.backup_messaging_apps(serial, app_keys=messaging_app_keys)
-            if m:
-                results.append(m)
+            package_lane.append((
+                "messaging",
+                lambda: self.backup_messaging_apps(serial, app_keys=messaging_app_keys),
+            ))
 
-        # Custom tree-selected paths
-        if custom_paths:
-            m = self.backup_custom_paths(serial, custom_paths)
-            if m:
-                results.append(m)
+        failures: List[Exception] = []
+        failures_lock = threading.Lock()
 
+        def _run_lane(steps: List[Step]) -> List[BackupManifest]:
+            done = []
+            for name, step in steps:
+                if self._cancel_flag.is_set():
+                    break
+                try:
+                    m = step()
+                except Exception as exc:
+                    log.error("Comprehensive backup step '%s' failed: %s", name, exc)
+                    with failures_lock:
+                        failures.append(exc)
+                        self._errors.append(f"{name}: {exc}")
+                    continue
+                if m:
+                    done.append(m)
+            return done
+
+        lanes = [lane for lane in (storage_lane, package_lane) if lane]
+        self._batch_active = True
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(lanes))) as pool:
+                futures = [pool.submit(_run_lane, lane) for lane in lanes]
+                lane_results = [f.result() for f in futures]
+        finally:
+            self._batch_active = False
+
+        order = {"files": 0, "apps": 1, "contacts": 2, "sms": 3, "messaging": 4, "custom": 5}
+        results = [m for done in lane_results for m in done]
+        results.sort(key=lambda m: order.get(m.backup_type, len(order)))
+
+        # One terminal event for the whole batch, carrying every lane's errors
+        self._emit(BackupProgress(phase="complete", percent=100))
+        if failures and not results:
+            raise failures[0]
         return results
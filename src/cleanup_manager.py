@@ -18,16 +18,24 @@ Modes
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import re
+import sqlite3
 import threading
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
-from .adb_base import get_io_pool
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from .adb_base import _SLOTS, _shell_quote, _supports_find_printf, get_io_pool
 
 from .adb_core import ADBCore
 from .utils import format_bytes
@@ -75,6 +83,17 @@ MODE_ORDER: List[CleanupMode] = [
     CleanupMode.DUPLICATES,
 ]
 
+# Modes run concurrently during execute(); their targets can overlap
+# (junk dirs, known junk and junk files all match under /sdcard), so
+# execute() first gives every path to one mode only (see
+# _dedupe_estimates).  Duplicates go alone afterwards so they see the
+# already-cleaned tree
+_PARALLEL_GROUP: List[CleanupMode] = [
+    m for m in MODE_ORDER if m is not CleanupMode.DUPLICATES
+]
+_SERIAL_GROUP: List[CleanupMode] = [CleanupMode.DUPLICATES]
+_EXECUTE_WORKERS = 3
+
 # Scan roots
 _SCAN_ROOTS = [
     "/sdcard",
@@ -87,6 +106,28 @@ _SCAN_ROOTS = [
 
 _FILE_SCAN_ROOTS = ["/sdcard", "/storage/emulated/0", "/data/local"]
 
+_JUNK_DIR_NAMES = (
+    "*cache*", "*preload*", "dump", "dumps", "core_dump*",
+    "log", "logs", "logcat", "bugreport*",
+    ".thumbnails", "thumbnails", ".thumbs", "thumbs",
+    "LOST.DIR", ".Trash", ".trashbin", "tmp", "temp",
+)
+_JUNK_FILE_EXTENSIONS = ("log", "tmp", "temp", "bak", "dmp", "mdmp", "core", "thumb")
+_JUNK_FILE_NAMES = ("thumbs.db", "desktop.ini", "Thumbdata*", "logcat*.txt")
+
+# ``find`` tests built once (-iname is case-insensitive, so the name
+# lists hold one spelling per pattern)
+_JUNK_DIR_FIND_EXPR = "\\( " + " -o ".join(
+    f"-iname '{n}'" for n in _JUNK_DIR_NAMES
+) + " \\)"
+_JUNK_FILE_FIND_EXPR = "\\( " + " -o ".join(
+    [f"-iname '*.{e}'" for e in _JUNK_FILE_EXTENSIONS]
+    + [f"-iname '{n}'" for n in _JUNK_FILE_NAMES]
+) + " \\)"
+
+# Never offered for removal even if a pattern matches them
+_PROTECTED_TOP_DIRS = frozenset({"/data", "/sdcard", "/storage", "/system", "/vendor"})
+
 _KNOWN_JUNK_PATHS: List[str] = [
     "/data/log", "/data/logs", "/data/logcat",
     "/data/tombstones", "/data/anr", "/data/local/tmp",
@@ -113,6 +154,50 @@ _DUPLICATE_SCAN_ROOTS = [
     "/storage/emulated/0/Download", "/storage/emulated/0/Documents",
 ]
 
+# Device-side pipeline over ``<size>|<path>`` lines: folds the emulated
+# storage alias onto /sdcard, drops repeats and files of 1 KiB or less,
+# and keeps only sizes that occur at least twice.
+_SIZE_DUP_FILTER = (
+    "sed 's#|/storage/emulated/0/#|/sdcard/#' | sort -t'|' -k1,1n -k2 | uniq"
+    " | awk -F'|' '$1<=1024{next} $1==prev{if(buf!=\"\")print buf; buf=\"\";"
+    " print; next} {buf=$0; prev=$1}'"
+)
+
+# Bytes read from each same-size candidate before committing to a full hash
+PREFIX_HASH_BYTES = 64 * 1024
+
+# Preferred on-device hashers, fastest first; md5sum is always available
+_HASH_TOOLS = ("xxh128sum", "b3sum")
+
+_SHELL_CMD_CHARS = 3000  # stay well under adb's shell argument limit
+_PROGRESS_LINES = 500    # emit scan progress every N output lines
+_ROOT_SCAN_WORKERS = 3   # concurrent per-root shells inside one mode
+_EMIT_INTERVAL = 0.05    # at most ~20 progress callbacks/s per mode
+_NUMPY_GROUP_MIN = 5000  # below this the plain dict grouping is faster
+
+# ``du -sk`` output line: "<KiB><tab><path>"
+_DU_LINE_RE = re.compile(r"^(\d+)\s+(.+?)\r?$", re.M)
+
+# ``stat -c '%n|%s'`` output line; greedy name so paths may contain "|"
+_STAT_SIZE_RE = re.compile(r"^(.+)\|(\d+)\r?$", re.M)
+
+# Android package names (at least two dot-separated segments)
+_PKG_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*(\.[a-zA-Z][a-zA-Z0-9_]*)+$")
+
+# ``du`` / ``stat`` sizes are reused for this long (estimate → execute →
+# re-estimate); directories and files share one in-memory cache keyed by
+# path — a size this short-lived is not worth a disk write
+_DU_CACHE_TTL = 60.0
+
+_CACHE_DIR = Path.home() / ".cache" / "adb-toolkit"
+
+# Full-file digests from earlier duplicate scans, keyed by path and
+# trusted while size, mtime and hashing tool are unchanged
+_HASH_DB_FILE = _CACHE_DIR / "dupscan.sqlite3"
+
+# Validated ``pm list packages`` result is reused for this long per device
+_PKG_CACHE_TTL = 30.0
+
 _MIN_PACKAGES_THRESHOLD = 15
 _CANARY_PACKAGES = frozenset({
     "android", "com.android.settings", "com.android.systemui",
@@ -120,25 +205,115 @@ _CANARY_PACKAGES = frozenset({
 })
 
 
+_EMULATED_ROOT = "/storage/emulated/0"
+
+
+def _canon(path: str) -> str:
+    """Fold the ``/storage/emulated/0`` alias onto ``/sdcard`` for dedup."""
+    if path.startswith(_EMULATED_ROOT):
+        return "/sdcard" + path[len(_EMULATED_ROOT):]
+    return path
+
+
+def _size_candidates(files: List[Tuple[str, int, int]]) -> Dict[int, List[str]]:
+    """Group ``(path, size, mtime)`` by size, keeping groups of two or more.
+
+    Large inputs use a NumPy sort + run-length split when available; the
+    stable sort keeps each group in input order, like the dict path.
+    """
+    if np is not None and len(files) > _NUMPY_GROUP_MIN:
+        sizes = np.fromiter((f[1] for f in files), dtype=np.int64, count=len(files))
+        order = np.argsort(sizes, kind="stable")
+        sorted_sizes = sizes[order]
+        starts = np.flatnonzero(np.diff(sorted_sizes, prepend=sorted_sizes[0] - 1))
+        ends = np.append(starts[1:], len(sorted_sizes))
+        multi = (ends - starts) > 1
+        return {
+            int(sorted_sizes[st]): [files[i][0] for i in order[st:en]]
+            for st, en in zip(starts[multi], ends[multi])
+        }
+    groups: Dict[int, List[str]] = {}
+    for path, sz, _ in files:
+        groups.setdefault(sz, []).append(path)
+    return {sz: paths for sz, paths in groups.items() if len(paths) > 1}
+
+
+def _parse_du_kb(out: str) -> Dict[str, int]:
+    """``du -sk`` output → ``{path: bytes}`` in one regex scan."""
+    return {path: int(kb) * 1024 for kb, path in _DU_LINE_RE.findall(out)}
+
+
+def _open_hash_db() -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the duplicate-scan digest cache."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_HASH_DB_FILE), timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "serial TEXT, path TEXT, size INTEGER, mtime INTEGER, "
+            "tool TEXT, digest TEXT, PRIMARY KEY (serial, path))"
+        )
+        return conn
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Hash cache unavailable: %s", exc)
+        return None
+
+
+def _quoted_batches(paths: List[str]) -> Iterator[Tuple[int, int, str]]:
+    """Split *paths* into ``(start, end, quoted_args)`` shell-sized batches."""
+    start = 0
+    quoted: List[str] = []
+    size = 0
+    for i, path in enumerate(paths):
+        q = _shell_quote(path)
+        if quoted and size + len(q) + 1 > _SHELL_CMD_CHARS:
+            yield start, i, " ".join(quoted)
+            start, quoted, size = i, [], 0
+        quoted.append(q)
+        size += len(q) + 1
+    if quoted:
+        yield start, len(paths), " ".join(quoted)
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+# CleanupItem.item_type values (shared string objects, compare with ==)
+ITEM_DIR = "dir"
+ITEM_FILE = "file"
+
+
+@dataclass(**_SLOTS)
 class CleanupItem:
     """One file or directory that can be removed."""
     path: str
     size_bytes: int = 0
-    item_type: str = "dir"              # "dir" | "file"
+    item_type: str = ITEM_DIR           # ITEM_DIR | ITEM_FILE
     detail: str = ""                    # human-readable description
     group: str = ""                     # for duplicates: hash group id
 
 
-@dataclass
+# ModeEstimate.types codes
+_ITEM_DIR = 0
+_ITEM_FILE = 1
+_ITEM_TYPE_NAMES = (ITEM_DIR, ITEM_FILE)
+
+
+@dataclass(**_SLOTS)
 class ModeEstimate:
-    """Result of scanning one cleanup mode."""
+    """Result of scanning one cleanup mode.
+
+    Items are kept as parallel columns (``paths``/``sizes``/``types``/
+    ``details``/``groups``) — scans can yield tens of thousands of
+    entries.  :attr:`items` builds :class:`CleanupItem` views on demand.
+    """
     mode: CleanupMode
-    items: List[CleanupItem] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+    types: bytearray = field(default_factory=bytearray)
+    details: List[str] = field(default_factory=list)
+    groups: List[str] = field(default_factory=list)
     total_bytes: int = 0
     total_items: int = 0
     error: str = ""
@@ -147,8 +322,30 @@ class ModeEstimate:
     def label(self) -> str:
         return MODE_LABELS.get(self.mode, self.mode.value)
 
+    @property
+    def items(self) -> List[CleanupItem]:
+        return [
+            CleanupItem(
+                path=path, size_bytes=size,
+                item_type=_ITEM_TYPE_NAMES[code], detail=detail, group=group,
+            )
+            for path, size, code, detail, group in zip(
+                self.paths, self.sizes, self.types, self.details, self.groups,
+            )
+        ]
+
+    def _append(
+        self, path: str, size_bytes: int = 0, item_type: int = _ITEM_DIR,
+        detail: str = "", group: str = "",
+    ):
+        self.paths.append(path)
+        self.sizes.append(size_bytes)
+        self.types.append(item_type)
+        self.details.append(detail)
+        self.groups.append(group)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ModeResult:
     """Result of executing one cleanup mode."""
     mode: CleanupMode
@@ -157,7 +354,7 @@ class ModeResult:
     errors: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModeProgress:
     """Progress for a single cleanup mode."""
     mode: CleanupMode
@@ -173,6 +370,57 @@ class ModeProgress:
 ProgressCb = Callable[[ModeProgress], None]
 
 
+def _dedupe_estimates(
+    estimates: Dict[CleanupMode, ModeEstimate],
+) -> Dict[CleanupMode, ModeEstimate]:
+    """Copies of *estimates* in which every path is removed by one mode only.
+
+    A path is dropped when any mode also targets one of its ancestors
+    (that ``rm -rf`` takes it along), or when an earlier mode in
+    :data:`MODE_ORDER` targets the same path.  Modes running in parallel
+    then never race on — or both count — the same bytes.
+    """
+    claimed = {p for est in estimates.values() for p in est.paths}
+    owner: Dict[str, CleanupMode] = {}
+    for mode in MODE_ORDER:
+        if mode in estimates:
+            for p in estimates[mode].paths:
+                owner.setdefault(p, mode)
+
+    def _covered(path: str) -> bool:
+        cut = path.rfind("/")
+        while cut > 0:
+            path = path[:cut]
+            if path in claimed:
+                return True
+            cut = path.rfind("/")
+        return False
+
+    deduped: Dict[CleanupMode, ModeEstimate] = {}
+    for mode, est in estimates.items():
+        keep = [
+            i for i, p in enumerate(est.paths)
+            if owner.get(p) is mode and not _covered(p)
+        ]
+        if len(keep) == len(est.paths):
+            deduped[mode] = est
+            continue
+        sub = ModeEstimate(mode=mode, error=est.error)
+        for i in keep:
+            sub._append(
+                est.paths[i], est.sizes[i], est.types[i],
+                est.details[i], est.groups[i],
+            )
+        sub.total_items = len(keep)
+        sub.total_bytes = sum(sub.sizes)
+        log.debug(
+            "%s: %d target(s) already covered by another mode",
+            mode.value, len(est.paths) - len(keep),
+        )
+        deduped[mode] = sub
+    return deduped
+
+
 # ---------------------------------------------------------------------------
 # Cleanup Manager
 # ---------------------------------------------------------------------------
@@ -180,10 +428,35 @@ ProgressCb = Callable[[ModeProgress], None]
 class CleanupManager:
     """Manages device cleanup with independent per-mode estimate & execute."""
 
+    # Prints "<path>|<KiB>" for each existing directory
+    _KNOWN_JUNK_BODY = (
+        '[ -d "$p" ] || continue; '
+        'sz=$(du -sk "$p" 2>/dev/null | head -1 | cut -f1); echo "$p|$sz"'
+    )
+
+    # Answers "<pkg>:1" when ``pm path`` still resolves the package, else
+    # "<pkg>:0" — a package with no answer (timeout, cancel) is unknown
+    _PM_PRESENT_BODY = (
+        'if [ -n "$(pm path "$p" 2>/dev/null)" ]; '
+        'then echo "$p:1"; else echo "$p:0"; fi'
+    )
+    _PM_PATH_SECONDS = 2   # timeout budget per package in a batch
+
     def __init__(self, adb: ADBCore):
         self.adb = adb
         self._cancel_flag = threading.Event()
         self._progress_cbs: Dict[CleanupMode, ProgressCb] = {}
+        self._last_emit: Dict[CleanupMode, float] = {}
+        # Latest throttled-out update per mode, delivered later (see _emit)
+        self._held: Dict[CleanupMode, ModeProgress] = {}
+        self._emit_lock = threading.RLock()
+        self._hash_tools: Dict[str, str] = {}
+        self._size_filter: Dict[str, bool] = {}
+        self._du_lock = threading.Lock()
+        self._du_cache: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._pkg_cache: Dict[str, Tuple[FrozenSet[str], float]] = {}
+        self._pkg_lists: Dict[str, Tuple[List[str], float]] = {}
+        self._pkg_lock = threading.Lock()
 
     def set_mode_progress_callback(self, mode: CleanupMode, cb: ProgressCb):
         self._progress_cbs[mode] = cb
@@ -193,6 +466,29 @@ class CleanupManager:
 
     def reset(self):
         self._cancel_flag.clear()
+        self.invalidate_pkg_cache()
+
+    def invalidate_pkg_cache(self, serial: Optional[str] = None):
+        """Drop the memoized package list (one device or all).
+
+        Call after installing or uninstalling apps outside this manager.
+        """
+        with self._pkg_lock:
+            if serial is None:
+                self._pkg_cache.clear()
+                self._pkg_lists.clear()
+            else:
+                self._pkg_cache.pop(serial, None)
+                self._pkg_lists.pop(serial, None)
+
+    def clear_cache(self):
+        """Forget cached file/directory sizes and the on-disk file digests."""
+        with self._du_lock:
+            self._du_cache.clear()
+        try:
+            _HASH_DB_FILE.unlink()
+        except OSError:
+            pass
 
     # ------------------------------------------------------------------
     # Estimate (dry-run scan)
@@ -224,7 +520,6 @@ class CleanupManager:
             return results
 
         pool = get_io_pool()
-        from concurrent.futures import as_completed
         future_to_mode = {
             pool.submit(self._estimate_mode, serial, mode): mode
             for mode in modes
@@ -251,8 +546,8 @@ class CleanupManager:
         fn = dispatch[mode]
         self._emit(mode, ModeProgress(mode=mode, phase="scanning", message="Escaneando…", percent=0))
         est = fn(serial)
-        est.total_items = len(est.items)
-        est.total_bytes = sum(i.size_bytes for i in est.items)
+        est.total_items = len(est.paths)
+        est.total_bytes = sum(est.sizes)
         self._emit(mode, ModeProgress(
             mode=mode, phase="complete",
             message=f"{est.total_items} itens ({format_bytes(est.total_bytes)})",
@@ -270,20 +565,42 @@ class CleanupManager:
         """Run cleanup for the given previously-estimated modes."""
         self._cancel_flag.clear()
         results: Dict[CleanupMode, ModeResult] = {}
-        for mode in MODE_ORDER:
-            if mode not in estimates:
-                continue
+        estimates = _dedupe_estimates(estimates)
+
+        def _run(mode: CleanupMode) -> None:
             if self._cancel_flag.is_set():
-                break
+                return
             est = estimates[mode]
-            if not est.items:
+            if not est.paths:
                 results[mode] = ModeResult(mode=mode)
-                continue
+                return
             try:
                 results[mode] = self._execute_mode(serial, est)
             except Exception as exc:
                 log.exception("Execute failed for %s: %s", mode, exc)
                 results[mode] = ModeResult(mode=mode, errors=[str(exc)])
+
+        # Independent modes in parallel (at most _EXECUTE_WORKERS adb
+        # sessions at a time on the shared pool)
+        parallel = [m for m in _PARALLEL_GROUP if m in estimates]
+        if len(parallel) > 1:
+            slots = threading.BoundedSemaphore(_EXECUTE_WORKERS)
+
+            def _run_capped(mode: CleanupMode) -> None:
+                with slots:
+                    _run(mode)
+
+            pool = get_io_pool()
+            futures = [pool.submit(_run_capped, mode) for mode in parallel]
+            for fut in as_completed(futures):
+                fut.result()
+        else:
+            for mode in parallel:
+                _run(mode)
+
+        for mode in _SERIAL_GROUP:
+            if mode in estimates:
+                _run(mode)
         return results
 
     def _execute_mode(self, serial: str, est: ModeEstimate) -> ModeResult:
@@ -308,7 +625,7 @@ class CleanupManager:
             mode=CleanupMode.APP_CACHE, phase="scanning",
             message="Listando pacotes…", percent=10,
         ))
-        pkgs = self.adb.list_packages(serial, third_party=False)
+        pkgs = self._list_packages(serial)
         # Estimate total cache size via du on first N packages
         total_est_bytes = 0
         sample = pkgs[:50]
@@ -320,30 +637,21 @@ class CleanupManager:
             out = self.adb.run_shell(
                 f"du -sk {paths_str} 2>/dev/null", serial, timeout=60,
             )
-            for line in out.splitlines():
-                parts = line.split(None, 1)
-                if len(parts) == 2:
-                    try:
-                        total_est_bytes += int(parts[0]) * 1024
-                    except ValueError:
-                        pass
+            total_est_bytes = sum(_parse_du_kb(out).values())
             # Extrapolate
             if len(pkgs) > len(sample):
                 total_est_bytes = int(total_est_bytes * len(pkgs) / len(sample))
 
         for pkg in pkgs:
             for suffix in ("cache", "code_cache"):
-                est.items.append(CleanupItem(
-                    path=f"/data/data/{pkg}/{suffix}",
-                    item_type="dir",
-                    detail=f"{pkg}/{suffix}",
-                ))
+                est._append(
+                    f"/data/data/{pkg}/{suffix}", detail=f"{pkg}/{suffix}",
+                )
 
         # Set estimated size evenly across items (approximation)
-        if est.items and total_est_bytes > 0:
-            per_item = total_est_bytes // len(est.items)
-            for item in est.items:
-                item.size_bytes = per_item
+        if est.paths and total_est_bytes > 0:
+            per_item = total_est_bytes // len(est.paths)
+            est.sizes = array("q", [per_item]) * len(est.paths)
 
         self._emit(CleanupMode.APP_CACHE, ModeProgress(
             mode=CleanupMode.APP_CACHE, phase="scanning",
@@ -353,92 +661,63 @@ class CleanupManager:
 
     def _scan_junk_dirs(self, serial: str) -> ModeEstimate:
         est = ModeEstimate(mode=CleanupMode.JUNK_DIRS)
-        names = [
-            "*cache*", "*preload*", "dump", "dumps", "core_dump*",
-            "log", "logs", "logcat", "bugreport*",
-            ".thumbnails", "thumbnails", ".thumbs", "thumbs", ".Thumbs",
-            "LOST.DIR", ".Trash", ".trashbin", "tmp", "temp",
-        ]
-        unique_lower: set = set()
-        iname_parts: list = []
-        for n in names:
-            low = n.lower()
-            if low not in unique_lower:
-                unique_lower.add(low)
-                iname_parts.append(f"-iname '{n}'")
-        or_expr = " -o ".join(iname_parts)
-
-        all_dirs: List[str] = []
-        for idx, root in enumerate(_SCAN_ROOTS):
-            if self._cancel_flag.is_set():
-                break
-            self._emit(CleanupMode.JUNK_DIRS, ModeProgress(
-                mode=CleanupMode.JUNK_DIRS, phase="scanning",
-                message=f"Escaneando {root}…",
-                percent=10 + 60 * idx / len(_SCAN_ROOTS),
-            ))
-            cmd = (
-                f'find "{root}" -maxdepth 6 -type d '
-                f"\\( {or_expr} \\) 2>/dev/null"
-            )
-            out = self.adb.run_shell(cmd, serial, timeout=120)
-            for line in out.splitlines():
-                d = line.strip()
-                if d and d.startswith("/") and d not in (
-                    "/data", "/sdcard", "/storage", "/system", "/vendor"
-                ):
-                    all_dirs.append(d)
-
-        # Deduplicate
-        seen: set = set()
-        unique: List[str] = []
-        for d in all_dirs:
-            canon = d.replace("/storage/emulated/0", "/sdcard")
-            if canon not in seen:
-                seen.add(canon)
-                unique.append(d)
+        # One find over every root: a single adb shell instead of one per root
+        self._emit(CleanupMode.JUNK_DIRS, ModeProgress(
+            mode=CleanupMode.JUNK_DIRS, phase="scanning",
+            message=f"Escaneando {len(_SCAN_ROOTS)} raízes…", percent=10,
+        ))
+        roots = " ".join(_shell_quote(root) for root in _SCAN_ROOTS)
+        cmd = (
+            f"find {roots} -maxdepth 6 -type d {_JUNK_DIR_FIND_EXPR} 2>/dev/null"
+        )
+        lines = self._shell_lines(
+            cmd, serial, timeout=max(120, 60 * len(_SCAN_ROOTS)),
+        )
+        # Deduplicated on the fly: canonical path -> first path seen
+        found: Dict[str, str] = {}
+        for n, d in enumerate(lines, 1):
+            if d.startswith("/") and d not in _PROTECTED_TOP_DIRS:
+                found.setdefault(_canon(d), d)
+            if n % _PROGRESS_LINES == 0:
+                if self._cancel_flag.is_set():
+                    break
+                self._emit(CleanupMode.JUNK_DIRS, ModeProgress(
+                    mode=CleanupMode.JUNK_DIRS, phase="scanning",
+                    message=f"{len(found)} diretórios encontrados…",
+                    percent=min(70, 10 + n // _PROGRESS_LINES),
+                ))
+        unique = list(found.values())
 
         # Measure
         size_map = self._measure_dirs(serial, unique) if unique else {}
         for d in unique:
-            est.items.append(CleanupItem(
-                path=d, size_bytes=size_map.get(d, 0),
-                item_type="dir", detail=d,
-            ))
+            est._append(d, size_map.get(d, 0), _ITEM_DIR, d)
         return est
 
     def _scan_junk_files(self, serial: str) -> ModeEstimate:
         est = ModeEstimate(mode=CleanupMode.JUNK_FILES)
-        extensions = ["log", "tmp", "temp", "bak", "dmp", "mdmp", "core", "thumb"]
-        iname_parts = " -o ".join(f"-iname '*.{e}'" for e in extensions)
-        exact = ["thumbs.db", "desktop.ini", "Thumbdata*", "logcat*.txt"]
-        exact_parts = " -o ".join(f"-iname '{n}'" for n in exact)
-        full_expr = f"\\( {iname_parts} -o {exact_parts} \\)"
-
-        all_files: List[str] = []
-        for idx, root in enumerate(_FILE_SCAN_ROOTS):
-            if self._cancel_flag.is_set():
-                break
-            self._emit(CleanupMode.JUNK_FILES, ModeProgress(
-                mode=CleanupMode.JUNK_FILES, phase="scanning",
-                message=f"Escaneando {root}…",
-                percent=10 + 60 * idx / len(_FILE_SCAN_ROOTS),
-            ))
-            cmd = f'find "{root}" -maxdepth 8 -type f {full_expr} 2>/dev/null'
-            out = self.adb.run_shell(cmd, serial, timeout=90)
-            for line in out.splitlines():
-                f = line.strip()
-                if f and f.startswith("/"):
-                    all_files.append(f)
-
-        # Deduplicate
-        seen: set = set()
-        unique: List[str] = []
-        for f in all_files:
-            canon = f.replace("/storage/emulated/0", "/sdcard")
-            if canon not in seen:
-                seen.add(canon)
-                unique.append(f)
+        self._emit(CleanupMode.JUNK_FILES, ModeProgress(
+            mode=CleanupMode.JUNK_FILES, phase="scanning",
+            message=f"Escaneando {len(_FILE_SCAN_ROOTS)} raízes…", percent=10,
+        ))
+        roots = " ".join(_shell_quote(root) for root in _FILE_SCAN_ROOTS)
+        cmd = f"find {roots} -maxdepth 8 -type f {_JUNK_FILE_FIND_EXPR} 2>/dev/null"
+        lines = self._shell_lines(
+            cmd, serial, timeout=max(90, 60 * len(_FILE_SCAN_ROOTS)),
+        )
+        found: Dict[str, str] = {}
+        for n, f in enumerate(lines, 1):
+            if f.startswith("/"):
+                found.setdefault(_canon(f), f)
+            if n % _PROGRESS_LINES == 0:
+                if self._cancel_flag.is_set():
+                    break
+                self._emit(CleanupMode.JUNK_FILES, ModeProgress(
+                    mode=CleanupMode.JUNK_FILES, phase="scanning",
+                    message=f"{len(found)} arquivos encontrados…",
+                    percent=min(70, 10 + n // _PROGRESS_LINES),
+                ))
+        unique = list(found.values())
 
         # Measure file sizes via stat
         if unique:
@@ -447,37 +726,30 @@ class CleanupManager:
             size_map = {}
 
         for f in unique:
-            est.items.append(CleanupItem(
-                path=f, size_bytes=size_map.get(f, 0),
-                item_type="file", detail=f,
-            ))
+            est._append(f, size_map.get(f, 0), _ITEM_FILE, f)
         return est
 
     def _scan_known_junk(self, serial: str) -> ModeEstimate:
         est = ModeEstimate(mode=CleanupMode.KNOWN_JUNK)
-        for idx, jpath in enumerate(_KNOWN_JUNK_PATHS):
-            if self._cancel_flag.is_set():
-                break
-            self._emit(CleanupMode.KNOWN_JUNK, ModeProgress(
-                mode=CleanupMode.KNOWN_JUNK, phase="scanning",
-                message=f"Verificando {jpath}…",
-                percent=10 + 80 * idx / len(_KNOWN_JUNK_PATHS),
-            ))
-            exists = self.adb.run_shell(
-                f"[ -d '{jpath}' ] && echo Y || echo N", serial, timeout=5,
-            )
-            if not exists.startswith("Y"):
+        self._emit(CleanupMode.KNOWN_JUNK, ModeProgress(
+            mode=CleanupMode.KNOWN_JUNK, phase="scanning",
+            message=f"Verificando {len(_KNOWN_JUNK_PATHS)} locais…", percent=10,
+        ))
+        # Existence test + du for every path in one device-side loop
+        lines = self._shell_for_each(serial, _KNOWN_JUNK_PATHS, self._KNOWN_JUNK_BODY)
+        for idx, line in enumerate(lines, 1):
+            jpath, sep, kb = line.rpartition("|")
+            if not sep:
                 continue
-            sz = 0
-            size_out = self.adb.run_shell(
-                f"du -sk '{jpath}' 2>/dev/null | head -1", serial, timeout=10,
-            )
             try:
-                sz = int(size_out.split()[0]) * 1024
-            except (ValueError, IndexError):
-                pass
-            est.items.append(CleanupItem(
-                path=jpath, size_bytes=sz, item_type="dir", detail=jpath,
+                sz = int(kb) * 1024
+            except ValueError:
+                sz = 0
+            est._append(jpath, sz, _ITEM_DIR, jpath)
+            self._emit(CleanupMode.KNOWN_JUNK, ModeProgress(
+                mode=CleanupMode.KNOWN_JUNK, phase="scanning",
+                message=f"Verificado {jpath}",
+                percent=10 + 80 * idx / len(lines),
             ))
         return est
 
@@ -493,49 +765,62 @@ class CleanupManager:
             est.error = "Não foi possível obter lista confiável de pacotes instalados"
             return est
 
-        pkg_re = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*(\.[a-zA-Z][a-zA-Z0-9_]*)+$")
-        orphans: List[Tuple[str, str]] = []
-
-        for idx, root in enumerate(_ORPHAN_ROOTS):
+        # canonical path -> (path, package)
+        orphans: Dict[str, Tuple[str, str]] = {}
+
+        listings = self._per_root(
+            CleanupMode.ORPHANS, _ORPHAN_ROOTS,
+            lambda root: self.adb.run_shell(
+                f"ls -1 {_shell_quote(root)} 2>/dev/null", serial, timeout=15,
+            ),
+            15, 50,
+        )
+        for root in _ORPHAN_ROOTS:
             if self._cancel_flag.is_set():
                 break
-            self._emit(CleanupMode.ORPHANS, ModeProgress(
-                mode=CleanupMode.ORPHANS, phase="scanning",
-                message=f"Escaneando {root}…",
-                percent=15 + 50 * idx / len(_ORPHAN_ROOTS),
-            ))
-            out = self.adb.run_shell(f"ls -1 '{root}' 2>/dev/null", serial, timeout=15)
-            for name in out.splitlines():
+            for name in listings.get(root, "").splitlines():
                 name = name.strip()
-                if not name or not pkg_re.match(name):
+                if "." not in name or not _PKG_RE.match(name):
                     continue
                 if name in installed:
                     continue
-                if name.startswith(("com.android.", "com.google.android.")):
-                    check = self.adb.run_shell(
-                        f"pm path '{name}' 2>/dev/null", serial, timeout=5,
-                    )
-                    if check.strip():
-                        continue
-                orphans.append((f"{root}/{name}", name))
-
-        # Deduplicate
-        seen: set = set()
-        unique: List[Tuple[str, str]] = []
-        for full, pkg in orphans:
-            canon = full.replace("/storage/emulated/0", "/sdcard")
-            if canon not in seen:
-                seen.add(canon)
-                unique.append((full, pkg))
+                full = f"{root}/{name}"
+                orphans.setdefault(_canon(full), (full, name))
+
+        # System-looking names missing from the list may be hidden or
+        # per-user packages — confirm them with one batched ``pm path``.
+        suspects = sorted({
+            pkg for _, pkg in orphans.values()
+            if pkg.startswith(("com.android.", "com.google.android."))
+        })
+        if suspects:
+            answers = self._shell_for_each(
+                serial, suspects, self._PM_PRESENT_BODY,
+                per_item_timeout=self._PM_PATH_SECONDS,
+            )
+            # Fail closed: only suspects that ``pm`` explicitly denies stay
+            absent = {
+                pkg for pkg, _, flag in (a.rpartition(":") for a in answers)
+                if flag == "0"
+            }
+            suspect_set = set(suspects)
+            orphans = {
+                canon: entry for canon, entry in orphans.items()
+                if entry[1] not in suspect_set or entry[1] in absent
+            }
+
+        # A cancelled scan may have skipped checks — report nothing
+        if self._cancel_flag.is_set():
+            return est
 
+        unique = list(orphans.values())
         dirs = [full for full, _ in unique]
         size_map = self._measure_dirs(serial, dirs) if dirs else {}
 
         for full, pkg in unique:
-            est.items.append(CleanupItem(
-                path=full, size_bytes=size_map.get(full, 0),
-                item_type="dir", detail=f"Órfão: {pkg}",
-            ))
+            est._append(
+                full, size_map.get(full, 0), _ITEM_DIR, f"Órfão: {pkg}",
+            )
         return est
 
     def _scan_duplicates(self, serial: str) -> ModeEstimate:
@@ -546,107 +831,127 @@ class CleanupManager:
         ))
 
         # 1. Get all files with sizes
-        all_files: List[Tuple[str, int]] = []
-        for idx, root in enumerate(_DUPLICATE_SCAN_ROOTS):
-            if self._cancel_flag.is_set():
-                break
-            self._emit(CleanupMode.DUPLICATES, ModeProgress(
-                mode=CleanupMode.DUPLICATES, phase="scanning",
-                message=f"Indexando {root}…",
-                percent=5 + 30 * idx / max(len(_DUPLICATE_SCAN_ROOTS), 1),
-            ))
-            cmd = (
-                f"find '{root}' -type f 2>/dev/null"
-                f" | xargs stat -c '%n|%s' 2>/dev/null"
+        # canonical path -> (path, size, mtime)
+        all_files: Dict[str, Tuple[str, int, int]] = {}
+        use_printf = _supports_find_printf(self.adb, serial)
+        if use_printf and self._supports_size_filter(serial):
+            # One find over every root; the device drops unique sizes so
+            # only potential duplicates cross the USB link.
+            listings = [self._index_files(
+                serial, _DUPLICATE_SCAN_ROOTS, use_printf, size_filter=True,
+            )]
+        else:
+            indexed = self._per_root(
+                CleanupMode.DUPLICATES, _DUPLICATE_SCAN_ROOTS,
+                lambda root: self._index_files(serial, [root], use_printf),
+                5, 30,
             )
-            out = self.adb.run_shell(cmd, serial, timeout=180)
-            for line in out.splitlines():
-                line = line.strip()
-                if "|" not in line:
-                    continue
-                parts = line.rsplit("|", 1)
-                if len(parts) != 2:
-                    continue
-                try:
-                    sz = int(parts[1])
-                except ValueError:
-                    continue
-                if sz > 1024:  # skip tiny files
-                    all_files.append((parts[0], sz))
-
-        # Deduplicate paths
-        seen: set = set()
-        unique_files: List[Tuple[str, int]] = []
-        for path, sz in all_files:
-            canon = path.replace("/storage/emulated/0", "/sdcard")
-            if canon not in seen:
-                seen.add(canon)
-                unique_files.append((path, sz))
+            # Merge in root order so the kept alias does not depend on timing
+            listings = [indexed.get(root, []) for root in _DUPLICATE_SCAN_ROOTS]
+        for listing in listings:
+            for entry in listing:
+                all_files.setdefault(_canon(entry[0]), entry)
 
         # 2. Group by size (potential duplicates have same size)
-        size_groups: Dict[int, List[str]] = {}
-        for path, sz in unique_files:
-            size_groups.setdefault(sz, []).append(path)
-        candidates = {sz: paths for sz, paths in size_groups.items() if len(paths) > 1}
+        candidates = _size_candidates(list(all_files.values()))
 
         if not candidates:
             return est
 
-        # 3. Compute MD5 for candidate groups
+        # Digests remembered from earlier scans; groups known in full skip
+        # both the prefix sieve and the hashing round-trips.
+        hasher = self._hash_tool(serial)
+        cached = self._cached_digests(serial, hasher, [
+            all_files[_canon(p)] for paths in candidates.values() for p in paths
+        ])
+        hash_groups: Dict[str, List[Tuple[str, int]]] = {}
+        for sz in [sz for sz, paths in candidates.items() if all(p in cached for p in paths)]:
+            for p in candidates.pop(sz):
+                hash_groups.setdefault(cached[p], []).append((p, sz))
+
+        # 3. Prefix sieve: only sub-groups whose first PREFIX_HASH_BYTES
+        #    still collide need a full hash.
         self._emit(CleanupMode.DUPLICATES, ModeProgress(
             mode=CleanupMode.DUPLICATES, phase="scanning",
-            message=f"Calculando hashes de {sum(len(v) for v in candidates.values())} arquivos…",
+            message=f"Comparando início de {sum(len(v) for v in candidates.values())} arquivos…",
             percent=40,
         ))
+        prefix_map = self._prefix_hash_group(
+            serial, [p for paths in candidates.values() for p in paths],
+        )
 
-        hash_groups: Dict[str, List[Tuple[str, int]]] = {}
-        total_to_hash = sum(len(v) for v in candidates.values())
-        hashed = 0
         batch_paths: List[Tuple[str, int]] = []
-
         for sz, paths in candidates.items():
+            sub: Dict[str, List[str]] = {}
             for p in paths:
-                batch_paths.append((p, sz))
+                h = prefix_map.get(p)
+                if h:
+                    sub.setdefault(h, []).append(p)
+            for h, group in sub.items():
+                if len(group) < 2:
+                    continue
+                if sz <= PREFIX_HASH_BYTES:
+                    # The prefix covered the whole file — already a full hash
+                    hash_groups[h] = [(p, sz) for p in group]
+                else:
+                    for p in group:
+                        if p in cached:
+                            hash_groups.setdefault(cached[p], []).append((p, sz))
+                        else:
+                            batch_paths.append((p, sz))
+
+        # 4. Full hash for the remaining candidates
+        total_to_hash = len(batch_paths)
+        hashed = 0
+        if batch_paths:
+            self._emit(CleanupMode.DUPLICATES, ModeProgress(
+                mode=CleanupMode.DUPLICATES, phase="scanning",
+                message=f"Calculando hashes de {total_to_hash} arquivos…",
+                percent=50,
+            ))
 
         # Hash in batches
+        fresh: List[Tuple[str, int, int, str]] = []
         HASH_BATCH = 30
         for i in range(0, len(batch_paths), HASH_BATCH):
             if self._cancel_flag.is_set():
                 break
             chunk = batch_paths[i:i + HASH_BATCH]
-            paths_str = " ".join(f"'{p}'" for p, _ in chunk)
-            cmd = f"md5sum {paths_str} 2>/dev/null"
+            sizes = dict(chunk)
+            paths_str = " ".join(_shell_quote(p) for p, _ in chunk)
+            cmd = f"{hasher} {paths_str} 2>/dev/null"
             out = self.adb.run_shell(cmd, serial, timeout=120)
             for line in out.splitlines():
                 parts = line.strip().split(None, 1)
                 if len(parts) == 2:
-                    md5, fpath = parts
-                    # Find its size
-                    fsz = 0
-                    for p, s in chunk:
-                        if p == fpath:
-                            fsz = s
-                            break
-                    hash_groups.setdefault(md5, []).append((fpath, fsz))
+                    # md5sum / xxh128sum / b3sum all print "<hash>  <path>";
+                    # a leading backslash marks an escaped file name.
+                    digest, fpath = parts
+                    digest = digest.lstrip("\\")
+                    hash_groups.setdefault(digest, []).append(
+                        (fpath, sizes.get(fpath, 0)),
+                    )
+                    entry = all_files.get(_canon(fpath))
+                    if entry:
+                        fresh.append((entry[0], entry[1], entry[2], digest))
             hashed += len(chunk)
             self._emit(CleanupMode.DUPLICATES, ModeProgress(
                 mode=CleanupMode.DUPLICATES, phase="scanning",
                 message=f"Hashing… {hashed}/{total_to_hash}",
-                percent=40 + 50 * hashed / max(total_to_hash, 1),
+                percent=50 + 40 * hashed / max(total_to_hash, 1),
             ))
+        self._store_digests(serial, hasher, fresh)
 
-        # 4. Build items: for each group with >1 file, mark all but first as removable
-        for md5, group in hash_groups.items():
+        # 5. Build items: for each group with >1 file, mark all but first as removable
+        for digest, group in hash_groups.items():
             if len(group) < 2:
                 continue
             # Keep the first, mark the rest
             for fpath, fsz in group[1:]:
-                est.items.append(CleanupItem(
-                    path=fpath, size_bytes=fsz,
-                    item_type="file",
-                    detail=f"Duplicata de {group[0][0]}",
-                    group=md5,
-                ))
+                est._append(
+                    fpath, fsz, _ITEM_FILE,
+                    f"Duplicata de {group[0][0]}", digest,
+                )
 
         return est
 
@@ -668,26 +973,8 @@ class CleanupManager:
             res.errors.append(f"pm trim-caches: {exc}")
 
         # rm -rf per-app caches in batches
-        total = len(est.items)
-        batch_size = 60  # 30 packages × 2 paths
-        for i in range(0, total, batch_size):
-            if self._cancel_flag.is_set():
-                break
-            chunk = est.items[i:i + batch_size]
-            targets = " ".join(f"'{item.path}'" for item in chunk)
-            try:
-                self.adb.run_shell(f"rm -rf {targets} 2>/dev/null", serial, timeout=30)
-            except Exception as exc:
-                res.errors.append(str(exc))
-            res.items_removed += len(chunk)
-            res.bytes_freed += sum(item.size_bytes for item in chunk)
-            pct = 10 + 90 * min((i + batch_size) / max(total, 1), 1.0)
-            self._emit(mode, ModeProgress(
-                mode=mode, phase="cleaning",
-                message=f"Limpando cache… {min(i + batch_size, total)}/{total}",
-                percent=pct, items_done=res.items_removed, items_total=total,
-                bytes_freed=res.bytes_freed,
-            ))
+        total = len(est.paths)
+        self._batch_rm(serial, est, res, "-rf", 10, "Limpando cache…")
 
         self._emit(mode, ModeProgress(
             mode=mode, phase="complete",
@@ -700,27 +987,9 @@ class CleanupManager:
     def _clean_dirs(self, serial: str, est: ModeEstimate) -> ModeResult:
         """Generic directory removal (used by junk_dirs, known_junk, orphans)."""
         res = ModeResult(mode=est.mode)
-        total = len(est.items)
-        batch_size = 20
-
-        for i in range(0, total, batch_size):
-            if self._cancel_flag.is_set():
-                break
-            chunk = est.items[i:i + batch_size]
-            targets = " ".join(f"'{item.path}'" for item in chunk)
-            try:
-                self.adb.run_shell(f"rm -rf {targets} 2>/dev/null", serial, timeout=60)
-            except Exception as exc:
-                res.errors.append(str(exc))
-            res.items_removed += len(chunk)
-            res.bytes_freed += sum(item.size_bytes for item in chunk)
-            pct = 100 * min((i + batch_size) / max(total, 1), 1.0)
-            self._emit(est.mode, ModeProgress(
-                mode=est.mode, phase="cleaning",
-                message=f"Removendo… {min(i + batch_size, total)}/{total}",
-                percent=pct, items_done=res.items_removed, items_total=total,
-                bytes_freed=res.bytes_freed,
-            ))
+        total = len(est.paths)
+        self._batch_rm(serial, est, res, "-rf", 0, "Removendo…")
+        self._evict_sizes(serial, est.paths[:res.items_removed])
 
         self._emit(est.mode, ModeProgress(
             mode=est.mode, phase="complete",
@@ -733,27 +1002,9 @@ class CleanupManager:
     def _clean_files(self, serial: str, est: ModeEstimate) -> ModeResult:
         """Generic file removal (used by junk_files, duplicates)."""
         res = ModeResult(mode=est.mode)
-        total = len(est.items)
-        batch_size = 50
-
-        for i in range(0, total, batch_size):
-            if self._cancel_flag.is_set():
-                break
-            chunk = est.items[i:i + batch_size]
-            targets = " ".join(f"'{item.path}'" for item in chunk)
-            try:
-                self.adb.run_shell(f"rm -f {targets} 2>/dev/null", serial, timeout=30)
-            except Exception as exc:
-                res.errors.append(str(exc))
-            res.items_removed += len(chunk)
-            res.bytes_freed += sum(item.size_bytes for item in chunk)
-            pct = 100 * min((i + batch_size) / max(total, 1), 1.0)
-            self._emit(est.mode, ModeProgress(
-                mode=est.mode, phase="cleaning",
-                message=f"Removendo… {min(i + batch_size, total)}/{total}",
-                percent=pct, items_done=res.items_removed, items_total=total,
-                bytes_freed=res.bytes_freed,
-            ))
+        total = len(est.paths)
+        self._batch_rm(serial, est, res, "-f", 0, "Removendo…")
+        self._evict_sizes(serial, est.paths[:res.items_removed])
 
         self._emit(est.mode, ModeProgress(
             mode=est.mode, phase="complete",
@@ -763,65 +1014,395 @@ class CleanupManager:
         ))
         return res
 
+    def _batch_rm(
+        self,
+        serial: str,
+        est: ModeEstimate,
+        res: ModeResult,
+        flag: str,
+        pct_lo: float,
+        label: str,
+    ):
+        """``rm <flag>`` every path of *est*, as many per call as fit."""
+        mode = est.mode
+        total = len(est.paths)
+        for start, end, targets in _quoted_batches(est.paths):
+            if self._cancel_flag.is_set():
+                break
+            try:
+                self.adb.run_shell(
+                    f"rm {flag} -- {targets} 2>/dev/null", serial, timeout=60,
+                )
+            except Exception as exc:
+                res.errors.append(str(exc))
+            res.items_removed += end - start
+            res.bytes_freed += sum(est.sizes[start:end])
+            self._emit(mode, ModeProgress(
+                mode=mode, phase="cleaning",
+                message=f"{label} {end}/{total}",
+                percent=pct_lo + (100 - pct_lo) * end / max(total, 1),
+                items_done=res.items_removed, items_total=total,
+                bytes_freed=res.bytes_freed,
+            ))
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def _emit(self, mode: CleanupMode, progress: ModeProgress):
         cb = self._progress_cbs.get(mode)
-        if cb:
+        if not cb:
+            return
+        # Throttle intermediate updates per mode.  A throttled update is
+        # held, not lost: a timer delivers it once the interval is up
+        # unless a newer one replaces it, and it goes out first when the
+        # phase changes.  Final states always pass and re-arm the next
+        # run's first update.
+        with self._emit_lock:
+            held = self._held.pop(mode, None)
+            if held is not None and held.phase != progress.phase:
+                self._deliver(cb, held)  # phase change: flush it first
+                held = None
+            if progress.phase in ("complete", "error"):
+                self._last_emit.pop(mode, None)
+            else:
+                now = time.monotonic()
+                last = self._last_emit.get(mode)
+                if held is not None or (last is not None and now - last < _EMIT_INTERVAL):
+                    if held is None:  # first drop in this window: arm the flush
+                        timer = threading.Timer(
+                            _EMIT_INTERVAL - (now - last), self._flush_held, args=(mode,),
+                        )
+                        timer.daemon = True
+                        timer.start()
+                    self._held[mode] = progress
+                    return
+                self._last_emit[mode] = now
+            self._deliver(cb, progress)
+
+    def _flush_held(self, mode: CleanupMode):
+        """Timer callback: deliver the update held back by the throttle."""
+        with self._emit_lock:
+            held = self._held.pop(mode, None)
+            cb = self._progress_cbs.get(mode)
+            if held is None or cb is None:
+                return
+            self._last_emit[mode] = time.monotonic()
+            self._deliver(cb, held)
+
+    @staticmethod
+    def _deliver(cb: ProgressCb, progress: ModeProgress):
+        try:
+            cb(progress)
+        except Exception:
+            pass
+
+    def _per_root(
+        self,
+        mode: CleanupMode,
+        roots: List[str],
+        fn: Callable[[str], Any],
+        pct_lo: float,
+        pct_span: float,
+    ) -> Dict[str, Any]:
+        """Run ``fn(root)`` for *roots* concurrently → ``{root: result}``.
+
+        Uses a small private pool: :meth:`estimate` already runs the modes
+        on the shared I/O pool, and blocking those workers on more tasks
+        queued in the same pool could starve it.
+        """
+        results: Dict[str, Any] = {}
+
+        def _run(root: str) -> Any:
+            if self._cancel_flag.is_set():
+                return None
+            return fn(root)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_ROOT_SCAN_WORKERS, len(roots))),
+        ) as pool:
+            futures = {pool.submit(_run, root): root for root in roots}
+            for done, fut in enumerate(as_completed(futures), 1):
+                root = futures[fut]
+                try:
+                    result = fut.result()
+                except Exception as exc:
+                    log.warning("Scan of %s failed: %s", root, exc)
+                    result = None
+                if result is not None:
+                    results[root] = result
+                self._emit(mode, ModeProgress(
+                    mode=mode, phase="scanning",
+                    message=f"Escaneado {root} ({done}/{len(roots)})",
+                    percent=pct_lo + pct_span * done / max(len(roots), 1),
+                ))
+        return results
+
+    def _index_files(
+        self,
+        serial: str,
+        roots: List[str],
+        use_printf: bool,
+        size_filter: bool = False,
+    ) -> List[Tuple[str, int, int]]:
+        """``(path, size, mtime)`` of every file over 1 KiB under *roots*.
+
+        With *size_filter* (requires *use_printf*) only files whose size
+        occurs at least twice are returned, filtered on the device.
+        """
+        targets = " ".join(_shell_quote(r) for r in roots)
+        # Both forms print "<size>|<mtime>|<path>"
+        if use_printf:
+            cmd = f"find {targets} -type f -printf '%s|%T@|%p\\n' 2>/dev/null"
+            if size_filter:
+                cmd += f" | {_SIZE_DUP_FILTER}"
+        else:
+            cmd = (
+                f"find {targets} -type f 2>/dev/null"
+                f" | xargs stat -c '%s|%Y|%n' 2>/dev/null"
+            )
+        files: List[Tuple[str, int, int]] = []
+        lines = self._shell_lines(cmd, serial, timeout=max(180, 60 * len(roots)))
+        for n, line in enumerate(lines, 1):
+            if n % _PROGRESS_LINES == 0:
+                if self._cancel_flag.is_set():
+                    break
+                if size_filter:
+                    self._emit(CleanupMode.DUPLICATES, ModeProgress(
+                        mode=CleanupMode.DUPLICATES, phase="scanning",
+                        message=f"{n} candidatos a duplicata…",
+                        percent=min(35, 5 + n // _PROGRESS_LINES),
+                    ))
+            size_s, _, rest = line.partition("|")
+            mtime_s, sep, path = rest.partition("|")
+            if not sep:
+                continue
             try:
-                cb(progress)
+                sz = int(size_s)
+                mtime = int(mtime_s.partition(".")[0])
+            except ValueError:
+                continue
+            if sz > 1024:  # skip tiny files
+                files.append((path, sz, mtime))
+        return files
+
+    def _shell_lines(self, cmd: str, serial: str, timeout: int = 60) -> Iterator[str]:
+        """Stripped, non-empty stdout lines of *cmd*, streamed as they arrive."""
+        for raw in self.adb.run_shell_iter(cmd, serial, timeout=timeout):
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                yield line
+
+    def _shell_for_each(
+        self, serial: str, paths: List[str], body: str, timeout: int = 60,
+        per_item_timeout: float = 0,
+    ) -> List[str]:
+        """Run ``for p in <paths>; do <body>; done`` in as few calls as fit.
+
+        With *per_item_timeout*, each call gets at least that many seconds
+        per path in its batch.
+        """
+        lines: List[str] = []
+        for start, end, args in _quoted_batches(paths):
+            if self._cancel_flag.is_set():
+                break
+            out = self.adb.run_shell(
+                f"for p in {args}; do {body}; done", serial,
+                timeout=max(timeout, int(per_item_timeout * (end - start))),
+            )
+            lines.extend(l.rstrip("\r") for l in out.splitlines() if l.strip())
+        return lines
+
+    def _cached_digests(
+        self, serial: str, tool: str, files: List[Tuple[str, int, int]],
+    ) -> Dict[str, str]:
+        """Remembered ``{path: digest}`` for files whose size/mtime still match."""
+        result: Dict[str, str] = {}
+        conn = _open_hash_db()
+        if conn is None or not files:
+            return result
+        wanted = {path: (sz, mtime) for path, sz, mtime in files}
+        paths = list(wanted)
+        try:
+            with conn:
+                for i in range(0, len(paths), 500):
+                    chunk = paths[i:i + 500]
+                    rows = conn.execute(
+                        "SELECT path, size, mtime, digest FROM hashes "
+                        "WHERE serial = ? AND tool = ? AND path IN "
+                        f"({','.join('?' * len(chunk))})",
+                        [serial, tool, *chunk],
+                    )
+                    for path, sz, mtime, digest in rows:
+                        if wanted.get(path) == (sz, mtime):
+                            result[path] = digest
+        except sqlite3.Error as exc:
+            log.debug("Hash cache lookup failed: %s", exc)
+        finally:
+            conn.close()
+        return result
+
+    def _store_digests(
+        self, serial: str, tool: str, rows: List[Tuple[str, int, int, str]],
+    ):
+        """Remember ``(path, size, mtime, digest)`` rows for later scans."""
+        if not rows:
+            return
+        conn = _open_hash_db()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO hashes "
+                    "(serial, path, size, mtime, tool, digest) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(serial, p, sz, mt, tool, d) for p, sz, mt, d in rows],
+                )
+        except sqlite3.Error as exc:
+            log.debug("Hash cache update failed: %s", exc)
+        finally:
+            conn.close()
+
+    def _supports_size_filter(self, serial: str) -> bool:
+        """Whether :data:`_SIZE_DUP_FILTER` works on the device (cached)."""
+        ok = self._size_filter.get(serial)
+        if ok is None:
+            try:
+                out = self.adb.run_shell(
+                    f"printf '2000|/b\\n2000|/a\\n1500|/c\\n' | {_SIZE_DUP_FILTER}",
+                    serial, timeout=15,
+                )
+                ok = out.split() == ["2000|/a", "2000|/b"]
+            except Exception:
+                ok = False
+            self._size_filter[serial] = ok
+        return ok
+
+    def _hash_tool(self, serial: str) -> str:
+        """Fastest hashing command available on the device (cached per serial)."""
+        tool = self._hash_tools.get(serial)
+        if tool is None:
+            tool = "md5sum"
+            try:
+                out = self.adb.run_shell(
+                    f"for t in {' '.join(_HASH_TOOLS)}; do"
+                    f" command -v $t >/dev/null 2>&1 && {{ echo $t; break; }}; done",
+                    serial, timeout=10,
+                )
+                found = out.strip()
+                if found in _HASH_TOOLS:
+                    tool = found
             except Exception:
                 pass
+            self._hash_tools[serial] = tool
+            log.debug("Using %s for duplicate hashing on %s", tool, serial)
+        return tool
+
+    def _prefix_hash_group(self, serial: str, paths: List[str]) -> Dict[str, str]:
+        """Hash of the first ``PREFIX_HASH_BYTES`` of each path → ``{path: hash}``."""
+        body = (
+            f'[ -r "$p" ] || continue; h=$(dd if="$p" bs={PREFIX_HASH_BYTES} count=1 2>/dev/null'
+            f' | {self._hash_tool(serial)}); echo "${{h%% *}}|$p"'
+        )
+        result: Dict[str, str] = {}
+        for line in self._shell_for_each(serial, paths, body, timeout=120):
+            h, sep, path = line.partition("|")
+            if sep and h:
+                result[path] = h
+        return result
 
     def _measure_dirs(self, serial: str, dirs: List[str]) -> Dict[str, int]:
-        result: Dict[str, int] = {}
+        result, cold = self._cached_sizes(serial, dirs)
         batch = 20
-        for i in range(0, len(dirs), batch):
-            chunk = dirs[i:i + batch]
-            targets = " ".join(f"'{d}'" for d in chunk)
-            out = self.adb.run_shell(
+        for i in range(0, len(cold), batch):
+            chunk = cold[i:i + batch]
+            targets = " ".join(_shell_quote(d) for d in chunk)
+            measured = _parse_du_kb(self.adb.run_shell(
                 f"du -sk {targets} 2>/dev/null", serial, timeout=60,
-            )
-            for line in out.splitlines():
-                parts = line.split(None, 1)
-                if len(parts) == 2:
-                    try:
-                        result[parts[1]] = int(parts[0]) * 1024
-                    except ValueError:
-                        pass
+            ))
+            result.update(measured)
+            self._store_du(serial, measured)
         return result
 
-    def _measure_files(self, serial: str, files: List[str]) -> Dict[str, int]:
+    def _cached_sizes(
+        self, serial: str, paths: List[str],
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """Split *paths* into fresh cached sizes and those still to measure."""
         result: Dict[str, int] = {}
-        batch = 50
-        for i in range(0, len(files), batch):
-            chunk = files[i:i + batch]
-            targets = " ".join(f"'{f}'" for f in chunk)
-            out = self.adb.run_shell(
-                f"stat -c '%n|%s' {targets} 2>/dev/null", serial, timeout=30,
-            )
-            for line in out.splitlines():
-                line = line.strip()
-                if "|" not in line:
-                    continue
-                parts = line.rsplit("|", 1)
-                if len(parts) == 2:
-                    try:
-                        result[parts[0]] = int(parts[1])
-                    except ValueError:
-                        pass
+        cold: List[str] = []
+        now = time.time()
+        with self._du_lock:
+            for p in paths:
+                hit = self._du_cache.get((serial, p))
+                if hit and now - hit[1] < _DU_CACHE_TTL:
+                    result[p] = hit[0]
+                else:
+                    cold.append(p)
+        return result, cold
+
+    def _evict_sizes(self, serial: str, paths: List[str]):
+        with self._du_lock:
+            for path in paths:
+                self._du_cache.pop((serial, path), None)
+
+    def _store_du(self, serial: str, sizes: Dict[str, int]):
+        """Record fresh ``du`` results."""
+        now = time.time()
+        with self._du_lock:
+            for path, size in sizes.items():
+                self._du_cache[(serial, path)] = (size, now)
+
+    def _measure_files(self, serial: str, files: List[str]) -> Dict[str, int]:
+        result, cold = self._cached_sizes(serial, files)
+        if not cold:
+            return result
+        measured: Dict[str, int] = {}
+        # One shell for the whole list: NUL-separated names on stdin
+        payload = b"\0".join(f.encode("utf-8") for f in cold)
+        out = self.adb.run_shell_stdin(
+            "xargs -0 stat -c '%n|%s' 2>/dev/null", payload, serial,
+            timeout=max(30, len(cold) // 100),
+        )
+        if out:
+            self._parse_stat_sizes(out, measured)
+        else:
+            # Fallback (no shell stdin on old adb): quoted argument batches
+            for _, _, targets in _quoted_batches(cold):
+                out = self.adb.run_shell(
+                    f"stat -c '%n|%s' {targets} 2>/dev/null", serial, timeout=30,
+                )
+                self._parse_stat_sizes(out, measured)
+        result.update(measured)
+        self._store_du(serial, measured)
         return result
 
-    def _fetch_installed_packages(self, serial: str) -> Optional[Set[str]]:
+    @staticmethod
+    def _parse_stat_sizes(out: str, result: Dict[str, int]) -> None:
+        # One C-level scan over the whole output; malformed lines never match
+        result.update((name, int(size)) for name, size in _STAT_SIZE_RE.findall(out))
+
+    def _list_packages(self, serial: str, fresh: bool = False) -> List[str]:
+        """``pm list packages`` shared by the app-cache and orphan scans."""
+        with self._pkg_lock:
+            cached = self._pkg_lists.get(serial)
+            if not fresh and cached and time.monotonic() - cached[1] < _PKG_CACHE_TTL:
+                return cached[0]
+            pkgs = self.adb.list_packages(serial, third_party=False)
+            self._pkg_lists[serial] = (pkgs, time.monotonic())
+            return pkgs
+
+    def _fetch_installed_packages(self, serial: str) -> Optional[FrozenSet[str]]:
+        cached = self._pkg_cache.get(serial)
+        if cached and time.monotonic() - cached[1] < _PKG_CACHE_TTL:
+            return cached[0]
         for attempt in range(1, 3):
             try:
-                pkgs = self.adb.list_packages(serial, third_party=False)
+                pkgs = self._list_packages(serial, fresh=attempt > 1)
             except Exception as exc:
                 log.warning("list_packages attempt %d failed: %s", attempt, exc)
                 continue
-            pkg_set = set(pkgs)
+            pkg_set = frozenset(pkgs)
             if len(pkg_set) < _MIN_PACKAGES_THRESHOLD:
                 continue
             found_canaries = pkg_set & _CANARY_PACKAGES
@@ -829,9 +1410,10 @@ class CleanupManager:
                 continue
             canary = next(iter(found_canaries))
             check = self.adb.run_shell(
-                f"pm path '{canary}' 2>/dev/null", serial, timeout=10,
+                f"pm path {_shell_quote(canary)} 2>/dev/null", serial, timeout=10,
             )
             if not check.strip():
                 continue
+            self._pkg_cache[serial] = (pkg_set, time.monotonic())
             return pkg_set
         return None
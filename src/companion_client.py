@@ -26,6 +26,7 @@ Usage:
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import json
@@ -33,17 +34,24 @@ import os
 import socket
 import struct
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
-from urllib.parse import urlencode
+from typing import Any, Callable, Optional
+from urllib.parse import quote_plus, urlencode
 
 try:
     import requests
 except ImportError:
     requests = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 try:
     from cryptography.hazmat.primitives.asymmetric import ec
     from cryptography.hazmat.primitives import hashes, serialization
@@ -61,8 +69,114 @@ DEFAULT_HTTP_PORT = 15555
 DEFAULT_TCP_PORT = 15556
 TCP_HEADER_SIZE = 512
 TCP_BUFFER_SIZE = 256 * 1024
+TCP_SOCKET_BUFFER = 4 * 1024 * 1024   # SO_SNDBUF / SO_RCVBUF for transfers
+STREAM_CHUNK_SIZE = 64 * 1024         # HTTP body chunks handed to a sink
 REQUEST_TIMEOUT = 30
 REPLAY_WINDOW_SEC = 300
+WRITEV_BATCH = 4               # received chunks per os.writev() in tcp_pull
+MAX_PARALLEL_DISPATCH = 16     # concurrent dispatches in broadcast_parallel
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _query_string(params: dict) -> str:
+    """``urlencode`` with a fast path for the common all-``str`` case."""
+    try:
+        return "&".join(f"{quote_plus(k)}={quote_plus(v)}" for k, v in params.items())
+    except TypeError:
+        # Non-str values (int, bool, lists…) keep urlencode's str() handling
+        return urlencode(params)
+
+
+def _pad_header(data: bytes) -> bytearray:
+    """Copy an encoded TCP transfer header into a zero-filled TCP_HEADER_SIZE buffer."""
+    buf = bytearray(TCP_HEADER_SIZE)
+    buf[:len(data)] = data
+    return buf
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read up to *size* bytes (fewer only if the peer closes early)."""
+    buf = bytearray(size)
+    mv = memoryview(buf)
+    off = 0
+    while off < size:
+        n = sock.recv_into(mv[off:])
+        if not n:
+            break
+        off += n
+    return bytes(mv[:off])
+
+
+def _recv_to_file(sock: socket.socket, path: str, size: int) -> int:
+    """Receive *size* bytes into *path*; return how many were missing.
+
+    Where ``os.writev`` exists, WRITEV_BATCH received chunks go to disk
+    in one unbuffered syscall; elsewhere (Windows) one write per chunk.
+    """
+    remaining = size
+    if not hasattr(os, "writev"):
+        # One reusable buffer instead of a new bytes object per recv
+        buf = memoryview(bytearray(TCP_BUFFER_SIZE))
+        with open(path, "wb") as f:
+            while remaining > 0:
+                n = sock.recv_into(buf[:min(TCP_BUFFER_SIZE, remaining)])
+                if not n:
+                    break
+                f.write(buf[:n])
+                remaining -= n
+        return remaining
+
+    bufs = [memoryview(bytearray(TCP_BUFFER_SIZE)) for _ in range(WRITEV_BATCH)]
+    pending: list[memoryview] = []
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while remaining > 0:
+            buf = bufs[len(pending)]
+            n = sock.recv_into(buf[:min(TCP_BUFFER_SIZE, remaining)])
+            if not n:
+                break
+            pending.append(buf[:n])
+            remaining -= n
+            if len(pending) == WRITEV_BATCH:
+                _writev_all(fd, pending)
+                pending.clear()
+        if pending:
+            _writev_all(fd, pending)
+    finally:
+        os.close(fd)
+    return remaining
+
+
+def _writev_all(fd: int, views: list[memoryview]) -> None:
+    written = os.writev(fd, views)
+    if written < sum(len(v) for v in views):
+        # Short write: finish the tail with plain writes
+        tail = memoryview(b"".join(views))[written:]
+        while tail:
+            tail = tail[os.write(fd, tail):]
+
+
+def _sha256_file(path: str):
+    """SHA-256 of a whole file (``hashlib.file_digest`` on 3.11+)."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256")
+        sha = hashlib.sha256()
+        for chunk in iter(lambda: f.read(TCP_BUFFER_SIZE), b""):
+            sha.update(chunk)
+        return sha
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -139,6 +253,11 @@ class AgentClient:
         self._base_url = f"http://{host}:{port}"
         self._session = None
 
+        # Local P-256 key pair for peer pairing (generated once, on demand)
+        self._ec_lock = threading.Lock()
+        self._ec_private = None
+        self._ec_public_b64 = ""
+
         # Sub-APIs (lazy init)
         self._files: Optional[FilesApi] = None
         self._apps: Optional[AppsApi] = None
@@ -226,39 +345,68 @@ class AgentClient:
         if self.serial:
             cmd_base.extend(["-s", self.serial])
 
-        for local_port, remote_port in [
-            (self.port, self.port),
-            (DEFAULT_TCP_PORT, DEFAULT_TCP_PORT),
-        ]:
-            cmd = cmd_base + ["forward", f"tcp:{local_port}", f"tcp:{remote_port}"]
-            try:
-                subprocess.run(cmd, check=True, capture_output=True, timeout=10)
-            except Exception as e:
-                raise ConnectionError(f"ADB forward failed: {e}") from e
+        # Both forwards run concurrently; each adb call is mostly
+        # process start-up and a server round-trip
+        procs = []
+        try:
+            for local_port, remote_port in [
+                (self.port, self.port),
+                (DEFAULT_TCP_PORT, DEFAULT_TCP_PORT),
+            ]:
+                cmd = cmd_base + ["forward", f"tcp:{local_port}", f"tcp:{remote_port}"]
+                procs.append(subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                ))
+            for proc in procs:
+                _, err = proc.communicate(timeout=10)
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, proc.args, stderr=err,
+                    )
+        except Exception as e:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+            raise ConnectionError(f"ADB forward failed: {e}") from e
 
     def disconnect(self):
         """Clean up ADB port forwarding."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         if self.host in ("127.0.0.1", "localhost", "::1"):
             cmd_base = [self.adb_path]
             if self.serial:
                 cmd_base.extend(["-s", self.serial])
+            procs = []
             for port in (self.port, DEFAULT_TCP_PORT):
                 try:
-                    subprocess.run(
+                    procs.append(subprocess.Popen(
                         cmd_base + ["forward", "--remove", f"tcp:{port}"],
-                        capture_output=True, timeout=10
-                    )
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    ))
                 except Exception:
                     pass
+            for proc in procs:
+                try:
+                    proc.communicate(timeout=10)
+                except Exception:
+                    proc.kill()
 
     # ── HTTP primitives ───────────────────────────────────────────────
 
-    def _headers(self) -> dict[str, str]:
-        """Build request headers with authentication."""
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @token.setter
+    def token(self, value: str):
+        # Request headers are built once per token, not per call
+        self._token = value
         h = {"Content-Type": "application/json"}
-        if self.token:
-            h["X-Agent-Token"] = self.token
-        return h
+        if value:
+            h["X-Agent-Token"] = value
+        self._headers_cache = h
 
     def get(self, endpoint: str, params: dict | None = None, **kwargs) -> AgentResponse:
         """HTTP GET request to the agent."""
@@ -276,39 +424,60 @@ class AgentClient:
         json_data: dict | None = None,
         stream: bool = False,
         timeout: int | None = None,
+        sink: Callable[[bytes], Any] | None = None,
     ) -> AgentResponse:
-        """Core HTTP request method."""
+        """Core HTTP request method.
+
+        With *stream* and a *sink*, a successful body is passed to *sink*
+        chunk by chunk instead of being kept in ``AgentResponse.raw``.
+        """
         url = f"{self._base_url}{endpoint}"
         if params:
-            url += "?" + urlencode(params)
+            url += "?" + _query_string(params)
 
         _timeout = timeout or self.timeout
 
         if requests is not None:
-            return self._request_via_requests(method, url, json_data, stream, _timeout)
+            return self._request_via_requests(method, url, json_data, stream, _timeout, sink)
         else:
-            return self._request_via_urllib(method, url, json_data, _timeout)
+            return self._request_via_urllib(method, url, json_data, _timeout, stream, sink)
+
+    def _get_session(self):
+        """Shared keep-alive ``requests.Session`` (created on first use)."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=16,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
 
     def _request_via_requests(
-        self, method, url, json_data, stream, timeout
+        self, method, url, json_data, stream, timeout, sink=None
     ) -> AgentResponse:
         """Use the requests library if available."""
         try:
-            resp = requests.request(
+            resp = self._get_session().request(
                 method, url,
-                headers=self._headers(),
-                json=json_data,
+                headers=self._headers_cache,
+                data=_json_dumps(json_data) if json_data is not None else None,
                 stream=stream,
                 timeout=timeout,
             )
-            if stream:
+            if stream and resp.ok and sink is not None:
+                for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    sink(chunk)
+                return AgentResponse(ok=True, status_code=resp.status_code)
+            if stream and resp.ok:
                 return AgentResponse(
                     ok=resp.ok,
                     status_code=resp.status_code,
                     raw=resp.content,
                 )
             try:
-                data = resp.json()
+                data = _json_loads(resp.content)
             except Exception:
                 data = {"raw": resp.text}
             return AgentResponse(
@@ -324,27 +493,35 @@ class AgentClient:
         except Exception as e:
             return AgentResponse(ok=False, status_code=0, error=str(e))
 
-    def _request_via_urllib(self, method, url, json_data, timeout) -> AgentResponse:
+    def _request_via_urllib(
+        self, method, url, json_data, timeout, stream=False, sink=None
+    ) -> AgentResponse:
         """Fallback using urllib (no external deps)."""
         import urllib.request
         import urllib.error
 
-        req = urllib.request.Request(url, method=method, headers=self._headers())
+        req = urllib.request.Request(url, method=method, headers=self._headers_cache)
         if json_data:
-            req.data = json.dumps(json_data).encode()
+            req.data = _json_dumps(json_data)
 
         try:
             with urllib.request.urlopen(req, timeout=timeout) as resp:
+                if stream and sink is not None:
+                    for chunk in iter(lambda: resp.read(STREAM_CHUNK_SIZE), b""):
+                        sink(chunk)
+                    return AgentResponse(ok=True, status_code=resp.status)
                 body = resp.read()
+                if stream:
+                    return AgentResponse(ok=True, status_code=resp.status, raw=body)
                 try:
-                    data = json.loads(body)
+                    data = _json_loads(body)
                 except Exception:
                     data = {"raw": body.decode(errors="replace")}
                 return AgentResponse(ok=True, status_code=resp.status, data=data)
         except urllib.error.HTTPError as e:
             body = e.read().decode(errors="replace")
             try:
-                data = json.loads(body)
+                data = _json_loads(body)
             except Exception:
                 data = {"raw": body}
             return AgentResponse(
@@ -354,11 +531,82 @@ class AgentClient:
         except Exception as e:
             return AgentResponse(ok=False, status_code=0, error=str(e))
 
+    # ── Peer crypto (ECDH) ────────────────────────────────────────────
+
+    def _get_ec_private(self):
+        """Local EC P-256 private key, generated on first use and reused."""
+        if not HAS_CRYPTO:
+            raise RuntimeError("cryptography package required for peer pairing")
+        with self._ec_lock:
+            if self._ec_private is None:
+                key = ec.generate_private_key(ec.SECP256R1())
+                der = key.public_key().public_bytes(
+                    serialization.Encoding.DER,
+                    serialization.PublicFormat.SubjectPublicKeyInfo,
+                )
+                self._ec_public_b64 = base64.b64encode(der).decode("ascii")
+                self._ec_private = key
+            return self._ec_private
+
+    @property
+    def public_key(self) -> str:
+        """Base64 X.509 public key, the format the agent exchanges."""
+        self._get_ec_private()
+        return self._ec_public_b64
+
+    def derive_shared_secret(self, peer_public_key: str) -> str:
+        """ECDH with a peer's base64 public key → hex shared secret.
+
+        Matches the agent's PairingManager: SHA-256 of the raw ECDH output.
+        """
+        peer = serialization.load_der_public_key(base64.b64decode(peer_public_key))
+        raw = self._get_ec_private().exchange(ec.ECDH(), peer)
+        return hashlib.sha256(raw).hexdigest()
+
     # ── Core endpoints ────────────────────────────────────────────────
 
     def ping(self) -> AgentResponse:
         return self.get("/api/ping")
 
+    def batch(self, calls: list[tuple[str, str, dict | None]]) -> list[AgentResponse]:
+        """Run several ``(method, endpoint, params_or_body)`` calls in one request.
+
+        GET entries send the dict as query params, others as JSON body.
+        Agents without ``/api/batch`` (404) get the calls one by one.
+        """
+        if not calls:
+            return []
+        payload = []
+        for method, endpoint, arg in calls:
+            entry: dict[str, Any] = {"method": method.upper(), "endpoint": endpoint}
+            if arg:
+                entry["params" if method.upper() == "GET" else "body"] = arg
+            payload.append(entry)
+
+        resp = self.post("/api/batch", {"calls": payload})
+        if resp.status_code == 404:
+            return [
+                self.get(endpoint, arg) if method.upper() == "GET"
+                else self._request(method.upper(), endpoint, json_data=arg)
+                for method, endpoint, arg in calls
+            ]
+        results = resp.get("results")
+        if not resp.ok or not isinstance(results, list) or len(results) != len(calls):
+            return [AgentResponse(ok=False, status_code=resp.status_code,
+                                  error=resp.error or "Invalid batch response")
+                    for _ in calls]
+        out: list[AgentResponse] = []
+        for item in results:
+            status = item.get("status", 0) if isinstance(item, dict) else 0
+            data = item.get("data") if isinstance(item, dict) else None
+            out.append(AgentResponse(
+                ok=200 <= status < 300,
+                status_code=status,
+                data=data,
+                error=data.get("error", "") if isinstance(data, dict) else "",
+            ))
+        return out
+
     # ── TCP Transfer ──────────────────────────────────────────────────
 
     def tcp_push(self, local_path: str, remote_path: str) -> dict:
@@ -368,7 +616,7 @@ class AgentClient:
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
         size = local.stat().st_size
-        header = json.dumps({
+        header = _json_dumps({
             "op": "push",
             "path": remote_path,
             "size": size,
@@ -377,42 +625,35 @@ class AgentClient:
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Set before connect so the window scale is negotiated for it
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SOCKET_BUFFER)
         sock.settimeout(self.timeout + size // (1024 * 1024))  # +1s per MB
         sock.connect((self.host, DEFAULT_TCP_PORT))
 
         try:
             # Send header (padded to 512 bytes)
-            header_bytes = header.encode().ljust(TCP_HEADER_SIZE, b"\x00")
-            sock.sendall(header_bytes)
-
-            # Stream file
-            sha = hashlib.sha256()
-            with open(local_path, "rb") as f:
-                while True:
-                    chunk = f.read(TCP_BUFFER_SIZE)
-                    if not chunk:
-                        break
-                    sock.sendall(chunk)
-                    sha.update(chunk)
-
-            # Send hash footer
-            sock.sendall(sha.digest())
+            sock.sendall(_pad_header(header))
 
-            # Read response header
-            resp_bytes = b""
-            while len(resp_bytes) < TCP_HEADER_SIZE:
-                chunk = sock.recv(TCP_HEADER_SIZE - len(resp_bytes))
-                if not chunk:
-                    break
-                resp_bytes += chunk
+            # Stream file with sendfile(2) while a second thread hashes
+            # it (hashing releases the GIL); the digest is only needed
+            # for the footer
+            with ThreadPoolExecutor(max_workers=1) as hasher:
+                sha_future = hasher.submit(_sha256_file, local_path)
+                with open(local_path, "rb") as f:
+                    sock.sendfile(f)
 
-            return json.loads(resp_bytes.decode().strip("\x00"))
+                # Send hash footer
+                sock.sendall(sha_future.result().digest())
+
+            # Read response header
+            resp_bytes = _recv_exact(sock, TCP_HEADER_SIZE)
+            return _json_loads(resp_bytes.strip(b"\x00"))
         finally:
             sock.close()
 
     def tcp_pull(self, remote_path: str, local_path: str) -> dict:
         """Pull a file over TCP for maximum speed."""
-        header = json.dumps({
+        header = _json_dumps({
             "op": "pull",
             "path": remote_path,
             "token": self.token,
@@ -420,23 +661,18 @@ class AgentClient:
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Set before connect so the window scale is negotiated for it
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TCP_SOCKET_BUFFER)
         sock.settimeout(self.timeout)
         sock.connect((self.host, DEFAULT_TCP_PORT))
 
         try:
             # Send header
-            header_bytes = header.encode().ljust(TCP_HEADER_SIZE, b"\x00")
-            sock.sendall(header_bytes)
+            sock.sendall(_pad_header(header))
 
             # Read response header
-            resp_bytes = b""
-            while len(resp_bytes) < TCP_HEADER_SIZE:
-                chunk = sock.recv(TCP_HEADER_SIZE - len(resp_bytes))
-                if not chunk:
-                    break
-                resp_bytes += chunk
-
-            resp = json.loads(resp_bytes.decode().strip("\x00"))
+            resp_bytes = _recv_exact(sock, TCP_HEADER_SIZE)
+            resp = _json_loads(resp_bytes.strip(b"\x00"))
             if resp.get("status") == "error":
                 return resp
 
@@ -444,28 +680,14 @@ class AgentClient:
 
             # Stream to file
             os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
-            sha = hashlib.sha256()
-            remaining = size
-
-            with open(local_path, "wb") as f:
-                while remaining > 0:
-                    to_read = min(TCP_BUFFER_SIZE, remaining)
-                    chunk = sock.recv(to_read)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    sha.update(chunk)
-                    remaining -= len(chunk)
+            remaining = _recv_to_file(sock, local_path, size)
 
             # Read hash footer
-            hash_bytes = b""
-            while len(hash_bytes) < 32:
-                chunk = sock.recv(32 - len(hash_bytes))
-                if not chunk:
-                    break
-                hash_bytes += chunk
+            hash_bytes = _recv_exact(sock, 32)
 
-            local_hash = sha.hexdigest()
+            # Hash the written file in one pass (OpenSSL, GIL released)
+            # instead of per received chunk
+            local_hash = _sha256_file(local_path).hexdigest()
             remote_hash = hash_bytes.hex() if len(hash_bytes) == 32 else ""
 
             return {
@@ -587,10 +809,16 @@ class DeviceApi(_SubApi):
         return self._c.get("/api/device/storage")
 
     def screenshot(self, save_path: str = "") -> AgentResponse:
-        resp = self._c.get("/api/device/screen")
-        if resp.ok and save_path and resp.raw:
-            with open(save_path, "wb") as f:
-                f.write(resp.raw)
+        """Capture the screen (PNG); streamed straight to *save_path* if given."""
+        if not save_path:
+            return self._c.get("/api/device/screen", stream=True)
+        with open(save_path, "wb") as f:
+            resp = self._c.get("/api/device/screen", stream=True, sink=f.write)
+        if not resp.ok:
+            try:
+                os.remove(save_path)
+            except OSError:
+                pass
         return resp
 
     def permissions(self) -> AgentResponse:
@@ -640,11 +868,11 @@ class PeerApi(_SubApi):
     def identity(self) -> AgentResponse:
         return self._c.get("/api/peer/identity")
 
-    def pair_init(self, device_id: str, label: str, public_key: str) -> AgentResponse:
+    def pair_init(self, device_id: str, label: str, public_key: str = "") -> AgentResponse:
         return self._c.post("/api/peer/pair-init", {
             "device_id": device_id,
             "label": label,
-            "public_key": public_key,
+            "public_key": public_key or self._c.public_key,
         })
 
     def pair_pending(self) -> AgentResponse:
@@ -684,6 +912,25 @@ class OrchestratorApi(_SubApi):
             "endpoint": endpoint,
         })
 
+    def broadcast_parallel(
+        self, method: str, endpoint: str, device_ids: list[str],
+        body: dict | None = None,
+    ) -> dict[str, AgentResponse]:
+        """Dispatch the same call to each of *device_ids* concurrently.
+
+        Unlike :meth:`broadcast` (all trusted peers), only the listed
+        devices are called; returns ``{device_id: response}``.
+        """
+        if not device_ids:
+            return {}
+        workers = min(MAX_PARALLEL_DISPATCH, len(device_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                did: pool.submit(self.dispatch, did, method, endpoint, body)
+                for did in device_ids
+            }
+            return {did: fut.result() for did, fut in futures.items()}
+
     def transfer(self, source_id: str, target_id: str, data_type: str, params: dict | None = None) -> AgentResponse:
         return self._c.post("/api/orchestrator/transfer", {
             "source_device_id": source_id,
@@ -700,6 +947,14 @@ class OrchestratorApi(_SubApi):
     def status(self) -> AgentResponse:
         return self._c.get("/api/orchestrator/status")
 
+    def overview(self) -> tuple[AgentResponse, AgentResponse]:
+        """``(topology, status)`` in a single round-trip."""
+        topology, status = self._c.batch([
+            ("GET", "/api/orchestrator/topology", None),
+            ("GET", "/api/orchestrator/status", None),
+        ])
+        return topology, status
+
     def sync(self, data_type: str, device_ids: list[str] | None = None,
              direction: str = "source_to_targets", source_id: str = "") -> AgentResponse:
         return self._c.post("/api/orchestrator/sync", {
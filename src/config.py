@@ -2,14 +2,36 @@
 config.py - Application configuration and settings.
 """
 
+import atexit
 import json
 import logging
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 log = logging.getLogger("adb_toolkit.config")
 
-DEFAULT_CONFIG = {
+_SAVE_DEBOUNCE = 0.2  # seconds — coalesces bursts of set() into one write
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of a defaults tree (dicts → mappingproxy, lists → tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+DEFAULT_CONFIG = _freeze({
     "app": {
         "name": "ADB Toolkit",
         "version": "1.3.0",
@@ -67,7 +89,16 @@ DEFAULT_CONFIG = {
         "enabled": True,
         "prefer_hyperv": False,
     },
-}
+})
+
+# Pure-JSON snapshot of the defaults; every Config gets a fresh tree from
+# it (json.loads beats copy.deepcopy for plain dict/list/str trees)
+_DEFAULT_TEMPLATE_JSON = json.dumps(DEFAULT_CONFIG, default=dict)
+
+
+def _default_tree() -> Dict[str, Any]:
+    """A private, mutable copy of DEFAULT_CONFIG."""
+    return json.loads(_DEFAULT_TEMPLATE_JSON)
 
 
 class Config:
@@ -77,42 +108,81 @@ class Config:
         self.config_path = config_path or (
             Path(__file__).resolve().parent.parent / "config.json"
         )
-        self._data: Dict[str, Any] = {}
-        self.load()
+        # Loaded on first access (see ``data``)
+        self._data: Optional[Dict[str, Any]] = None
+        self._load_lock = threading.Lock()
+        # Memoized dot-notation lookups, keyed by a generation that every
+        # change bumps: a get() racing a set() can only cache its stale
+        # result under the old generation, which no later get() asks for.
+        # typed: get(k, 0), get(k, False) and get(k, 0.0) hash equal but
+        # must not hand back each other's default.
+        self._generation = 0
+        self._get_cached = lru_cache(maxsize=256, typed=True)(self._get_impl)
+        # Debounced save state
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # Bytes currently on disk, so unchanged trees are not rewritten
+        self._last_saved_bytes: Optional[bytes] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The config tree, loading it from disk on first access."""
+        if self._data is None:
+            with self._load_lock:
+                if self._data is None:
+                    self.load()
+        return self._data
 
     def load(self):
         """Load config from file, creating defaults if needed."""
         if self.config_path.exists():
             try:
-                self._data = json.loads(
-                    self.config_path.read_text(encoding="utf-8")
-                )
-                # Merge with defaults for any missing keys
-                self._data = self._deep_merge(DEFAULT_CONFIG, self._data)
+                raw = self.config_path.read_bytes()
+                self._last_saved_bytes = raw
+                loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                # Merge with defaults for any missing keys (published only
+                # once complete — ``data`` readers skip the lock)
+                self._data = self._deep_merge(_default_tree(), loaded)
                 log.info("Config loaded from %s", self.config_path)
             except Exception as exc:
                 log.warning("Failed to load config: %s. Using defaults.", exc)
-                self._data = DEFAULT_CONFIG.copy()
+                self._data = _default_tree()
         else:
-            self._data = DEFAULT_CONFIG.copy()
+            self._data = _default_tree()
             self.save()
+        self._invalidate_lookups()
 
     def save(self):
-        """Save current config to file."""
+        """Save current config to file (skipped when nothing changed)."""
         try:
+            if orjson is not None:
+                payload = orjson.dumps(
+                    self.data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            else:
+                payload = json.dumps(
+                    self.data, indent=2, ensure_ascii=False
+                ).encode("utf-8")
+            if payload == self._last_saved_bytes:
+                return
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            self.config_path.write_text(
-                json.dumps(self._data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            self.config_path.write_bytes(payload)
+            self._last_saved_bytes = payload
         except Exception as exc:
             log.warning("Failed to save config: %s", exc)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value using dot notation (e.g., 'backup.default_dir')."""
-        keys = key.split(".")
-        value = self._data
-        for k in keys:
+        try:
+            return self._get_cached(key, default, self._generation)
+        except TypeError:  # unhashable default
+            return self._get_impl(key, default, self._generation)
+
+    def _get_impl(self, key: str, default: Any, generation: int) -> Any:
+        value = self.data
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -122,20 +192,95 @@ class Config:
     def set(self, key: str, value: Any):
         """Set a config value using dot notation."""
         keys = key.split(".")
-        d = self._data
+        d = self.data
         for k in keys[:-1]:
             if k not in d or not isinstance(d[k], dict):
                 d[k] = {}
             d = d[k]
         d[keys[-1]] = value
-        self.save()
+        self._invalidate_lookups()
+        self._schedule_save()
+
+    def _invalidate_lookups(self):
+        """Retire every memoized get() result (call after changing _data)."""
+        self._generation += 1
+        self._get_cached.cache_clear()
+
+    # ------------------------------------------------------------------
+    # Debounced persistence
+    # ------------------------------------------------------------------
+    def _schedule_save(self):
+        """Mark dirty and (re)arm the save timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(_SAVE_DEBOUNCE, self._flush_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_save(self):
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_timer = None
+            self.save()
+
+    def flush(self):
+        """Write pending changes now.
+
+        Instances from :func:`get_config` are flushed at interpreter exit;
+        call this on shutdown for a Config built directly.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+        self._flush_save()
 
     def _deep_merge(self, base: dict, override: dict) -> dict:
-        """Deep merge override into base."""
-        result = base.copy()
-        for k, v in override.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                result[k] = self._deep_merge(result[k], v)
-            else:
-                result[k] = v
+        """Deep merge override into base (iterative, in place); returns base."""
+        result = base
+        stack = [(result, override)]
+        while stack:
+            dst, src = stack.pop()
+            # Scalar overrides land in one update() call so dst grows
+            # (and rehashes) at most once per level
+            flat = {}
+            for k, v in src.items():
+                if isinstance(v, dict) and isinstance(dst.get(k), dict):
+                    stack.append((dst[k], v))
+                else:
+                    flat[k] = v
+            dst.update(flat)
         return result
+
+
+# ---------------------------------------------------------------------------
+# Shared instances
+# ---------------------------------------------------------------------------
+# Instances handed out by get_config(), flushed once at interpreter exit
+_shared_configs: "weakref.WeakSet[Config]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_shared_configs():
+    for config in list(_shared_configs):
+        config.flush()
+
+
+@lru_cache(maxsize=4)
+def _config_for(path: Optional[str]) -> Config:
+    config = Config(Path(path) if path else None)
+    _shared_configs.add(config)
+    return config
+
+
+def get_config(path: Optional[Path] = None) -> Config:
+    """Return the shared Config for *path* (default: project config.json)."""
+    return _config_for(str(Path(path).resolve()) if path else None)
+
+
+def invalidate_config_cache():
+    """Drop shared instances so the next get_config() re-reads from disk."""
+    _config_for.cache_clear()
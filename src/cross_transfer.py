@@ -17,16 +17,26 @@ Uses:
 """
 
 import logging
-import re
+import mmap
+import os
+import sqlite3
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 from .device_interface import (
+    CalendarEvent,
     DeviceInterface,
     DeviceManager,
     DevicePlatform,
@@ -36,17 +46,91 @@ from .format_converter import (
     CalendarConverter,
     PhotoConverter,
     SMSConverter,
-    VCardConverter,
 )
-from .adb_base import _sanitize_filename, _long_path_str
+from .adb_base import _SLOTS, _long_path_str, _sanitize_filename, _shell_quote
 
 log = logging.getLogger("adb_toolkit.cross_transfer")
 
+# Media pipeline workers when not configured (0 = auto)
+_MAX_AUTO_LINK_WORKERS = 8     # concurrent pulls / pushes per device link
+
+# Steps that export through content providers / backups rather than the
+# media folders; these run alongside the (sequential) media steps
+_METADATA_STEPS = frozenset({"contacts", "sms", "calendar"})
+_METADATA_WORKERS = 3
+
+# Files per ``adb pull`` when the source is Android; small enough that the
+# convert/push stages start early, large enough to amortize the sync setup
+_MEDIA_PULL_BATCH = 32
+
+# Per-job conversion output dir: "<staged file><suffix>/"
+_CONVERT_DIR_SUFFIX = ".conv"
+
+_EMIT_INTERVAL = 0.05  # seconds — per-file progress is capped at ~20 Hz
+
+# Files already delivered to a target, keyed by source path and trusted
+# while the source size and mtime are unchanged and the target copy is
+# still there with the size it was pushed with (lives in work_dir)
+_XFER_DB_NAME = ".xfer_cache.sqlite3"
+
+# Android calendar content-provider rows (``content query`` output)
+# rows look like ``Row: 0 title=…, dtstart=…, dtend=…, eventLocation=…``
+_CAL_FIELDS = frozenset({"title", "dtstart", "dtend", "eventLocation"})
+
+
+def _count_vcards(path: Path) -> int:
+    """Count BEGIN:VCARD markers without parsing the file."""
+    marker = b"BEGIN:VCARD"
+    count = 0
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(marker)
+                while pos != -1:
+                    count += 1
+                    pos = mm.find(marker, pos + len(marker))
+    except (OSError, ValueError):  # missing / empty file
+        return 0
+    return count
+
+
+def _convert_media(local_file: str, tgt_platform: str) -> str:
+    """Process-pool worker: convert *local_file* (HEIC → JPEG).
+
+    The result goes to a directory of its own next to the file, so
+    ``IMG_1.HEIC`` → ``IMG_1.jpg`` never lands on a pulled ``IMG_1.JPG``
+    (case-insensitive filesystems) that another job is still pushing.
+    """
+    return str(PhotoConverter.convert_if_needed(
+        Path(local_file), tgt_platform, Path(local_file + _CONVERT_DIR_SUFFIX),
+    ))
+
+
+def _open_xfer_db(work_dir: Path) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the delivered-files cache."""
+    try:
+        conn = sqlite3.connect(str(work_dir / _XFER_DB_NAME), timeout=5)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(delivered)")}
+        if columns and "tgt_path" not in columns:
+            conn.execute("DROP TABLE delivered")  # cache from an older layout
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS delivered ("
+            "src_serial TEXT, remote_path TEXT, tgt_serial TEXT, "
+            "size INTEGER, mtime REAL, tgt_path TEXT, tgt_size INTEGER, "
+            "PRIMARY KEY (src_serial, remote_path, tgt_serial))"
+        )
+        return conn
+    except sqlite3.Error as exc:
+        log.debug("Transfer cache unavailable: %s", exc)
+        return None
+
+
 
 # ---------------------------------------------------------------------------
 # Progress model
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(**_SLOTS)
 class CrossTransferProgress:
     """Progress of a cross-platform transfer."""
     phase: str = ""
@@ -67,7 +151,7 @@ class CrossTransferProgress:
 # ---------------------------------------------------------------------------
 # Transfer config
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(**_SLOTS)
 class CrossTransferConfig:
     """What to transfer cross-platform."""
     photos: bool = True
@@ -88,14 +172,29 @@ class CrossTransferConfig:
 class CrossPlatformTransferManager:
     """Manages transfers between devices of different platforms."""
 
-    def __init__(self, device_manager: DeviceManager, work_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        device_manager: DeviceManager,
+        work_dir: Optional[Path] = None,
+        pull_workers: int = 0,
+        push_workers: int = 0,
+    ):
         self.dm = device_manager
         self.work_dir = work_dir or Path("transfers")
         self.work_dir.mkdir(parents=True, exist_ok=True)
+        cores = os.cpu_count() or 4
+        self._pull_workers = pull_workers or min(cores, _MAX_AUTO_LINK_WORKERS)
+        self._push_workers = push_workers or min(cores, _MAX_AUTO_LINK_WORKERS)
+        self._convert_workers = cores
+        # HEIC decoding is CPU-bound: created on first use, closed per transfer
+        self._convert_pool: Optional[ProcessPoolExecutor] = None
+        self._convert_pool_lock = threading.Lock()
         self._cancel_flag = threading.Event()
         self._progress_cb: Optional[Callable[[CrossTransferProgress], None]] = None
         self._progress = CrossTransferProgress()
+        self._progress_lock = threading.Lock()
         self._start_time: Optional[float] = None
+        self._last_emit = 0.0
 
     def set_progress_callback(self, cb: Callable[[CrossTransferProgress], None]):
         self._progress_cb = cb
@@ -103,14 +202,35 @@ class CrossPlatformTransferManager:
     def cancel(self):
         self._cancel_flag.set()
 
+    def _get_convert_pool(self) -> ProcessPoolExecutor:
+        with self._convert_pool_lock:
+            if self._convert_pool is None:
+                self._convert_pool = ProcessPoolExecutor(max_workers=self._convert_workers)
+            return self._convert_pool
+
+    def _shutdown_convert_pool(self):
+        with self._convert_pool_lock:
+            pool, self._convert_pool = self._convert_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _emit_throttled(self):
+        """``_emit`` for per-file updates; drops calls closer than _EMIT_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_emit > _EMIT_INTERVAL:
+            self._last_emit = now
+            self._emit()
+
     def _emit(self):
-        if self._start_time is not None:
-            self._progress.elapsed_seconds = time.time() - self._start_time
-        if self._progress_cb:
-            try:
-                self._progress_cb(self._progress)
-            except Exception:
-                pass
+        # Steps may run concurrently; keep callbacks serialized
+        with self._progress_lock:
+            if self._start_time is not None:
+                self._progress.elapsed_seconds = time.time() - self._start_time
+            if self._progress_cb:
+                try:
+                    self._progress_cb(self._progress)
+                except Exception:
+                    pass
 
     # ------------------------------------------------------------------
     # Main transfer entry point
@@ -197,22 +317,50 @@ class CrossPlatformTransferManager:
             )))
 
         total_steps = len(steps)
-        for idx, (key, label, fn) in enumerate(steps):
+        done_steps = 0
+
+        def _run_step(key: str, label: str, fn: Callable) -> bool:
+            nonlocal done_steps
             if self._cancel_flag.is_set():
-                break
+                return True
             self._progress.phase = key
             self._progress.sub_phase = label
-            self._progress.percent = idx / total_steps * 100
             self._emit()
 
             try:
-                ok = fn()
-                if not ok:
-                    overall_ok = False
+                ok = bool(fn())
             except Exception as exc:
                 log.warning("Cross-transfer step '%s' failed: %s", key, exc)
                 self._progress.errors.append(f"{label}: {exc}")
-                overall_ok = False
+                ok = False
+            with self._progress_lock:
+                done_steps += 1
+                self._progress.percent = done_steps / total_steps * 100
+            return ok
+
+        # Metadata steps (contacts/SMS/calendar) use separate device
+        # subsystems, so they run on a small pool while the media steps,
+        # which share the USB link, run here one after another.  iOS
+        # steps share one lockdown client and backup dir per device, so
+        # with an iOS side every step runs in order on this thread.
+        if DevicePlatform.IOS in (src_iface.platform(), tgt_iface.platform()):
+            meta_steps = []
+            media_steps = steps
+        else:
+            meta_steps = [s for s in steps if s[0] in _METADATA_STEPS]
+            media_steps = [s for s in steps if s[0] not in _METADATA_STEPS]
+        with ThreadPoolExecutor(max_workers=_METADATA_WORKERS) as pool:
+            meta_futures = [pool.submit(_run_step, *step) for step in meta_steps]
+            for step in media_steps:
+                if self._cancel_flag.is_set():
+                    break
+                if not _run_step(*step):
+                    overall_ok = False
+            for fut in meta_futures:
+                if not fut.result():
+                    overall_ok = False
+
+        self._shutdown_convert_pool()
 
         # --- Finish ---
         self._progress.phase = "complete" if overall_ok else "complete_with_errors"
@@ -252,9 +400,7 @@ class CrossPlatformTransferManager:
         self._progress.current_item = "Importando contatos..."
         self._emit()
 
-        # Verify the VCF has content
-        contacts = VCardConverter.parse_vcf(vcf_path)
-        log.info("Transferring %d contacts", len(contacts))
+        log.info("Transferring %d contacts", _count_vcards(vcf_path))
 
         return tgt.import_contacts(tgt_serial, vcf_path)
 
@@ -325,25 +471,33 @@ class CrossPlatformTransferManager:
                 if out and "Error" not in out:
                     events: List[CalendarEvent] = []
                     for line in out.splitlines():
-                        ev = CalendarEvent()
-                        m = re.search(r"title=([^,}]+)", line)
-                        if m:
-                            ev.summary = m.group(1).strip()
-                        m = re.search(r"dtstart=(\d+)", line)
-                        if m:
+                        # Plain splits per row; the first occurrence of a key
+                        # wins and pieces without "=" (commas inside a
+                        # value) are dropped
+                        fields: Dict[str, str] = {}
+                        for pair in line.split(", "):
+                            key, sep, value = pair.partition("=")
+                            if not sep:
+                                continue
+                            key = key.rsplit(None, 1)[-1] if key.strip() else ""
+                            if key in _CAL_FIELDS:
+                                fields.setdefault(key, value.strip())
+                        title = fields.get("title")
+                        if not title:
+                            continue
+                        ev = CalendarEvent(summary=title)
+                        start = fields.get("dtstart", "")
+                        if start.isdigit():
                             ev.dtstart = datetime.fromtimestamp(
-                                int(m.group(1)) / 1000, tz=timezone.utc
+                                int(start) / 1000, tz=timezone.utc
                             ).strftime("%Y%m%dT%H%M%SZ")
-                        m = re.search(r"dtend=(\d+)", line)
-                        if m:
+                        end = fields.get("dtend", "")
+                        if end.isdigit():
                             ev.dtend = datetime.fromtimestamp(
-                                int(m.group(1)) / 1000, tz=timezone.utc
+                                int(end) / 1000, tz=timezone.utc
                             ).strftime("%Y%m%dT%H%M%SZ")
-                        m = re.search(r"eventLocation=([^,}]+)", line)
-                        if m:
-                            ev.location = m.group(1).strip()
-                        if ev.summary:
-                            events.append(ev)
+                        ev.location = fields.get("eventLocation", "")
+                        events.append(ev)
 
                     if events:
                         ics_path = CalendarConverter.write_ics(events, cal_dir / "calendar.ics")
@@ -354,9 +508,99 @@ class CrossPlatformTransferManager:
         self._progress.warnings.append("Exportação de calendário não disponível")
         return True
 
+    # ------------------------------------------------------------------
+    # Delivered-files cache (skip unchanged files on retries/resumes)
+    # ------------------------------------------------------------------
+    def _load_delivered(
+        self, src_serial: str, tgt_serial: str,
+    ) -> Dict[str, Tuple[int, float, str, int]]:
+        """``{remote_path: (size, mtime, tgt_path, tgt_size)}`` already
+        delivered to *tgt_serial*."""
+        conn = _open_xfer_db(self.work_dir)
+        if conn is None:
+            return {}
+        try:
+            rows = conn.execute(
+                "SELECT remote_path, size, mtime, tgt_path, tgt_size FROM delivered "
+                "WHERE src_serial = ? AND tgt_serial = ?",
+                (src_serial, tgt_serial),
+            )
+            return {path: (sz, mt, tp, ts) for path, sz, mt, tp, ts in rows}
+        except sqlite3.Error as exc:
+            log.debug("Transfer cache lookup failed: %s", exc)
+            return {}
+        finally:
+            conn.close()
+
+    def _store_delivered(
+        self, src_serial: str, tgt_serial: str,
+        rows: List[Tuple[str, int, float, str, int]],
+    ):
+        """Remember ``(remote_path, size, mtime, tgt_path, tgt_size)`` rows
+        as delivered."""
+        if not rows:
+            return
+        conn = _open_xfer_db(self.work_dir)
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO delivered "
+                    "(src_serial, remote_path, tgt_serial, size, mtime, "
+                    "tgt_path, tgt_size) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (src_serial, p, tgt_serial, sz, mt, tp, ts)
+                        for p, sz, mt, tp, ts in rows
+                    ],
+                )
+        except sqlite3.Error as exc:
+            log.debug("Transfer cache update failed: %s", exc)
+        finally:
+            conn.close()
+
     # ------------------------------------------------------------------
     # Step: Media (photos/videos/music/documents)
     # ------------------------------------------------------------------
+    def _list_media_dirs(
+        self,
+        src: DeviceInterface,
+        bulk_adb,
+        src_paths: List[str],
+        src_serial: str,
+    ) -> Dict[str, List[str]]:
+        """``{src_path: [file names]}`` for every source directory.
+
+        Android sources use one ``find -maxdepth 1 -type f`` over all
+        directories, skipping dotfiles like ``ls`` does (``.nomedia``,
+        ``.trashed-*``, ``.pending-*``); other platforms (or an empty
+        ``find`` result) fall back to ``list_dir`` per directory.
+        """
+        listing: Dict[str, List[str]] = {}
+        if bulk_adb is not None:
+            roots = {p.rstrip("/") or "/": p for p in src_paths}
+            out = bulk_adb.run_shell(
+                "find " + " ".join(_shell_quote(r) for r in roots)
+                + " -maxdepth 1 -type f ! -name '.*' 2>/dev/null",
+                src_serial, timeout=60,
+            )
+            for line in out.splitlines():
+                parent, _, name = line.rstrip("\r").rpartition("/")
+                src_path = roots.get(parent or "/")
+                if src_path is not None and name:
+                    listing.setdefault(src_path, []).append(name)
+            if listing:
+                return listing
+
+        for src_path in src_paths:
+            if self._cancel_flag.is_set():
+                break
+            try:
+                listing[src_path] = src.list_dir(src_path, src_serial)
+            except Exception:
+                listing[src_path] = []
+        return listing
+
     def _transfer_media(
         self,
         src: DeviceInterface,
@@ -389,52 +633,235 @@ class CrossPlatformTransferManager:
         total_pushed = 0
         errors = 0
 
-        for src_path in src_paths:
+        # Staged files travel through the pipeline as plain strings; a
+        # Path is only built for files that actually need conversion.
+        # Android sources list and pull through ADBCore directly
+        from .adb_core import ADBCore
+        bulk_adb = src.adb if isinstance(getattr(src, "adb", None), ADBCore) else None
+        # Non-ADB devices (iOS) share one lockdown client per device that is
+        # not thread-safe: their pulls / pushes stay strictly serial
+        pull_workers = self._pull_workers if bulk_adb is not None else 1
+        tgt_adb = tgt.adb if isinstance(getattr(tgt, "adb", None), ADBCore) else None
+        push_workers = self._push_workers if tgt_adb is not None else 1
+
+        entries_by_dir = self._list_media_dirs(src, bulk_adb, src_paths, src_serial)
+
+        # (entry name, remote path, local staging file)
+        jobs: List[Tuple[str, str, str]] = []
+        for idx, src_path in enumerate(src_paths):
             if self._cancel_flag.is_set():
                 break
 
-            # List files in source directory
-            try:
-                entries = src.list_dir(src_path, src_serial)
-            except Exception:
-                entries = []
+            entries = entries_by_dir.get(src_path)
+            if not entries:
+                continue
 
+            # One staging subdir per source dir: pulls run concurrently,
+            # so equal names from different dirs must not share a file
+            lane = media_staging / str(idx)
+            lane.mkdir(parents=True, exist_ok=True)
+            src_prefix = src_path + "/"
+            lane_prefix = str(lane) + os.sep
             for entry in entries:
-                if self._cancel_flag.is_set():
-                    break
-
-                remote_file = f"{src_path}/{entry}"
                 # Sanitize the filename for local storage (Windows compat)
-                safe_entry = _sanitize_filename(entry)
-                local_file = media_staging / safe_entry
-
-                self._progress.current_item = entry
-                self._emit()
-
-                # Pull from source
-                if src.pull(remote_file, _long_path_str(local_file), src_serial):
-                    total_pulled += 1
-
-                    # Convert if needed (HEIC → JPEG for Android targets)
-                    if config.convert_heic:
-                        local_file = PhotoConverter.convert_if_needed(
-                            local_file, tgt_platform, media_staging
-                        )
-
-                    # Push to target
-                    target_remote = f"{target_base}/{local_file.name}"
-                    if tgt.push(str(local_file), target_remote, tgt_serial):
-                        total_pushed += 1
-                    else:
-                        errors += 1
+                jobs.append((entry, src_prefix + entry, lane_prefix + _sanitize_filename(entry)))
 
-                    # Cleanup staging
-                    try:
-                        local_file.unlink(missing_ok=True)
-                    except Exception:
-                        pass
+        tgt_prefix = target_base + "/"
+
+        # Android sources pull a batch of files over one sync session
+        pull_batch = _MEDIA_PULL_BATCH if bulk_adb is not None else 1
+
+        delivered = self._load_delivered(src_serial, tgt_serial)
+
+        def _stat(batch: List[Tuple[str, str, str]]) -> Dict[str, Tuple[int, float]]:
+            """``{remote: (size, mtime)}`` for *batch* (one shell on Android)."""
+            if bulk_adb is None:
+                stats = {job[1]: src.stat_file(job[1], src_serial) for job in batch}
+                return {r: st for r, st in stats.items() if st[0] or st[1]}
+            out = bulk_adb.run_shell(
+                "stat -c '%s %Y %n' -- "
+                + " ".join(_shell_quote(job[1]) for job in batch)
+                + " 2>/dev/null",
+                src_serial,
+            )
+            stats = {}
+            for line in out.splitlines():
+                parts = line.rstrip("\r").split(" ", 2)
+                if len(parts) == 3 and parts[0].isdigit() and parts[1].isdigit():
+                    stats[parts[2]] = (int(parts[0]), float(parts[1]))
+            return stats
+
+        def _tgt_sizes(paths: List[str]) -> Dict[str, int]:
+            """``{target path: size}`` for the *paths* present on the target."""
+            if not paths:
+                return {}
+            if tgt_adb is None:
+                sizes = {p: tgt.stat_file(p, tgt_serial)[0] for p in paths}
+                return {p: sz for p, sz in sizes.items() if sz}
+            out = tgt_adb.run_shell(
+                "stat -c '%s %n' -- "
+                + " ".join(_shell_quote(p) for p in paths)
+                + " 2>/dev/null",
+                tgt_serial,
+            )
+            sizes = {}
+            for line in out.splitlines():
+                size, _, path = line.rstrip("\r").partition(" ")
+                if size.isdigit() and path:
+                    sizes[path] = int(size)
+            return sizes
+
+        def _pull(batch: List[Tuple[str, str, str]]):
+            """Pull *batch*; return (arrived jobs, skipped jobs, source stats).
+
+            Files whose size/mtime match an earlier delivery to this
+            target are skipped without pulling, as long as the delivered
+            copy is still on the target with the size it was pushed with.
+            """
+            # The cache is only an optimization: if a lookup fails, pull
+            # the whole batch
+            try:
+                stats = _stat(batch)
+            except Exception as exc:
+                log.debug("Source stat of %d file(s) failed: %s", len(batch), exc)
+                stats = {}
+            cached = {}
+            for job in batch:
+                st = stats.get(job[1])
+                prev = delivered.get(job[1])
+                if st is not None and prev is not None and prev[:2] == st:
+                    cached[job[1]] = prev
+            try:
+                present = _tgt_sizes([prev[2] for prev in cached.values()])
+            except Exception as exc:
+                log.debug("Target stat of %d file(s) failed: %s", len(cached), exc)
+                present = {}
+            wanted: List[Tuple[str, str, str]] = []
+            skipped: List[Tuple[str, str, str]] = []
+            for job in batch:
+                prev = cached.get(job[1])
+                if prev is not None and present.get(prev[2]) == prev[3]:
+                    skipped.append(job)
                 else:
-                    errors += 1
+                    wanted.append(job)
+            # (remote, long-path-safe local) computed once per file
+            pairs = [(remote, _long_path_str(local)) for _, remote, local in wanted]
+            if bulk_adb is None:
+                arrived = [
+                    job for job, (remote, local) in zip(wanted, pairs)
+                    if src.pull(remote, local, src_serial)
+                ]
+                return arrived, skipped, stats
+            failed = set(bulk_adb.pull_many(
+                pairs, src_serial, should_stop=self._cancel_flag.is_set,
+            ))
+            # A cancelled pull_many reports nothing as failed — trust the disk
+            arrived = [
+                job for job, pair in zip(wanted, pairs)
+                if pair not in failed and os.path.exists(pair[1])
+            ]
+            return arrived, skipped, stats
+
+        def _push(local_file: str) -> bool:
+            return tgt.push(local_file, tgt_prefix + os.path.basename(local_file), tgt_serial)
+
+        def _discard(pulled: str, handled: str):
+            """Remove a job's staged file, its converted copy and conv dir."""
+            for f in {pulled, handled}:
+                try:
+                    os.remove(f)
+                except OSError:
+                    pass
+            try:
+                os.rmdir(pulled + _CONVERT_DIR_SUFFIX)
+            except OSError:
+                pass
+
+        # Pull → convert → push pipeline: each file moves on to the next
+        # stage as soon as it is ready, so the device links and the CPU
+        # (HEIC decoding, on worker processes) work at the same time.  All bookkeeping and
+        # progress updates happen on this thread.
+        # future → (stage, entry, pulled file, file handled by the stage);
+        # pull futures carry their whole batch instead
+        stages: Dict[Future, tuple] = {}
+        # pulled file → (remote, size, mtime), recorded once the push lands
+        pending_rows: Dict[str, Tuple[str, int, float]] = {}
+        new_rows: List[Tuple[str, int, float, str, int]] = []
+        with ThreadPoolExecutor(max_workers=pull_workers) as pull_pool, \
+                ThreadPoolExecutor(max_workers=push_workers) as push_pool:
+            for i in range(0, len(jobs), pull_batch):
+                batch = jobs[i: i + pull_batch]
+                stages[pull_pool.submit(_pull, batch)] = ("pull", batch)
+
+            while stages:
+                done, _ = wait(stages, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    info = stages.pop(fut)
+                    if info[0] == "pull":
+                        batch = info[1]
+                        try:
+                            arrived, skipped, stats = fut.result()
+                        except Exception as exc:
+                            log.debug("Media pull of %d file(s) failed: %s", len(batch), exc)
+                            arrived, skipped, stats = [], [], {}
+                        errors += len(batch) - len(arrived) - len(skipped)
+                        total_pushed += len(skipped)
+                        for entry, remote, pulled in arrived:
+                            total_pulled += 1
+                            if remote in stats:
+                                pending_rows[pulled] = (remote, *stats[remote])
+                            if config.convert_heic and PhotoConverter.needs_conversion(
+                                entry, tgt_platform
+                            ):
+                                nxt = self._get_convert_pool().submit(
+                                    _convert_media, pulled, tgt_platform
+                                )
+                                stages[nxt] = ("convert", entry, pulled, pulled)
+                            else:
+                                nxt = push_pool.submit(_push, pulled)
+                                stages[nxt] = ("push", entry, pulled, pulled)
+                        if arrived:
+                            self._progress.current_item = arrived[-1][0]
+                            self._emit_throttled()
+                        continue
+
+                    stage, entry, pulled, local_file = info
+                    try:
+                        result = fut.result()
+                    except Exception as exc:
+                        log.debug("Media %s of %s failed: %s", stage, entry, exc)
+                        result = None
+
+                    if stage == "convert":
+                        converted = result or pulled
+                        nxt = push_pool.submit(_push, converted)
+                        stages[nxt] = ("push", entry, pulled, converted)
+                    else:
+                        if result:
+                            total_pushed += 1
+                            if pulled in pending_rows:
+                                try:
+                                    pushed_size = os.path.getsize(local_file)
+                                except OSError:
+                                    pushed_size = -1
+                                new_rows.append((
+                                    *pending_rows.pop(pulled),
+                                    tgt_prefix + os.path.basename(local_file),
+                                    pushed_size,
+                                ))
+                        else:
+                            errors += 1
+                        # Cleanup staging (original and converted copy)
+                        _discard(pulled, local_file)
+
+                if self._cancel_flag.is_set():
+                    # Drop work that has not started; running stages finish
+                    for fut in [f for f in stages if f.cancel()]:
+                        info = stages.pop(fut)
+                        if info[0] != "pull":
+                            _discard(info[2], info[3])
+
+        self._store_delivered(src_serial, tgt_serial, new_rows)
 
         log.info(
             "Media '%s': pulled=%d pushed=%d errors=%d",
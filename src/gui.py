@@ -132,6 +132,8 @@ class ADBToolkitApp(ctk.CTk):
                 log.warning("Could not initialize iOS support: %s", exc)
         self.cross_transfer_mgr = CrossPlatformTransferManager(
             self.device_mgr, adb.base_dir / "transfers",
+            pull_workers=self.config.get("acceleration.max_pull_workers", 0),
+            push_workers=self.config.get("acceleration.max_push_workers", 0),
         )
 
         self.devices: Dict[str, DeviceInfo] = {}
@@ -5605,6 +5607,25 @@ class ADBToolkitApp(ctk.CTk):
             pkg for pkg, v in self.unsynced_app_vars.items() if v.get()
         ]
 
+        def _resume_unsynced_id():
+            """Ask (on the UI thread) whether to resume an interrupted run."""
+            backup_id = self.backup_mgr.find_resumable_unsynced(serial)
+            if not backup_id:
+                return None
+            answer = {}
+            asked = threading.Event()
+
+            def _ask():
+                answer["resume"] = messagebox.askyesno(
+                    t("backup.resume_title"),
+                    t("backup.resume_msg", backup_id=backup_id),
+                )
+                asked.set()
+
+            self.after(0, _ask)
+            asked.wait()
+            return backup_id if answer.get("resume") else None
+
         def _run():
             try:
                 self.backup_mgr.set_progress_callback(self._on_backup_progress)
@@ -5623,6 +5644,7 @@ class ADBToolkitApp(ctk.CTk):
                     if selected_unsynced_pkgs:
                         self.backup_mgr.backup_unsynced_apps(
                             serial, packages=selected_unsynced_pkgs,
+                            resume_backup_id=_resume_unsynced_id(),
                         )
                     if not custom_paths and not selected_msg_keys and not selected_unsynced_pkgs:
                         self.after(0, lambda: messagebox.showwarning(
@@ -5656,6 +5678,7 @@ class ADBToolkitApp(ctk.CTk):
                     if selected_unsynced_pkgs:
                         self.backup_mgr.backup_unsynced_apps(
                             serial, packages=selected_unsynced_pkgs,
+                            resume_backup_id=_resume_unsynced_id(),
                         )
 
                     # Custom tree paths (even in selective mode)
@@ -7242,6 +7265,10 @@ class ADBToolkitApp(ctk.CTk):
             self.adb.stop_device_monitor()
         except Exception:
             pass
+        try:
+            self.config.flush()
+        except Exception:
+            pass
         try:
             self.destroy()
         except Exception:
@@ -692,6 +692,10 @@ class RestoreManager(ADBManagerBase):
           1. Install APK (if present)
           2. Push data back to /sdcard/Android/data|media/<pkg>
           3. Attempt ADB restore from .ab file (if present)
+
+        The combined ``all_data.ab`` (one archive for every backed-up app)
+        is restored only when *packages* covers all of its apps, and its
+        outcome counts towards the return value.
         """
         self._begin_operation()
         unsynced_dir = self.backup_dir / backup_id / "unsynced"
@@ -790,9 +794,58 @@ class RestoreManager(ADBManagerBase):
             if ok:
                 success_count += 1
 
+        # 4. Combined .ab written by a single ``adb backup`` of all packages.
+        #    ``adb restore`` cannot select apps inside it: only restore it
+        #    when every package in the archive was asked for.
+        combined_ok = True
+        combined_ab = unsynced_dir / "all_data.ab"
+        if (
+            not self._cancel_flag.is_set()
+            and combined_ab.exists()
+            and combined_ab.stat().st_size > 24
+        ):
+            manifest = self.get_backup_manifest(backup_id)
+            archived = (
+                manifest.unsynced_packages if manifest and manifest.unsynced_packages
+                else [d.name for d in unsynced_dir.iterdir() if d.is_dir()]
+            )
+            _device = self.adb.get_device_details(serial)
+            if packages and not set(archived) <= set(packages):
+                log.warning(
+                    "Combined .ab restore skipped: it holds %d app(s), %d selected",
+                    len(archived), len(set(packages) & set(archived)),
+                )
+                self._errors.append(
+                    "Dados internos (.ab) não restaurados: o arquivo combinado "
+                    "contém apps não selecionados"
+                )
+                combined_ok = False
+            elif self._is_legacy_adb_backup_supported(_device):
+                try:
+                    result = self._run_with_confirmation(
+                        ["restore", str(combined_ab)],
+                        serial,
+                        title="Restauração de Dados dos Apps",
+                        message=(
+                            f"📱 Confirme a restauração de dados no dispositivo.\n\n"
+                            f"Apps: {len(archived)}\n"
+                            f"Toque em 'RESTAURAR MEUS DADOS' na tela do aparelho."
+                        ),
+                        timeout=120 * max(len(archived), 1),
+                    )
+                    combined_ok = result.returncode == 0
+                except Exception as exc:
+                    log.warning("Combined ADB restore failed: %s", exc)
+                    combined_ok = False
+            else:
+                log.debug("Skipping combined .ab restore — SDK %s", _device.sdk_version)
+
         self._emit(BackupProgress(phase="complete", percent=100))
-        log.info("Unsynced apps restore: %d/%d packages", success_count, total)
-        return success_count == total
+        log.info(
+            "Unsynced apps restore: %d/%d packages%s", success_count, total,
+            "" if combined_ok else " (combined app data not restored)",
+        )
+        return success_count == total and combined_ok
 
     # ------------------------------------------------------------------
     # Smart Restore (auto-detect backup type)